@@ -0,0 +1,47 @@
+"""Covering unique index on email_preferences.unsubscribe_token
+
+Revision ID: b7d3f1a9c2e4
+Revises: 6e29929e24cf
+Create Date: 2026-10-16 14:05:12.318004
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d3f1a9c2e4"
+down_revision: str | Sequence[str] | None = "6e29929e24cf"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_email_preferences_token_covering",
+        "email_preferences",
+        ["unsubscribe_token"],
+        unique=True,
+        postgresql_include=["weekly_digest_enabled", "email", "id"],
+        # init_db()'s create_all() already builds it on fresh databases
+        if_not_exists=True,
+    )
+    # Superseded by the covering index above
+    op.drop_index(
+        "ix_email_preferences_unsubscribe_token",
+        table_name="email_preferences",
+        if_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_email_preferences_unsubscribe_token",
+        "email_preferences",
+        ["unsubscribe_token"],
+        unique=True,
+    )
+    op.drop_index("ix_email_preferences_token_covering", table_name="email_preferences")
@@ -0,0 +1,38 @@
+"""Composite index on hint_sessions (parent_email, started_at)
+
+Revision ID: d4a8e2c6f1b3
+Revises: b7d3f1a9c2e4
+Create Date: 2026-10-16 14:26:40.512377
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a8e2c6f1b3"
+down_revision: str | Sequence[str] | None = "b7d3f1a9c2e4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_hint_sessions_parent_email_started_at",
+        "hint_sessions",
+        ["parent_email", "started_at"],
+        unique=False,
+        # init_db()'s create_all() already builds it on fresh databases
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_hint_sessions_parent_email_started_at",
+        table_name="hint_sessions",
+        if_exists=True,
+    )
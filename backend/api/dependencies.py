@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 
 from backend.database.engine import get_db
 from backend.models.session import HintSession
-from backend.services.rate_limiter import RateLimiter
+from backend.services.rate_limiter import BaseRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -103,12 +103,12 @@ def verify_api_key(x_api_key: str | None = Header(None, alias="X-API-Key")) -> s
     return x_api_key
 
 
-def check_rate_limit(rate_limiter: RateLimiter):
+def check_rate_limit(rate_limiter: BaseRateLimiter):
     """
     Create a dependency that checks rate limits for a client.
 
     Args:
-        rate_limiter: RateLimiter instance to use
+        rate_limiter: Rate limiter instance to use
 
     Returns:
         Dependency function that checks rate limits
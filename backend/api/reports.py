@@ -1,9 +1,11 @@
 """PDF report generation API endpoints."""
 
 import io
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.pdfgen import canvas
@@ -20,6 +22,20 @@ from backend.api.dependencies import verify_api_key, verify_session_access, chec
 
 router = APIRouter()
 
+# Size of each body chunk when streaming a rendered PDF
+PDF_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_pdf_chunks(buffer: io.BytesIO) -> AsyncIterator[bytes]:
+    """Yield the rendered PDF in fixed-size chunks straight from the buffer.
+
+    Reads through a memoryview, so the full document is never copied into a
+    second bytes object, and closes the buffer once the last chunk is sent.
+    """
+    with buffer, buffer.getbuffer() as view:
+        for start in range(0, len(view), PDF_CHUNK_SIZE):
+            yield bytes(view[start : start + PDF_CHUNK_SIZE])
+
 
 @router.get(
     "/session/{session_id}/pdf",
@@ -33,7 +49,7 @@ def get_session_pdf_report(
     hint_session: HintSession = Depends(verify_session_access),
     db: Session = Depends(get_db),
     _rate_limit: None = Depends(check_rate_limit(get_reports_rate_limiter())),
-) -> Response:
+) -> StreamingResponse:
     """Generate and download a PDF report for a session.
 
     Requires X-Session-Access-Token header.
@@ -44,7 +60,7 @@ def get_session_pdf_report(
         db: Database session
 
     Returns:
-        PDF file as binary response
+        PDF file streamed in PDF_CHUNK_SIZE chunks
 
     Raises:
         HTTPException: If session not found or token invalid
@@ -232,14 +248,14 @@ def get_session_pdf_report(
     p.showPage()
     p.save()
 
-    # Get PDF bytes
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-
-    return Response(
-        content=pdf_bytes,
+    # Stream the rendered bytes; the size is known, so clients still get a length
+    return StreamingResponse(
+        _iter_pdf_chunks(buffer),
         media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename=stepwise_session_{session_id}.pdf"},
+        headers={
+            "Content-Disposition": f"attachment; filename=stepwise_session_{session_id}.pdf",
+            "Content-Length": str(buffer.getbuffer().nbytes),
+        },
     )
 
 
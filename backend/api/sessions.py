@@ -138,8 +138,11 @@ async def start_session(
 
     # Log events
     event_logger = EventLogger()
-    event_logger.log_event(db, session_id, "session_started", {"problem_type": problem_type.value})
-    event_logger.log_event(db, session_id, "concept_hint_given", {"sequence": 1})
+    with event_logger.defer_events(db):
+        event_logger.log_event(
+            db, session_id, "session_started", {"problem_type": problem_type.value}
+        )
+        event_logger.log_event(db, session_id, "concept_hint_given", {"sequence": 1})
 
     db.commit()
 
@@ -277,7 +280,7 @@ async def respond_to_hint(
         layer=hint_session.current_layer,
         char_count=eval_result.char_count,
         understanding_level=eval_result.understanding_level,
-        keywords_matched=eval_result.keywords_matched,
+        keywords_matched=list(eval_result.keywords_matched),
     )
     db.add(student_response)
 
@@ -334,29 +337,31 @@ async def respond_to_hint(
 
     # Log events
     event_logger = EventLogger()
+    with event_logger.defer_events(db):
+        # Log hint given event
+        if transition.new_layer == HintLayer.STRATEGY or (
+            transition.should_advance and previous_layer_enum == HintLayer.CONCEPT
+        ):
+            event_logger.log_event(
+                db, session_id, "strategy_hint_given", {"sequence": new_hint.sequence}
+            )
+        elif transition.new_layer == HintLayer.STEP or (
+            transition.should_advance and previous_layer_enum == HintLayer.STRATEGY
+        ):
+            event_logger.log_event(
+                db, session_id, "step_hint_given", {"sequence": new_hint.sequence}
+            )
+        elif previous_layer_enum == HintLayer.CONCEPT and not transition.should_advance:
+            event_logger.log_event(
+                db, session_id, "concept_hint_given", {"sequence": new_hint.sequence}
+            )
 
-    # Log hint given event
-    if transition.new_layer == HintLayer.STRATEGY or (
-        transition.should_advance and previous_layer_enum == HintLayer.CONCEPT
-    ):
-        event_logger.log_event(
-            db, session_id, "strategy_hint_given", {"sequence": new_hint.sequence}
-        )
-    elif transition.new_layer == HintLayer.STEP or (
-        transition.should_advance and previous_layer_enum == HintLayer.STRATEGY
-    ):
-        event_logger.log_event(db, session_id, "step_hint_given", {"sequence": new_hint.sequence})
-    elif previous_layer_enum == HintLayer.CONCEPT and not transition.should_advance:
-        event_logger.log_event(
-            db, session_id, "concept_hint_given", {"sequence": new_hint.sequence}
-        )
-
-    # Log layer advancement events
-    if transition.should_advance:
-        if transition.new_layer == HintLayer.STRATEGY:
-            event_logger.log_event(db, session_id, "reached_strategy_layer", {})
-        elif transition.new_layer == HintLayer.STEP:
-            event_logger.log_event(db, session_id, "reached_step_layer", {})
+        # Log layer advancement events
+        if transition.should_advance:
+            if transition.new_layer == HintLayer.STRATEGY:
+                event_logger.log_event(db, session_id, "reached_strategy_layer", {})
+            elif transition.new_layer == HintLayer.STEP:
+                event_logger.log_event(db, session_id, "reached_step_layer", {})
 
     db.commit()
 
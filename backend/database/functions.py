@@ -0,0 +1,37 @@
+"""Portable SQL functions shared by the query services."""
+
+from typing import Any
+
+from sqlalchemy import Float
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class elapsed_seconds(FunctionElement[float]):
+    """Seconds between two timestamp columns, computed by the database.
+
+    Compiles to EXTRACT(EPOCH FROM end - start) on PostgreSQL and to a
+    julianday() difference on SQLite. NULL if either timestamp is NULL.
+    """
+
+    type = Float()
+    name = "elapsed_seconds"
+    inherit_cache = True
+
+
+@compiles(elapsed_seconds)
+def _compile_elapsed_seconds(element: elapsed_seconds, compiler: SQLCompiler, **kw: Any) -> str:
+    start, end = element.clauses
+    return f"EXTRACT(EPOCH FROM {compiler.process(end, **kw)} - {compiler.process(start, **kw)})"
+
+
+@compiles(elapsed_seconds, "sqlite")
+def _compile_elapsed_seconds_sqlite(
+    element: elapsed_seconds, compiler: SQLCompiler, **kw: Any
+) -> str:
+    start, end = element.clauses
+    return (
+        f"(julianday({compiler.process(end, **kw)}) - "
+        f"julianday({compiler.process(start, **kw)})) * 86400.0"
+    )
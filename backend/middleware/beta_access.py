@@ -1,5 +1,6 @@
 import logging
 import os
+import re
 from typing import Callable
 
 from fastapi import Request, Response
@@ -29,6 +30,15 @@ EXCLUDED_PREFIXES = (
     "/api/v1/feedback",
 )
 
+# Exact paths and prefixes compiled into one pattern so each request is a
+# single regex match instead of a set lookup plus a Python loop over prefixes.
+_EXCLUDED_PATH_RE = re.compile(
+    "(?:{exact})\\Z|(?:{prefixes})".format(
+        exact="|".join(re.escape(path) for path in sorted(EXCLUDED_PATHS)),
+        prefixes="|".join(re.escape(prefix) for prefix in EXCLUDED_PREFIXES),
+    )
+)
+
 
 class BetaAccessMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: ASGIApp, beta_code: str | None = None) -> None:
@@ -76,9 +86,4 @@ class BetaAccessMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
     def _is_excluded_path(self, path: str) -> bool:
-        if path in EXCLUDED_PATHS:
-            return True
-        for prefix in EXCLUDED_PREFIXES:
-            if path.startswith(prefix):
-                return True
-        return False
+        return _EXCLUDED_PATH_RE.match(path) is not None
@@ -1,7 +1,7 @@
 """Email preference model for managing email subscription preferences."""
 
 import uuid
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, Index
 
 from backend.models.base import BaseModel, utc_now
 
@@ -14,9 +14,20 @@ class EmailPreference(BaseModel):
     email = Column(String(255), nullable=False, unique=True, index=True)
     session_reports_enabled = Column(Boolean, nullable=False, default=True)
     weekly_digest_enabled = Column(Boolean, nullable=False, default=True)
-    unsubscribe_token = Column(String(36), nullable=False, unique=True, index=True)
+    unsubscribe_token = Column(String(36), nullable=False)
     updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False)
 
+    __table_args__ = (
+        # Unique covering index: token-keyed reads (unsubscribe links) are index-only
+        # scans on PostgreSQL. INCLUDE is ignored on SQLite.
+        Index(
+            "ix_email_preferences_token_covering",
+            "unsubscribe_token",
+            unique=True,
+            postgresql_include=["weekly_digest_enabled", "email", "id"],
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<EmailPreference(email='{self.email}', session_reports={self.session_reports_enabled}, weekly_digest={self.weekly_digest_enabled})>"
 
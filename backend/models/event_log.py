@@ -1,7 +1,10 @@
 """Event log model for tracking learning signals."""
 
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from typing import Any
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, insert
 from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy.orm import Session
 
 from backend.models.base import BaseModel, utc_now
 
@@ -26,3 +29,13 @@ class EventLog(BaseModel):
     event_type = Column(String(50), nullable=False)
     event_timestamp = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     details = Column(JSON, nullable=True)
+
+    @classmethod
+    def bulk_log(cls, db: Session, events: list[dict[str, Any]]) -> None:
+        """Insert many events in a single executemany.
+
+        Each dict holds column values, e.g. session_id, event_type and details;
+        id and timestamps fall back to their column defaults.
+        """
+        if events:
+            db.execute(insert(cls), events)
@@ -1,7 +1,16 @@
 from datetime import datetime, timezone
-import uuid
-
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Enum as SQLEnum
+import secrets
+
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Enum as SQLEnum,
+)
 from sqlalchemy.orm import relationship
 
 from backend.models.base import BaseModel, utc_now
@@ -26,10 +35,19 @@ class HintSession(BaseModel):
 
     problem = relationship("Problem", backref="sessions")
 
+    __table_args__ = (
+        # Weekly digest: equality on parent_email, range on started_at
+        Index("ix_hint_sessions_parent_email_started_at", "parent_email", "started_at"),
+    )
+
     def touch(self) -> None:
         self.last_active_at = datetime.now(timezone.utc)
 
     @staticmethod
     def generate_access_token() -> str:
-        """Generate a secure session access token."""
-        return str(uuid.uuid4())
+        """Generate a secure session access token.
+
+        27 random bytes encode to exactly 36 URL-safe characters, matching the
+        session_access_token column width.
+        """
+        return secrets.token_urlsafe(27)
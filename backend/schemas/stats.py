@@ -27,6 +27,7 @@ class SessionListItem(BaseModel):
     used_full_solution: bool
     started_at: datetime
     completed_at: Optional[datetime]
+    duration_seconds: Optional[float] = None
 
 
 class SessionListResponse(BaseModel):
@@ -12,13 +12,15 @@ Options:
 
 import sys
 import os
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from sqlalchemy.orm import Session
-from sqlalchemy import distinct
+from sqlalchemy import func
 
 from backend.database.engine import SessionLocal
 from backend.models.session import HintSession
@@ -33,11 +35,65 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+RECIPIENT_BATCH_SIZE = 1000
+SEND_WORKERS = 4
+
+
+def _iter_recipient_batches(
+    db: Session,
+    start_date: datetime,
+    end_date: datetime,
+    batch_size: int = RECIPIENT_BATCH_SIZE,
+) -> Iterator[dict[str, int]]:
+    """
+    Yield recipients with activity in the period, one keyset page at a time.
+
+    Each page is a single grouped query (parent_email -> session count) ordered
+    by email, so memory stays bounded by ``batch_size`` regardless of how many
+    parents are active. Keyset pages are used instead of a server-side cursor
+    because the send loop commits between pages, which would close the cursor.
+
+    Args:
+        db: Database session
+        start_date: Period start (inclusive)
+        end_date: Period end (inclusive)
+        batch_size: Maximum recipients per page
+
+    Yields:
+        Mapping of parent email to number of sessions in the period
+    """
+    last_email: str | None = None
+    while True:
+        query = db.query(HintSession.parent_email, func.count(HintSession.id)).filter(
+            HintSession.parent_email.isnot(None),
+            HintSession.started_at >= start_date,
+            HintSession.started_at <= end_date,
+        )
+        if last_email is not None:
+            query = query.filter(HintSession.parent_email > last_email)
+
+        rows = (
+            query.group_by(HintSession.parent_email)
+            .order_by(HintSession.parent_email)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return
+
+        yield dict(rows)
+
+        if len(rows) < batch_size:
+            return
+        last_email = rows[-1][0]
+
+
 def send_weekly_digests(
     db: Session | None = None,
     email_service: EmailService | None = None,
     days: int = 7,
     dry_run: bool = False,
+    max_workers: int = SEND_WORKERS,
 ) -> dict:
     """
     Send weekly digests to all parent emails.
@@ -47,6 +103,7 @@ def send_weekly_digests(
         email_service: Email service instance (optional, creates new if not provided)
         days: Number of days to look back
         dry_run: If True, preview without sending
+        max_workers: Number of threads dispatching emails to the provider
 
     Returns:
         Dictionary with summary statistics
@@ -67,52 +124,72 @@ def send_weekly_digests(
 
         logger.info(f"Generating weekly digests for period: {start_date} to {end_date}")
 
-        emails_with_sessions = (
-            db.query(distinct(HintSession.parent_email))
-            .filter(
-                HintSession.parent_email.isnot(None),
-                HintSession.started_at >= start_date,
-                HintSession.started_at <= end_date,
-            )
-            .all()
-        )
-
-        unique_emails = [email[0] for email in emails_with_sessions]
-        logger.info(f"Found {len(unique_emails)} unique parent emails with activity")
-
         sent_count = 0
         failed_count = 0
         skipped_count = 0
+        total_emails = 0
+
+        # Bind hot-loop callables once rather than resolving attributes per recipient
+        generate_digest = digest_generator.generate_weekly_digest
+        send_digest = email_service.send_weekly_digest
+
+        # Database work stays on this thread (Session is not thread-safe); only the
+        # provider round trips are fanned out, so network latency overlaps.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for session_counts in _iter_recipient_batches(db, start_date, end_date):
+                batch_emails = list(session_counts)
+                total_emails += len(batch_emails)
+
+                # Preload (and materialize missing) preferences per batch instead of
+                # querying per recipient inside the loop.
+                preferences = EmailPreferenceService.bulk_get_or_create(db, batch_emails)
+
+                pending: dict[Future[bool], str] = {}
+
+                for email in batch_emails:
+                    try:
+                        preference = preferences[email]
+
+                        # Check if weekly digest is enabled for this email
+                        if not preference.weekly_digest_enabled:
+                            logger.info(f"Skipping {email} - weekly digest disabled")
+                            skipped_count += 1
+                            continue
+
+                        digest_data = generate_digest(db, email, start_date, end_date)
+
+                        if not digest_data:
+                            logger.warning(f"No digest data generated for {email}")
+                            skipped_count += 1
+                            continue
+
+                        unsubscribe_token = preference.unsubscribe_token
+
+                        if dry_run:
+                            logger.info(f"[DRY RUN] Would send digest to {email}")
+                            logger.info(f"  - {session_counts[email]} sessions")
+                            logger.info(f"  - Performance: {digest_data['performance_level']}")
+                            sent_count += 1
+                        else:
+                            future = executor.submit(
+                                send_digest, email, digest_data, unsubscribe_token
+                            )
+                            pending[future] = email
+
+                    except Exception as e:
+                        logger.error(f"Error processing digest for {email}: {e}", exc_info=True)
+                        failed_count += 1
+
+                # Drain this batch before fetching the next so in-flight work stays bounded
+                for future in as_completed(pending):
+                    email = pending[future]
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        logger.error(f"Error sending digest to {email}: {e}", exc_info=True)
+                        failed_count += 1
+                        continue
 
-        for email in unique_emails:
-            try:
-                # Check if weekly digest is enabled for this email
-                if not EmailPreferenceService.is_weekly_digest_enabled(db, email):
-                    logger.info(f"Skipping {email} - weekly digest disabled")
-                    skipped_count += 1
-                    continue
-
-                digest_data = digest_generator.generate_weekly_digest(
-                    db, email, start_date, end_date
-                )
-
-                if not digest_data:
-                    logger.warning(f"No digest data generated for {email}")
-                    skipped_count += 1
-                    continue
-
-                # Get unsubscribe token for this email
-                unsubscribe_token = EmailPreferenceService.get_unsubscribe_token(db, email)
-
-                if dry_run:
-                    logger.info(f"[DRY RUN] Would send digest to {email}")
-                    logger.info(f"  - {digest_data['total_sessions']} sessions")
-                    logger.info(f"  - Performance: {digest_data['performance_level']}")
-                    sent_count += 1
-                else:
-                    success = email_service.send_weekly_digest(
-                        email, digest_data, unsubscribe_token
-                    )
                     if success:
                         logger.info(f"✅ Sent weekly digest to {email}")
                         sent_count += 1
@@ -120,12 +197,10 @@ def send_weekly_digests(
                         logger.error(f"❌ Failed to send digest to {email}")
                         failed_count += 1
 
-            except Exception as e:
-                logger.error(f"Error processing digest for {email}: {e}", exc_info=True)
-                failed_count += 1
+        logger.info(f"Found {total_emails} unique parent emails with activity")
 
         result = {
-            "total_emails": len(unique_emails),
+            "total_emails": total_emails,
             "sent": sent_count,
             "failed": failed_count,
             "skipped": skipped_count,
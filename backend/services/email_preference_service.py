@@ -1,12 +1,22 @@
 """Email preference management service."""
 
-from typing import Optional
+from typing import Any, Optional
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
 from backend.models.email_preference import EmailPreference
 
 
+def _dialect_insert(db: Session) -> Any:
+    """Return the dialect-specific ``insert`` construct supporting ON CONFLICT."""
+    if db.get_bind().dialect.name == "postgresql":
+        return pg_insert
+    return sqlite_insert
+
+
 class EmailPreferenceService:
     """Service for managing email subscription preferences."""
 
@@ -22,30 +32,61 @@ class EmailPreferenceService:
         Returns:
             EmailPreference instance
         """
-        # Try to find existing preference
-        preference = db.query(EmailPreference).filter(EmailPreference.email == email).first()
+        # Single round trip: INSERT ... ON CONFLICT (email) DO UPDATE ... RETURNING.
+        # The no-op update makes RETURNING yield the existing row on conflict.
+        stmt = (
+            _dialect_insert(db)(EmailPreference)
+            .values(
+                email=email,
+                weekly_digest_enabled=True,
+                unsubscribe_token=EmailPreference.generate_token(),
+            )
+            .on_conflict_do_update(index_elements=["email"], set_={"email": email})
+            .returning(EmailPreference)
+            .execution_options(populate_existing=True)
+        )
+        preference = db.execute(stmt).scalar_one()
+        db.commit()
 
-        if preference:
-            return preference
+        return preference
 
-        # Create new preference with unique token
-        token = EmailPreference.generate_token()
-        preference = EmailPreference(
-            email=email, weekly_digest_enabled=True, unsubscribe_token=token
-        )
+    @staticmethod
+    def bulk_get_or_create(db: Session, emails: list[str]) -> dict[str, EmailPreference]:
+        """
+        Get or create preferences for many emails in two statements.
 
-        db.add(preference)
-        try:
-            db.commit()
-            db.refresh(preference)
-        except IntegrityError:
-            # Handle race condition - another thread created it
-            db.rollback()
-            preference = db.query(EmailPreference).filter(EmailPreference.email == email).first()
-            if not preference:
-                raise
+        Missing rows are materialized with one INSERT ... ON CONFLICT DO NOTHING,
+        then all rows are fetched with one SELECT ... WHERE email IN (...).
 
-        return preference
+        Args:
+            db: Database session
+            emails: Email addresses
+
+        Returns:
+            Mapping of email address to EmailPreference instance
+        """
+        if not emails:
+            return {}
+
+        stmt = (
+            _dialect_insert(db)(EmailPreference)
+            .values(
+                [
+                    {
+                        "email": email,
+                        "weekly_digest_enabled": True,
+                        "unsubscribe_token": EmailPreference.generate_token(),
+                    }
+                    for email in emails
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["email"])
+        )
+        db.execute(stmt)
+        db.commit()
+
+        preferences = db.query(EmailPreference).filter(EmailPreference.email.in_(emails)).all()
+        return {preference.email: preference for preference in preferences}
 
     @staticmethod
     def get_preference_by_token(db: Session, token: str) -> Optional[EmailPreference]:
@@ -73,16 +114,7 @@ class EmailPreferenceService:
         Returns:
             True if successful, False if token not found
         """
-        preference = EmailPreferenceService.get_preference_by_token(db, token)
-
-        if not preference:
-            return False
-
-        preference.weekly_digest_enabled = False
-        db.commit()
-        db.refresh(preference)
-
-        return True
+        return EmailPreferenceService._update_by_token(db, token, weekly_digest_enabled=False)
 
     @staticmethod
     def is_weekly_digest_enabled(db: Session, email: str) -> bool:
@@ -96,13 +128,17 @@ class EmailPreferenceService:
         Returns:
             True if enabled (default for new emails), False if explicitly disabled
         """
-        preference = db.query(EmailPreference).filter(EmailPreference.email == email).first()
+        enabled = (
+            db.query(EmailPreference.weekly_digest_enabled)
+            .filter(EmailPreference.email == email)
+            .scalar()
+        )
 
         # If no preference exists, weekly digest is enabled by default
-        if not preference:
+        if enabled is None:
             return True
 
-        return preference.weekly_digest_enabled
+        return bool(enabled)
 
     @staticmethod
     def get_unsubscribe_token(db: Session, email: str) -> str:
@@ -116,6 +152,14 @@ class EmailPreferenceService:
         Returns:
             Unsubscribe token
         """
+        token = (
+            db.query(EmailPreference.unsubscribe_token)
+            .filter(EmailPreference.email == email)
+            .scalar()
+        )
+        if token is not None:
+            return str(token)
+
         preference = EmailPreferenceService.get_or_create_preference(db, email)
         return preference.unsubscribe_token
 
@@ -131,10 +175,10 @@ class EmailPreferenceService:
         Returns:
             True if enabled, True if no preference exists (default opt-in)
         """
-        preference = db.query(EmailPreference).filter_by(email=email).first()
-        if not preference:
+        enabled = db.query(EmailPreference.session_reports_enabled).filter_by(email=email).scalar()
+        if enabled is None:
             return True  # Default: enabled for new emails
-        return preference.session_reports_enabled
+        return bool(enabled)
 
     @staticmethod
     def mark_session_reports_unsubscribed(db: Session, token: str) -> bool:
@@ -148,14 +192,7 @@ class EmailPreferenceService:
         Returns:
             True if successful, False if token not found
         """
-        preference = EmailPreferenceService.get_preference_by_token(db, token)
-        if not preference:
-            return False
-
-        preference.session_reports_enabled = False
-        db.commit()
-
-        return True
+        return EmailPreferenceService._update_by_token(db, token, session_reports_enabled=False)
 
     @staticmethod
     def mark_all_unsubscribed(db: Session, token: str) -> bool:
@@ -169,12 +206,28 @@ class EmailPreferenceService:
         Returns:
             True if successful, False if token not found
         """
-        preference = EmailPreferenceService.get_preference_by_token(db, token)
-        if not preference:
-            return False
+        return EmailPreferenceService._update_by_token(
+            db, token, weekly_digest_enabled=False, session_reports_enabled=False
+        )
 
-        preference.weekly_digest_enabled = False
-        preference.session_reports_enabled = False
+    @staticmethod
+    def _update_by_token(db: Session, token: str, **values: bool) -> bool:
+        """
+        Apply flag updates with a single UPDATE ... WHERE unsubscribe_token = :token.
+
+        Args:
+            db: Database session
+            token: Unsubscribe token
+            **values: Column values to set
+
+        Returns:
+            True if a preference matched the token, False otherwise
+        """
+        result = db.execute(
+            update(EmailPreference)
+            .where(EmailPreference.unsubscribe_token == token)
+            .values(**values)
+        )
         db.commit()
 
-        return True
+        return bool(result.rowcount > 0)
@@ -9,6 +9,14 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Performance level accent colors shared by all email templates
+PERFORMANCE_COLORS = {
+    "Excellent": "#22c55e",
+    "Good": "#3b82f6",
+    "Needs Practice": "#f59e0b",
+}
+DEFAULT_PERFORMANCE_COLOR = "#6b7280"
+
 
 @dataclass
 class EmailMessage:
@@ -27,6 +35,8 @@ class EmailMessage:
 class BaseEmailProvider(ABC):
     """Base interface for email providers."""
 
+    __slots__ = ()
+
     @abstractmethod
     def send_email(self, message: EmailMessage) -> bool:
         """
@@ -44,6 +54,8 @@ class BaseEmailProvider(ABC):
 class ConsoleEmailProvider(BaseEmailProvider):
     """Console email provider for development/testing."""
 
+    __slots__ = ()
+
     def send_email(self, message: EmailMessage) -> bool:
         """
         Log email to console instead of sending.
@@ -599,18 +611,12 @@ class EmailService:
         insights = summary.get("insights", [])
         recommendation = summary.get("recommendation", "")
 
-        # Performance level colors
-        perf_colors = {
-            "Excellent": "#22c55e",
-            "Good": "#3b82f6",
-            "Needs Practice": "#f59e0b",
-        }
-        perf_color = perf_colors.get(performance, "#6b7280")
+        perf_color = PERFORMANCE_COLORS.get(performance, DEFAULT_PERFORMANCE_COLOR)
 
         # Build insights HTML
-        insights_html = ""
-        for insight in insights:
-            insights_html += f"<li style='margin-bottom: 8px;'>{insight}</li>\n"
+        insights_html = "".join(
+            f"<li style='margin-bottom: 8px;'>{insight}</li>\n" for insight in insights
+        )
 
         html = f"""
 <!DOCTYPE html>
@@ -673,16 +679,11 @@ class EmailService:
         performance = digest_data.get("performance_level", "Good")
         recommendations = digest_data.get("recommendations", [])
 
-        perf_colors = {
-            "Excellent": "#22c55e",
-            "Good": "#3b82f6",
-            "Needs Practice": "#f59e0b",
-        }
-        perf_color = perf_colors.get(performance, "#6b7280")
+        perf_color = PERFORMANCE_COLORS.get(performance, DEFAULT_PERFORMANCE_COLOR)
 
-        recommendations_html = ""
-        for rec in recommendations:
-            recommendations_html += f"<li style='margin-bottom: 8px;'>{rec}</li>\n"
+        recommendations_html = "".join(
+            f"<li style='margin-bottom: 8px;'>{rec}</li>\n" for rec in recommendations
+        )
 
         html = f"""
 <!DOCTYPE html>
@@ -1,5 +1,7 @@
 """Event logging service for tracking learning signals."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from sqlalchemy.orm import Session
@@ -10,13 +12,26 @@ from backend.models.event_log import EventLog
 class EventLogger:
     """Service for logging learning signal events."""
 
+    def __init__(self) -> None:
+        self._pending: list[dict[str, Any]] | None = None
+
+    @contextmanager
+    def defer_events(self, db: Session) -> Iterator[None]:
+        """Buffer events logged inside the block and insert them in one batch on exit."""
+        self._pending = []
+        try:
+            yield
+            EventLog.bulk_log(db, self._pending)
+        finally:
+            self._pending = None
+
     def log_event(
         self,
         db: Session,
         session_id: str | None,
         event_type: str,
         details: dict[str, Any] | None = None,
-    ) -> EventLog:
+    ) -> EventLog | None:
         """Log a learning signal event.
 
         Args:
@@ -26,8 +41,14 @@ class EventLogger:
             details: Optional JSON details about the event
 
         Returns:
-            Created EventLog instance
+            Created EventLog instance, or None when deferred by defer_events()
         """
+        if self._pending is not None:
+            self._pending.append(
+                {"session_id": session_id, "event_type": event_type, "details": details}
+            )
+            return None
+
         event_log = EventLog(
             session_id=session_id,
             event_type=event_type,
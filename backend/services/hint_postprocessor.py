@@ -11,15 +11,15 @@ class PostProcessResult:
 
 class HintPostProcessor:
     ANSWER_PATTERNS = [
-        r"[xyzXYZ]\s*=\s*-?\d+",
-        r"等于\s*-?\d+",
-        r"答案[是为：:]\s*-?\d+",
-        r"结果[是为：:]\s*-?\d+",
+        re.compile(r"[xyzXYZ]\s*=\s*-?\d+"),
+        re.compile(r"等于\s*-?\d+"),
+        re.compile(r"答案[是为：:]\s*-?\d+"),
+        re.compile(r"结果[是为：:]\s*-?\d+"),
     ]
 
     STEP_REVEAL_PATTERNS = [
-        r"\d+[xyzXYZ]\s*=\s*-?\d+",
-        r"\d+\s*[+\-×÷*/]\s*\d+\s*=\s*-?\d+",
+        re.compile(r"\d+[xyzXYZ]\s*=\s*-?\d+"),
+        re.compile(r"\d+\s*[+\-×÷*/]\s*\d+\s*=\s*-?\d+"),
     ]
 
     NEGATIVE_WORDS = [
@@ -43,8 +43,8 @@ class HintPostProcessor:
             )
 
         for pattern in self.ANSWER_PATTERNS:
-            if re.search(pattern, hint_content):
-                filtered = re.sub(pattern, "[...]", hint_content)
+            if pattern.search(hint_content):
+                filtered = pattern.sub("[...]", hint_content)
                 return PostProcessResult(
                     content=filtered,
                     was_filtered=True,
@@ -60,8 +60,9 @@ class HintPostProcessor:
                     filter_reason="direct_answer_leak",
                 )
 
+        lowered = hint_content.lower()
         for word in self.NEGATIVE_WORDS:
-            if word in hint_content.lower():
+            if word in lowered:
                 return PostProcessResult(
                     content=hint_content,
                     was_filtered=True,
@@ -4,6 +4,7 @@ Classifies math problems into ProblemType categories using LLM with rule-based f
 """
 
 import re
+from collections import OrderedDict
 from typing import Any
 
 from backend.models.enums import ProblemType
@@ -15,6 +16,9 @@ class ProblemClassifier:
     Uses LLM classification when available, falls back to rule-based patterns.
     """
 
+    # Max LLM results memoized per classifier instance (LRU eviction)
+    CACHE_MAXSIZE = 4096
+
     def __init__(self, llm_client: Any | None = None) -> None:
         """Initialize classifier.
 
@@ -23,6 +27,11 @@ class ProblemClassifier:
                        If None, uses rule-based classification only.
         """
         self._llm_client = llm_client
+        self._cache: OrderedDict[str, ProblemType] = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Drop all memoized LLM classifications."""
+        self._cache.clear()
 
     def classify(self, problem_text: str) -> ProblemType:
         """Classify a math problem into a problem type.
@@ -33,12 +42,22 @@ class ProblemClassifier:
         Returns:
             The classified ProblemType.
         """
-        # 尝试 LLM 分类
+        # 尝试 LLM 分类 (相同题目只调用一次 LLM)
         if self._llm_client is not None:
+            # 以去除首尾空白的原文为键，OrderedDict 直接按字符串哈希
+            key = problem_text.strip()
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
             try:
                 llm_result = self._llm_client.classify(problem_text)
                 problem_type = self._parse_llm_result(llm_result)
                 if problem_type != ProblemType.UNKNOWN:
+                    self._cache[key] = problem_type
+                    if len(self._cache) > self.CACHE_MAXSIZE:
+                        self._cache.popitem(last=False)
                     return problem_type
             except Exception:
                 pass  # fallback 到规则分类
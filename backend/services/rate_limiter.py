@@ -1,10 +1,17 @@
-"""In-memory rate limiter service for API endpoints."""
+"""Rate limiter service for API endpoints (in-memory or Redis-backed)."""
 
+import logging
+import math
+import os
 import threading
 import time
-from collections import defaultdict, deque
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Dict, Deque
+from typing import Any
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -14,26 +21,89 @@ class RateLimitConfig:
     max_requests: int = 20  # Maximum requests
     window_seconds: int = 60  # Time window in seconds
 
+    @property
+    def capacity(self) -> float:
+        """Bucket size: the burst a client may spend at once."""
+        return float(self.max_requests)
+
+    @property
+    def refill_rate(self) -> float:
+        """Tokens restored per second."""
+        return self.max_requests / self.window_seconds
+
+
+class BaseRateLimiter(ABC):
+    """Base interface for rate limiter backends."""
+
+    config: RateLimitConfig
+
+    @abstractmethod
+    def is_allowed(self, client_id: str) -> bool:
+        """
+        Check and record a request from client_id.
+
+        Args:
+            client_id: Unique identifier for the client (IP address or session_id)
+
+        Returns:
+            True if request is allowed, False if rate limit exceeded
+        """
+
+    @abstractmethod
+    def get_remaining(self, client_id: str) -> int:
+        """Get remaining requests for client_id."""
+
+    @abstractmethod
+    def get_retry_after(self, client_id: str) -> int:
+        """Get seconds until client_id can make another request (0 if not limited)."""
+
+    @abstractmethod
+    def reset(self, client_id: str | None = None) -> None:
+        """Reset rate limit for a client, or for all clients when client_id is None."""
+
 
-class RateLimiter:
+class RateLimiter(BaseRateLimiter):
     """
-    In-memory sliding window rate limiter.
+    In-memory token-bucket rate limiter.
 
-    Tracks requests per client identifier (IP or session_id) within a time window.
+    Each client (IP or session_id) owns a bucket of max_requests tokens that
+    refills continuously at max_requests / window_seconds tokens per second.
+    Only (tokens, last_refill) is stored per client, so every check is O(1).
     Thread-safe using locks.
     """
 
-    def __init__(self, config: RateLimitConfig | None = None):
+    def __init__(
+        self,
+        config: RateLimitConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize rate limiter.
 
         Args:
             config: Rate limit configuration (defaults to 20 requests per 60 seconds)
+            clock: Monotonic time source in seconds (injectable for tests)
         """
         self.config = config or RateLimitConfig()
-        self._requests: Dict[str, Deque[float]] = defaultdict(deque)
+        self._clock = clock
+        # client_id -> [tokens, last_refill]; a list so it can be updated in place
+        self._buckets: dict[str, list[float]] = {}
         self._lock = threading.Lock()
 
+    def _refill(self, client_id: str) -> list[float]:
+        """Return the client's bucket topped up to now. Caller must hold the lock."""
+        now = self._clock()
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            bucket = self._buckets[client_id] = [self.config.capacity, now]
+            return bucket
+
+        elapsed = now - bucket[1]
+        if elapsed > 0:
+            bucket[0] = min(self.config.capacity, bucket[0] + elapsed * self.config.refill_rate)
+            bucket[1] = now
+        return bucket
+
     def is_allowed(self, client_id: str) -> bool:
         """
         Check if a request from client_id is allowed.
@@ -45,22 +115,11 @@ class RateLimiter:
             True if request is allowed, False if rate limit exceeded
         """
         with self._lock:
-            now = time.time()
-            window_start = now - self.config.window_seconds
-
-            # Get request timestamps for this client
-            requests = self._requests[client_id]
-
-            # Remove timestamps outside the current window
-            while requests and requests[0] < window_start:
-                requests.popleft()
-
-            # Check if client has exceeded limit
-            if len(requests) >= self.config.max_requests:
+            bucket = self._refill(client_id)
+            if bucket[0] < 1:
                 return False
 
-            # Record this request
-            requests.append(now)
+            bucket[0] -= 1
             return True
 
     def get_remaining(self, client_id: str) -> int:
@@ -71,19 +130,10 @@ class RateLimiter:
             client_id: Unique identifier for the client
 
         Returns:
-            Number of remaining requests in current window
+            Number of whole tokens currently left in the client's bucket
         """
         with self._lock:
-            now = time.time()
-            window_start = now - self.config.window_seconds
-
-            requests = self._requests[client_id]
-
-            # Remove old timestamps
-            while requests and requests[0] < window_start:
-                requests.popleft()
-
-            return max(0, self.config.max_requests - len(requests))
+            return int(self._refill(client_id)[0])
 
     def get_retry_after(self, client_id: str) -> int:
         """
@@ -93,26 +143,14 @@ class RateLimiter:
             client_id: Unique identifier for the client
 
         Returns:
-            Seconds until rate limit resets (0 if not rate limited)
+            Seconds until the next token is available (0 if not rate limited)
         """
         with self._lock:
-            now = time.time()
-            window_start = now - self.config.window_seconds
-
-            requests = self._requests[client_id]
-
-            # Remove old timestamps
-            while requests and requests[0] < window_start:
-                requests.popleft()
-
-            # If not rate limited, return 0
-            if len(requests) < self.config.max_requests:
+            tokens = self._refill(client_id)[0]
+            if tokens >= 1:
                 return 0
 
-            # Time until oldest request exits the window
-            oldest_request = requests[0]
-            retry_after = int(oldest_request + self.config.window_seconds - now) + 1
-            return max(0, retry_after)
+            return max(1, math.ceil((1 - tokens) / self.config.refill_rate))
 
     def reset(self, client_id: str | None = None) -> None:
         """
@@ -123,21 +161,197 @@ class RateLimiter:
         """
         with self._lock:
             if client_id is None:
-                self._requests.clear()
-            elif client_id in self._requests:
-                del self._requests[client_id]
+                self._buckets.clear()
+            else:
+                self._buckets.pop(client_id, None)
+
+
+# Rolling window: drop expired hits, count, and record this hit in one round trip.
+# KEYS[1] = zset of hit timestamps; ARGV = limit, window seconds, consume (0/1), member
+_SLIDING_WINDOW_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < limit then
+    if ARGV[3] == '1' then
+        redis.call('ZADD', KEYS[1], now, ARGV[4])
+        redis.call('EXPIRE', KEYS[1], math.ceil(window))
+        count = count + 1
+    end
+    return {1, count, 0}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, count, math.floor(tonumber(oldest[2]) + window - now) + 1}
+"""
+
+# Fixed window: INCR a counter that expires with the window.
+# KEYS[1] = counter; ARGV = limit, window seconds, consume (0/1)
+_FIXED_WINDOW_LUA = """
+local limit = tonumber(ARGV[1])
+local count = tonumber(redis.call('GET', KEYS[1]) or '0')
+if count < limit then
+    if ARGV[3] == '1' then
+        count = redis.call('INCR', KEYS[1])
+        if count == 1 then
+            redis.call('EXPIRE', KEYS[1], ARGV[2])
+        end
+    end
+    return {1, count, 0}
+end
+return {0, count, math.max(redis.call('TTL', KEYS[1]), 1)}
+"""
+
+
+class RedisRateLimiter(BaseRateLimiter):
+    """
+    Redis-backed rate limiter shared by every worker process.
+
+    Counting, cleanup and recording run inside a single Lua script, so each
+    check is one atomic EVALSHA round trip with no client-side locking.
+
+    Strategies:
+        - "sliding": rolling window over a sorted set of hit timestamps
+        - "fixed": INCR counter that expires every window_seconds
+
+    If Redis is unreachable the limiter fails open: the request is allowed and
+    a warning is logged, so an outage does not take the endpoints down with it.
+    """
+
+    STRATEGIES = {"sliding": _SLIDING_WINDOW_LUA, "fixed": _FIXED_WINDOW_LUA}
+    DEFAULT_STRATEGY = "sliding"
+
+    def __init__(
+        self,
+        config: RateLimitConfig | None = None,
+        redis_client: Any = None,
+        key_prefix: str = "ratelimit",
+        strategy: str = DEFAULT_STRATEGY,
+    ):
+        """
+        Initialize Redis rate limiter.
+
+        Args:
+            config: Rate limit configuration (defaults to 20 requests per 60 seconds)
+            redis_client: redis.Redis client instance
+            key_prefix: Prefix for the per-client keys
+            strategy: "sliding" or "fixed"
+        """
+        if redis_client is None:
+            raise ValueError("redis_client is required")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown rate limit strategy: {strategy}")
+
+        from redis import exceptions as redis_exceptions
+
+        self.config = config or RateLimitConfig()
+        self._redis = redis_client
+        self._unavailable_errors = (redis_exceptions.ConnectionError, redis_exceptions.TimeoutError)
+        self._key_prefix = key_prefix
+        self._strategy = strategy
+        # register_script issues EVALSHA and reloads the script on NOSCRIPT
+        self._script = redis_client.register_script(self.STRATEGIES[strategy])
+
+    def _key(self, client_id: str) -> str:
+        return f"{self._key_prefix}:{client_id}"
+
+    def _run(self, client_id: str, consume: bool) -> tuple[bool, int, int]:
+        """Run the strategy script and return (allowed, used, retry_after)."""
+        args: list[int | str] = [
+            self.config.max_requests,
+            self.config.window_seconds,
+            1 if consume else 0,
+        ]
+        if self._strategy == "sliding":
+            args.append(uuid.uuid4().hex)
+        try:
+            allowed, used, retry_after = self._script(keys=[self._key(client_id)], args=args)
+        except self._unavailable_errors as e:
+            logger.warning(f"Redis rate limiter unavailable, allowing request: {e}")
+            return True, 0, 0
+        return bool(allowed), int(used), int(retry_after)
+
+    def is_allowed(self, client_id: str) -> bool:
+        """Check and record a request from client_id in one round trip."""
+        return self._run(client_id, consume=True)[0]
+
+    def get_remaining(self, client_id: str) -> int:
+        """Get remaining requests for client_id in the current window."""
+        return max(0, self.config.max_requests - self._run(client_id, consume=False)[1])
+
+    def get_retry_after(self, client_id: str) -> int:
+        """Get seconds until client_id can make another request (0 if not limited)."""
+        return self._run(client_id, consume=False)[2]
+
+    def reset(self, client_id: str | None = None) -> None:
+        """Reset rate limit for a client or all clients under this key prefix."""
+        if client_id is not None:
+            self._redis.delete(self._key(client_id))
+            return
+
+        keys = list(self._redis.scan_iter(match=f"{self._key_prefix}:*"))
+        if keys:
+            self._redis.delete(*keys)
+
+
+def create_rate_limiter(config: RateLimitConfig, name: str) -> BaseRateLimiter:
+    """
+    Create a rate limiter for one endpoint group.
+
+    Uses Redis when RATE_LIMIT_REDIS_URL is set so limits hold across worker
+    processes; otherwise falls back to the in-memory limiter.
+
+    Args:
+        config: Rate limit configuration
+        name: Endpoint group name, used in the Redis key prefix
+
+    Returns:
+        Configured rate limiter
+    """
+    redis_url = os.getenv("RATE_LIMIT_REDIS_URL")
+    if not redis_url:
+        return RateLimiter(config)
+
+    try:
+        # Import redis here to make it optional
+        import redis
+    except ImportError:
+        logger.error(
+            "RATE_LIMIT_REDIS_URL is set but the redis library is not installed. "
+            "Install with: pip install redis. Falling back to in-memory rate limiting."
+        )
+        return RateLimiter(config)
+
+    strategy = os.getenv("RATE_LIMIT_STRATEGY", RedisRateLimiter.DEFAULT_STRATEGY).lower()
+    if strategy not in RedisRateLimiter.STRATEGIES:
+        logger.error(
+            f"Unknown RATE_LIMIT_STRATEGY '{strategy}'. "
+            f"Falling back to '{RedisRateLimiter.DEFAULT_STRATEGY}'."
+        )
+        strategy = RedisRateLimiter.DEFAULT_STRATEGY
+
+    return RedisRateLimiter(
+        config,
+        redis.Redis.from_url(redis_url),
+        key_prefix=f"ratelimit:{name}",
+        strategy=strategy,
+    )
 
 
 # Global rate limiter instances
-_stats_limiter = RateLimiter(RateLimitConfig(max_requests=20, window_seconds=60))
-_reports_limiter = RateLimiter(RateLimitConfig(max_requests=20, window_seconds=60))
+_stats_limiter = create_rate_limiter(RateLimitConfig(max_requests=20, window_seconds=60), "stats")
+_reports_limiter = create_rate_limiter(
+    RateLimitConfig(max_requests=20, window_seconds=60), "reports"
+)
 
 
-def get_stats_rate_limiter() -> RateLimiter:
+def get_stats_rate_limiter() -> BaseRateLimiter:
     """Get the global stats rate limiter instance."""
     return _stats_limiter
 
 
-def get_reports_rate_limiter() -> RateLimiter:
+def get_reports_rate_limiter() -> BaseRateLimiter:
     """Get the global reports rate limiter instance."""
     return _reports_limiter
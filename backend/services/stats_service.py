@@ -2,8 +2,9 @@
 
 from datetime import datetime, timezone, timedelta
 from sqlalchemy import func, distinct, case
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
+from backend.database.functions import elapsed_seconds
 from backend.models.enums import HintLayer, SessionStatus, ProblemType
 from backend.models.session import HintSession
 from backend.models.problem import Problem
@@ -29,14 +30,49 @@ PROBLEM_TYPE_LABELS = {
 }
 
 
+# Hint layer depth used for "layers to complete" averages
+_LAYER_NUMBERS = {
+    HintLayer.CONCEPT: 1,
+    HintLayer.STRATEGY: 2,
+    HintLayer.STEP: 3,
+    HintLayer.COMPLETED: 4,
+    HintLayer.REVEALED: 4,
+}
+
+_FINISHED_STATUSES = (SessionStatus.COMPLETED, SessionStatus.REVEALED)
+
+
+# Layer depth of finished sessions only; NULL otherwise so AVG skips them
+_FINISHED_LAYER_NUMBER = case(
+    (
+        HintSession.status.in_(_FINISHED_STATUSES),
+        case(
+            *((HintSession.current_layer == layer, n) for layer, n in _LAYER_NUMBERS.items()),
+            else_=0,
+        ),
+    ),
+    else_=None,
+)
+
+
+# NULL while the session is still active
+_SESSION_DURATION_SECONDS = elapsed_seconds(HintSession.started_at, HintSession.completed_at)
+
+
 class StatsService:
     def __init__(self, db: Session) -> None:
         self._db = db
 
     def get_summary(self) -> StatsSummary:
-        total = self._db.query(HintSession).count()
-
-        if total == 0:
+        total, completed, revealed, active, avg_layers = self._db.query(
+            func.count(HintSession.id),
+            func.sum(case((HintSession.status == SessionStatus.COMPLETED, 1), else_=0)),
+            func.sum(case((HintSession.status == SessionStatus.REVEALED, 1), else_=0)),
+            func.sum(case((HintSession.status == SessionStatus.ACTIVE, 1), else_=0)),
+            func.avg(_FINISHED_LAYER_NUMBER),
+        ).one()
+
+        if not total:
             return StatsSummary(
                 total_sessions=0,
                 completed_sessions=0,
@@ -46,36 +82,23 @@ class StatsService:
                 avg_layers_to_complete=None,
             )
 
-        completed = (
-            self._db.query(HintSession)
-            .filter(HintSession.status == SessionStatus.COMPLETED)
-            .count()
-        )
-
-        revealed = (
-            self._db.query(HintSession).filter(HintSession.status == SessionStatus.REVEALED).count()
-        )
-
-        active = (
-            self._db.query(HintSession).filter(HintSession.status == SessionStatus.ACTIVE).count()
-        )
-
+        completed = completed or 0
+        revealed = revealed or 0
         completion_rate = ((completed + revealed) / total) * 100
 
-        avg_layers = self._calculate_avg_layers()
-
         return StatsSummary(
             total_sessions=total,
             completed_sessions=completed,
             revealed_sessions=revealed,
-            active_sessions=active,
+            active_sessions=active or 0,
             completion_rate=round(completion_rate, 1),
-            avg_layers_to_complete=avg_layers,
+            avg_layers_to_complete=None if avg_layers is None else round(float(avg_layers), 1),
         )
 
     def list_sessions(self, limit: int = 20, offset: int = 0) -> list[SessionListItem]:
-        sessions = (
-            self._db.query(HintSession)
+        rows = (
+            self._db.query(HintSession, _SESSION_DURATION_SECONDS)
+            .options(selectinload(HintSession.problem))
             .order_by(HintSession.started_at.desc())
             .limit(limit)
             .offset(offset)
@@ -93,38 +116,22 @@ class StatsService:
                 used_full_solution=session.used_full_solution,
                 started_at=session.started_at,
                 completed_at=session.completed_at,
+                duration_seconds=None if duration is None else round(duration, 1),
             )
-            for session in sessions
+            for session, duration in rows
         ]
 
     def count_sessions(self) -> int:
         return self._db.query(HintSession).count()
 
     def _calculate_avg_layers(self) -> float | None:
-        finished_sessions = (
-            self._db.query(HintSession)
-            .filter(HintSession.status.in_([SessionStatus.COMPLETED, SessionStatus.REVEALED]))
-            .all()
-        )
-
-        if not finished_sessions or len(finished_sessions) == 0:
+        result = self._db.query(func.avg(_FINISHED_LAYER_NUMBER)).scalar()
+        if result is None:
             return None
-
-        total_layers = sum(
-            self._layer_to_number(session.current_layer) for session in finished_sessions
-        )
-
-        return round(total_layers / len(finished_sessions), 1)
+        return round(float(result), 1)
 
     def _layer_to_number(self, layer: HintLayer) -> int:
-        mapping = {
-            HintLayer.CONCEPT: 1,
-            HintLayer.STRATEGY: 2,
-            HintLayer.STEP: 3,
-            HintLayer.COMPLETED: 4,
-            HintLayer.REVEALED: 4,
-        }
-        return mapping.get(layer, 0)
+        return _LAYER_NUMBERS.get(layer, 0)
 
     def get_dashboard(self) -> DashboardResponse:
         total_learning_days = self._get_total_learning_days()
@@ -1,19 +1,51 @@
-from dataclasses import dataclass, field
+import functools
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import ClassVar
+
+import ahocorasick
 
 from backend.models.enums import ProblemType, HintLayer, UnderstandingLevel
 
 
-@dataclass
+def _build_automaton(words: Iterable[str]) -> ahocorasick.Automaton:
+    """Compile words into a case-insensitive automaton whose values are the original words.
+
+    Values are interned so matched keywords are shared with equal literals elsewhere.
+    """
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word.lower(), sys.intern(word))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_keyword_matchers(
+    keywords_by_type: dict[ProblemType, tuple[str, ...]],
+) -> dict[ProblemType, ahocorasick.Automaton]:
+    """One automaton per problem type covering its own and the generic UNKNOWN keywords."""
+    generic = keywords_by_type[ProblemType.UNKNOWN]
+    return {
+        problem_type: _build_automaton(keywords + generic)
+        for problem_type, keywords in keywords_by_type.items()
+    }
+
+
+@dataclass(frozen=True, slots=True)
 class EvaluationResult:
     understanding_level: UnderstandingLevel
     char_count: int
-    keywords_matched: list[str] = field(default_factory=list)
+    keywords_matched: tuple[str, ...] = ()
 
 
 class UnderstandingEvaluator:
     MIN_RESPONSE_LENGTH = 10
 
-    EXPLICIT_CONFUSION_PHRASES = [
+    # Max evaluations memoized across all instances (LRU eviction)
+    CACHE_MAXSIZE = 2048
+
+    EXPLICIT_CONFUSION_PHRASES: ClassVar[tuple[str, ...]] = (
         "不懂", "don't understand", "do not understand",
         "不知道", "don't know", "do not know",
         "不会", "can't", "cannot",
@@ -24,10 +56,11 @@ class UnderstandingEvaluator:
         "没听懂",
         "不太懂",
         "看不明白",
-    ]
+    )
 
-    KEYWORDS_BY_TYPE = {
-        ProblemType.LINEAR_EQUATION_1VAR: [
+    # Immutable tables shared by every instance; never copied or extended per call
+    KEYWORDS_BY_TYPE: ClassVar[dict[ProblemType, tuple[str, ...]]] = {
+        ProblemType.LINEAR_EQUATION_1VAR: (
             "移项", "transposition", "transpose", "move",
             "等式", "equation",
             "方程",
@@ -39,8 +72,8 @@ class UnderstandingEvaluator:
             "常数", "constant",
             "合并", "combine", "combining",
             "同类项", "like terms",
-        ],
-        ProblemType.QUADRATIC_EQUATION: [
+        ),
+        ProblemType.QUADRATIC_EQUATION: (
             "因式",
             "分解",
             "配方",
@@ -50,15 +83,15 @@ class UnderstandingEvaluator:
             "根",
             "解",
             "方程",
-        ],
-        ProblemType.LINEAR_EQUATION_2VAR: [
+        ),
+        ProblemType.LINEAR_EQUATION_2VAR: (
             "消元",
             "代入",
             "方程组",
             "未知数",
             "解",
-        ],
-        ProblemType.GEOMETRY_BASIC: [
+        ),
+        ProblemType.GEOMETRY_BASIC: (
             "面积",
             "周长",
             "公式",
@@ -69,8 +102,8 @@ class UnderstandingEvaluator:
             "圆",
             "正方形",
             "矩形",
-        ],
-        ProblemType.ARITHMETIC: [
+        ),
+        ProblemType.ARITHMETIC: (
             "加",
             "减",
             "乘",
@@ -78,39 +111,64 @@ class UnderstandingEvaluator:
             "运算",
             "顺序",
             "括号",
-        ],
-        ProblemType.UNKNOWN: [
+        ),
+        ProblemType.UNKNOWN: (
             "方法",
             "步骤",
             "思路",
             "解决",
-        ],
+        ),
     }
 
+    # Matchers prebuilt from the tables above at import time. Keyed by problem
+    # type only: the keyword sets do not vary by hint layer.
+    _CONFUSION_MATCHER: ClassVar[ahocorasick.Automaton] = _build_automaton(
+        EXPLICIT_CONFUSION_PHRASES
+    )
+    _KEYWORD_MATCHERS: ClassVar[dict[ProblemType, ahocorasick.Automaton]] = _build_keyword_matchers(
+        KEYWORDS_BY_TYPE
+    )
+
     def evaluate(
         self,
         response_text: str,
         problem_type: ProblemType,
         layer: HintLayer,
     ) -> EvaluationResult:
-        text = response_text.strip()
-        char_count = len(text)
-
-        if self._contains_explicit_confusion(text):
+        # The outcome depends only on the text and problem type, not the layer
+        return self._evaluate_cached(response_text, problem_type)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoized evaluations."""
+        cls._evaluate_cached.cache_clear()
+
+    @classmethod
+    @functools.lru_cache(maxsize=CACHE_MAXSIZE)
+    def _evaluate_cached(cls, response_text: str, problem_type: ProblemType) -> EvaluationResult:
+        # Trimming only affects the length: no phrase or keyword starts or ends
+        # with whitespace. Skip the strip() copy when there is nothing to trim.
+        text = response_text
+        if text and not text[0].isspace() and not text[-1].isspace():
+            char_count = len(text)
+        else:
+            char_count = len(text.strip())
+
+        if cls._contains_explicit_confusion(text):
             return EvaluationResult(
                 understanding_level=UnderstandingLevel.EXPLICIT_CONFUSED,
                 char_count=char_count,
-                keywords_matched=[],
+                keywords_matched=(),
             )
 
-        if char_count < self.MIN_RESPONSE_LENGTH:
+        if char_count < cls.MIN_RESPONSE_LENGTH:
             return EvaluationResult(
                 understanding_level=UnderstandingLevel.CONFUSED,
                 char_count=char_count,
-                keywords_matched=[],
+                keywords_matched=(),
             )
 
-        keywords_matched = self._find_matching_keywords(text, problem_type)
+        keywords_matched = cls._find_matching_keywords(text, problem_type)
 
         if keywords_matched:
             return EvaluationResult(
@@ -122,24 +180,18 @@ class UnderstandingEvaluator:
         return EvaluationResult(
             understanding_level=UnderstandingLevel.CONFUSED,
             char_count=char_count,
-            keywords_matched=[],
+            keywords_matched=(),
         )
 
-    def _contains_explicit_confusion(self, text: str) -> bool:
-        text_lower = text.lower()
-        for phrase in self.EXPLICIT_CONFUSION_PHRASES:
-            if phrase in text_lower:
-                return True
-        return False
-
-    def _find_matching_keywords(self, text: str, problem_type: ProblemType) -> list[str]:
-        keywords = self.KEYWORDS_BY_TYPE.get(problem_type, [])
-        keywords.extend(self.KEYWORDS_BY_TYPE.get(ProblemType.UNKNOWN, []))
+    @classmethod
+    def _contains_explicit_confusion(cls, text: str) -> bool:
+        return next(cls._CONFUSION_MATCHER.iter(text.lower()), None) is not None
 
-        matched = []
-        text_lower = text.lower()
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                matched.append(keyword)
+    @classmethod
+    def _find_matching_keywords(cls, text: str, problem_type: ProblemType) -> tuple[str, ...]:
+        matcher = cls._KEYWORD_MATCHERS.get(problem_type)
+        if matcher is None:
+            matcher = cls._KEYWORD_MATCHERS[ProblemType.UNKNOWN]
 
-        return list(set(matched))
+        # One pass over the text reports every (possibly overlapping) keyword
+        return tuple({keyword for _, keyword in matcher.iter(text.lower())})
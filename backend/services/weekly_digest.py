@@ -1,24 +1,43 @@
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from typing import Dict, List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import ColumnElement, case, func
 
+from backend.database.functions import elapsed_seconds
 from backend.models.session import HintSession
-from backend.models.event_log import EventLog
 from backend.models.enums import HintLayer, SessionStatus
 from backend.models.problem import Problem
 
+# Depth of the furthest hint layer reached; COMPLETED sessions count as STEP
+_LAYER_DEPTH = case(
+    (HintSession.current_layer.in_((HintLayer.STEP, HintLayer.COMPLETED)), 2),
+    (HintSession.current_layer == HintLayer.STRATEGY, 1),
+    else_=0,
+)
+_DEPTH_TO_LAYER = {0: HintLayer.CONCEPT, 1: HintLayer.STRATEGY, 2: HintLayer.STEP}
+
+# Sessions with at least this many confusions count towards the challenging topic
+_CHALLENGING_CONFUSION_COUNT = 2
+
+# Number of recent sessions listed in the digest
+_RECENT_SESSION_LIMIT = 10
+
 
 class WeeklyDigestGenerator:
     def generate_weekly_digest(
         self, db: Session, email: str, start_date: datetime, end_date: datetime
     ) -> Optional[Dict]:
-        sessions = self._get_sessions_for_email(db, email, start_date, end_date)
+        window = (
+            HintSession.parent_email == email,
+            HintSession.started_at >= start_date,
+            HintSession.started_at <= end_date,
+        )
+        stats = self._calculate_statistics(db, window)
 
-        if not sessions:
+        if not stats["total_sessions"]:
             return None
 
-        stats = self._calculate_statistics(db, sessions)
+        sessions = self._get_recent_sessions(db, window)
         performance_level = self._calculate_performance_level(stats)
         recommendations = self._generate_recommendations(stats)
 
@@ -43,73 +62,75 @@ class WeeklyDigestGenerator:
                     "final_layer": s.current_layer.value,
                     "used_solution": s.used_full_solution,
                 }
-                for s in sessions[:10]
+                for s in sessions
             ],
         }
 
-    def _get_sessions_for_email(
-        self, db: Session, email: str, start_date: datetime, end_date: datetime
+    def _get_recent_sessions(
+        self, db: Session, window: tuple[ColumnElement[bool], ...]
     ) -> List[HintSession]:
         return (
             db.query(HintSession)
-            .filter(
-                HintSession.parent_email == email,
-                HintSession.started_at >= start_date,
-                HintSession.started_at <= end_date,
-            )
+            .options(selectinload(HintSession.problem))
+            .filter(*window)
             .order_by(HintSession.started_at.desc())
+            .limit(_RECENT_SESSION_LIMIT)
             .all()
         )
 
-    def _calculate_statistics(self, db: Session, sessions: List[HintSession]) -> Dict:
-        total_sessions = len(sessions)
-        completed_sessions = sum(1 for s in sessions if s.status == SessionStatus.COMPLETED)
-
-        highest_layer = HintLayer.CONCEPT
-        for session in sessions:
-            if (
-                session.current_layer == HintLayer.STEP
-                or session.current_layer == HintLayer.COMPLETED
-            ):
-                highest_layer = HintLayer.STEP
-                break
-            elif session.current_layer == HintLayer.STRATEGY:
-                highest_layer = HintLayer.STRATEGY
-
-        total_time_seconds = 0
-        for session in sessions:
-            if session.completed_at and session.started_at:
-                duration = (session.completed_at - session.started_at).total_seconds()
-                total_time_seconds += duration
-        total_time_minutes = int(total_time_seconds / 60)
-
-        reveal_usage_count = sum(1 for s in sessions if s.used_full_solution)
-
-        problem_types_with_confusion = []
-        for session in sessions:
-            if session.confusion_count >= 2:
-                problem_types_with_confusion.append(session.problem.problem_type)
-
-        most_challenging_topic = "N/A"
-        if problem_types_with_confusion:
-            from collections import Counter
-
-            topic_counts = Counter(problem_types_with_confusion)
-            most_common_topic, _ = topic_counts.most_common(1)[0]
-            most_challenging_topic = self._format_problem_type(most_common_topic)
+    def _calculate_statistics(self, db: Session, window: tuple[ColumnElement[bool], ...]) -> Dict:
+        (
+            total_sessions,
+            completed_sessions,
+            max_depth,
+            total_time_seconds,
+            reveal_usage_count,
+            avg_confusion,
+        ) = (
+            db.query(
+                func.count(HintSession.id),
+                func.sum(case((HintSession.status == SessionStatus.COMPLETED, 1), else_=0)),
+                func.max(_LAYER_DEPTH),
+                func.sum(elapsed_seconds(HintSession.started_at, HintSession.completed_at)),
+                func.sum(case((HintSession.used_full_solution.is_(True), 1), else_=0)),
+                func.avg(HintSession.confusion_count),
+            )
+            .filter(*window)
+            .one()
+        )
+
+        if not total_sessions:
+            return {"total_sessions": 0}
+
+        completed_sessions = completed_sessions or 0
+        reveal_usage_count = reveal_usage_count or 0
+        # Round first: SQLite's julianday() arithmetic is off by fractions of a second
+        total_time_minutes = int(round(total_time_seconds or 0) / 60)
+
+        # Ties go to the topic seen most recently
+        challenging = (
+            db.query(Problem.problem_type)
+            .join(HintSession, HintSession.problem_id == Problem.id)
+            .filter(*window, HintSession.confusion_count >= _CHALLENGING_CONFUSION_COUNT)
+            .group_by(Problem.problem_type)
+            .order_by(func.count(HintSession.id).desc(), func.max(HintSession.started_at).desc())
+            .limit(1)
+            .scalar()
+        )
+        most_challenging_topic = (
+            self._format_problem_type(challenging) if challenging is not None else "N/A"
+        )
 
         return {
             "total_sessions": total_sessions,
             "completed_sessions": completed_sessions,
-            "highest_layer_reached": highest_layer.value,
+            "highest_layer_reached": _DEPTH_TO_LAYER[max_depth or 0].value,
             "total_time_minutes": total_time_minutes,
             "reveal_usage_count": reveal_usage_count,
             "most_challenging_topic": most_challenging_topic,
-            "completion_rate": completed_sessions / total_sessions if total_sessions > 0 else 0,
-            "reveal_rate": reveal_usage_count / total_sessions if total_sessions > 0 else 0,
-            "avg_confusion": sum(s.confusion_count for s in sessions) / total_sessions
-            if total_sessions > 0
-            else 0,
+            "completion_rate": completed_sessions / total_sessions,
+            "reveal_rate": reveal_usage_count / total_sessions,
+            "avg_confusion": float(avg_confusion or 0),
         }
 
     def _calculate_performance_level(self, stats: Dict) -> str:
@@ -5,8 +5,9 @@ from typing import Any
 from unittest.mock import MagicMock
 
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 from backend.database.engine import Base, get_db
@@ -25,26 +26,105 @@ def set_test_env_vars(monkeypatch):
     yield
 
 
-@pytest.fixture(scope="function")
-def test_db() -> Generator[Session, Any, None]:
+def _configure_test_sqlite(engine: Engine) -> None:
+    """Tune the shared in-memory SQLite engine used by the test suite.
+
+    pysqlite only honours SAVEPOINTs if it stops managing transactions and we
+    emit BEGIN ourselves; see the SQLAlchemy docs section "Serializable
+    isolation / Savepoints / Transactional DDL" for the pysqlite driver.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+        # Test data is throwaway: skip fsync and keep journals in memory
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn: Any) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+def test_engine() -> Generator[Engine, Any, None]:
+    """Create the in-memory schema once for the whole test run."""
     engine = create_engine(
-        "sqlite:///:memory:",
+        "sqlite+pysqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    _configure_test_sqlite(engine)
     Base.metadata.create_all(bind=engine)
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def test_db(test_engine: Engine) -> Generator[Session, Any, None]:
+    """Run each test inside a transaction that is rolled back on teardown.
 
-    db = TestingSessionLocal()
+    Commits issued by service code only release a SAVEPOINT, so nothing
+    leaks between tests and no per-test CREATE/DROP TABLE is needed.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    db = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
+
+
+_TRANSACTION_CONTROL = ("BEGIN", "SAVEPOINT", "RELEASE", "ROLLBACK", "COMMIT")
+
+
+@pytest.fixture
+def query_counter(test_engine: Engine) -> Generator[list[str], Any, None]:
+    """Record the SQL statements issued through the test engine.
+
+    Transaction control (BEGIN/SAVEPOINT/RELEASE...) emitted by the test_db
+    fixture is ignored so tests can assert a fixed query budget.
+    """
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if not statement.lstrip().upper().startswith(_TRANSACTION_CONTROL):
+            statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(test_engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture(scope="session")
+def app_client(test_engine: Engine) -> Generator[TestClient, Any, None]:
+    """Start the app (and its lifespan) once and reuse the client across tests.
+
+    The lifespan's init_db() is pointed at the shared test engine so that parallel
+    workers (pytest-xdist) never race on creating tables in ./stepwise.db.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("backend.main.init_db", lambda: Base.metadata.create_all(bind=test_engine))
+        with TestClient(app) as test_client:
+            yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(test_db: Session) -> Generator[TestClient, Any, None]:
+def client(app_client: TestClient, test_db: Session) -> Generator[TestClient, Any, None]:
     def override_get_db() -> Generator[Session, Any, None]:
         try:
             yield test_db
@@ -52,11 +132,14 @@ def client(test_db: Session) -> Generator[TestClient, Any, None]:
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    default_headers = app_client.headers.copy()
 
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
 
     app.dependency_overrides.clear()
+    # Undo per-test client state (e.g. client_with_api_key headers)
+    app_client.headers = default_headers
+    app_client.cookies.clear()
 
 
 @pytest.fixture
@@ -5,17 +5,10 @@ import os
 import pytest
 from fastapi.testclient import TestClient
 
-from backend.main import app
-
 
 class TestRateLimitRetryAfterHeader:
     """Test that 429 responses include Retry-After header."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
     @pytest.fixture
     def api_key(self):
         """Get API key from environment or use test key."""
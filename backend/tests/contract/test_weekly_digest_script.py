@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 from backend.models.session import HintSession
 from backend.models.problem import Problem
 from backend.models.enums import HintLayer, SessionStatus, ProblemType
-from backend.scripts.send_weekly_digests import send_weekly_digests
+from backend.scripts.send_weekly_digests import _iter_recipient_batches, send_weekly_digests
 from backend.services.email_service import EmailService
 
 
@@ -312,3 +312,79 @@ class TestWeeklyDigestScript:
         # Assert: Should find no emails
         assert result["total_emails"] == 0
         assert result["sent"] == 0
+
+    @pytest.mark.contract
+    def test_recipient_batches_page_through_all_emails(self, test_db: Session) -> None:
+        """Recipient pages should cover every email exactly once with its session count."""
+        # Arrange
+        problem = Problem(
+            raw_text="2x + 5 = 11",
+            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
+        )
+        test_db.add(problem)
+        test_db.flush()
+
+        for email, count in [("a@example.com", 2), ("b@example.com", 1), ("c@example.com", 1)]:
+            for _ in range(count):
+                test_db.add(
+                    HintSession(
+                        problem_id=problem.id,
+                        current_layer=HintLayer.STEP,
+                        status=SessionStatus.COMPLETED,
+                        parent_email=email,
+                        started_at=datetime.now(timezone.utc) - timedelta(days=2),
+                    )
+                )
+        test_db.commit()
+
+        end_date = datetime.now(timezone.utc)
+        start_date = end_date - timedelta(days=7)
+
+        # Act
+        batches = list(_iter_recipient_batches(test_db, start_date, end_date, batch_size=2))
+
+        # Assert
+        assert batches == [
+            {"a@example.com": 2, "b@example.com": 1},
+            {"c@example.com": 1},
+        ]
+
+    @pytest.mark.contract
+    def test_script_counts_send_exceptions_as_failures(
+        self, test_db: Session, email_service: EmailService, monkeypatch
+    ) -> None:
+        """An exception raised on a send worker should be counted, not propagated."""
+        # Arrange
+        problem = Problem(
+            raw_text="2x + 5 = 11",
+            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
+        )
+        test_db.add(problem)
+        test_db.flush()
+
+        for email in ["parent1@example.com", "parent2@example.com"]:
+            test_db.add(
+                HintSession(
+                    problem_id=problem.id,
+                    current_layer=HintLayer.STEP,
+                    status=SessionStatus.COMPLETED,
+                    parent_email=email,
+                    started_at=datetime.now(timezone.utc) - timedelta(days=2),
+                )
+            )
+        test_db.commit()
+
+        def mock_send_weekly_digest(recipient_email, *args, **kwargs):
+            if recipient_email == "parent1@example.com":
+                raise RuntimeError("provider unavailable")
+            return True
+
+        monkeypatch.setattr(email_service, "send_weekly_digest", mock_send_weekly_digest)
+
+        # Act
+        result = send_weekly_digests(test_db, email_service, days=7, dry_run=False)
+
+        # Assert
+        assert result["total_emails"] == 2
+        assert result["sent"] == 1
+        assert result["failed"] == 1
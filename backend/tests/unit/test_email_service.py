@@ -1,8 +1,10 @@
 """Unit tests for email service."""
 
-import pytest
-from unittest.mock import Mock, patch, MagicMock
+import importlib.util
 import sys
+from unittest.mock import Mock, patch
+
+import pytest
 
 from backend.services.email_service import (
     EmailMessage,
@@ -12,12 +14,55 @@ from backend.services.email_service import (
     BaseEmailProvider,
 )
 
-try:
-    import sendgrid
+SENDGRID_AVAILABLE = importlib.util.find_spec("sendgrid") is not None
+SENDGRID_API_KEY = "test-api-key"
+
+# Shared weekly digest payload; tests needing variations merge overrides with `|`
+BASE_DIGEST = {
+    "total_sessions": 15,
+    "completed_sessions": 12,
+    "highest_layer_reached": "step",
+    "total_time_minutes": 120,
+    "reveal_usage_count": 2,
+    "most_challenging_topic": "Linear Equations",
+    "performance_level": "Good",
+    "recommendations": ["Keep practicing!"],
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def email_from_env():
+    """Set EMAIL_FROM once for the whole module instead of in every test."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("EMAIL_FROM", "test@stepwise.com")
+        yield
+
+
+class RecordingProvider(BaseEmailProvider):
+    """Plain provider stub that records what was sent (no Mock bookkeeping)."""
+
+    def __init__(self, result: bool = True) -> None:
+        self.result = result
+        self.calls = 0
+        self.last: EmailMessage | None = None
+
+    def send_email(self, message: EmailMessage) -> bool:
+        self.calls += 1
+        self.last = message
+        return self.result
+
+
+@pytest.fixture(scope="module")
+def console_provider() -> ConsoleEmailProvider:
+    """ConsoleEmailProvider is stateless, so one instance serves the whole module."""
+    return ConsoleEmailProvider()
+
 
-    SENDGRID_AVAILABLE = True
-except ImportError:
-    SENDGRID_AVAILABLE = False
+@pytest.fixture
+def recording_service():
+    """Provide an EmailService wired to a successful RecordingProvider."""
+    provider = RecordingProvider()
+    return EmailService(provider=provider), provider
 
 
 class TestEmailMessage:
@@ -51,8 +96,7 @@ class TestEmailMessage:
 
 
 class TestConsoleEmailProvider:
-    def test_send_email_returns_true(self) -> None:
-        provider = ConsoleEmailProvider()
+    def test_send_email_returns_true(self, console_provider: ConsoleEmailProvider) -> None:
         message = EmailMessage(
             recipient="test@example.com",
             subject="Test",
@@ -60,12 +104,11 @@ class TestConsoleEmailProvider:
             from_email="sender@example.com",
         )
 
-        result = provider.send_email(message)
+        result = console_provider.send_email(message)
 
         assert result is True
 
-    def test_send_email_with_attachment(self) -> None:
-        provider = ConsoleEmailProvider()
+    def test_send_email_with_attachment(self, console_provider: ConsoleEmailProvider) -> None:
         message = EmailMessage(
             recipient="test@example.com",
             subject="Test",
@@ -75,66 +118,34 @@ class TestConsoleEmailProvider:
             pdf_filename="test.pdf",
         )
 
-        result = provider.send_email(message)
-
-        assert result is True
-
-
-class TestSendGridEmailProvider:
-    @pytest.mark.skipif(not SENDGRID_AVAILABLE, reason="SendGrid not installed")
-    def test_send_email_success(self) -> None:
-        api_key = "test-api-key"
-        provider = SendGridEmailProvider(api_key)
-
-        message = EmailMessage(
-            recipient="test@example.com",
-            subject="Test",
-            html_body="<p>Test</p>",
-            from_email="sender@example.com",
-        )
-
-        mock_response = Mock()
-        mock_response.status_code = 202
-
-        with patch("sendgrid.SendGridAPIClient") as mock_sg_class:
-            mock_sg_instance = mock_sg_class.return_value
-            mock_sg_instance.send.return_value = mock_response
-
-            result = provider.send_email(message)
+        result = console_provider.send_email(message)
 
         assert result is True
-        mock_sg_class.assert_called_once_with(api_key)
-        mock_sg_instance.send.assert_called_once()
 
-    @pytest.mark.skipif(not SENDGRID_AVAILABLE, reason="SendGrid not installed")
-    def test_send_email_with_attachment_success(self) -> None:
-        api_key = "test-api-key"
-        provider = SendGridEmailProvider(api_key)
 
-        message = EmailMessage(
-            recipient="test@example.com",
-            subject="Test",
-            html_body="<p>Test</p>",
-            from_email="sender@example.com",
-            pdf_attachment=b"fake pdf content",
-            pdf_filename="report.pdf",
-        )
-
-        mock_response = Mock()
-        mock_response.status_code = 202
-
-        with patch("sendgrid.SendGridAPIClient") as mock_sg_class:
-            mock_sg_instance = mock_sg_class.return_value
-            mock_sg_instance.send.return_value = mock_response
-
-            result = provider.send_email(message)
+@pytest.fixture
+def mock_sendgrid_client():
+    """Patch the SendGrid API client class for the duration of a test."""
+    with patch("sendgrid.SendGridAPIClient") as mock_sg_class:
+        yield mock_sg_class
 
-        assert result is True
 
+class TestSendGridEmailProvider:
+    @pytest.mark.sendgrid
     @pytest.mark.skipif(not SENDGRID_AVAILABLE, reason="SendGrid not installed")
-    def test_send_email_failure_status(self) -> None:
-        api_key = "test-api-key"
-        provider = SendGridEmailProvider(api_key)
+    @pytest.mark.parametrize(
+        "status_code,expected,attach",
+        [
+            (202, True, False),
+            (202, True, True),
+            (400, False, False),
+        ],
+        ids=["success", "with_attachment_success", "failure_status"],
+    )
+    def test_send_email_variants(
+        self, mock_sendgrid_client: Mock, status_code: int, expected: bool, attach: bool
+    ) -> None:
+        provider = SendGridEmailProvider(SENDGRID_API_KEY)
 
         message = EmailMessage(
             recipient="test@example.com",
@@ -142,23 +153,26 @@ class TestSendGridEmailProvider:
             html_body="<p>Test</p>",
             from_email="sender@example.com",
         )
+        if attach:
+            message.pdf_attachment = b"fake pdf content"
+            message.pdf_filename = "report.pdf"
 
         mock_response = Mock()
-        mock_response.status_code = 400
+        mock_response.status_code = status_code
         mock_response.body = "Bad Request"
 
-        with patch("sendgrid.SendGridAPIClient") as mock_sg_class:
-            mock_sg_instance = mock_sg_class.return_value
-            mock_sg_instance.send.return_value = mock_response
+        mock_sendgrid_client.return_value.send.return_value = mock_response
 
-            result = provider.send_email(message)
+        result = provider.send_email(message)
 
-        assert result is False
+        assert result is expected
+        mock_sendgrid_client.assert_called_once_with(SENDGRID_API_KEY)
+        mock_sendgrid_client.return_value.send.assert_called_once()
 
+    @pytest.mark.sendgrid
     @pytest.mark.skipif(not SENDGRID_AVAILABLE, reason="SendGrid not installed")
-    def test_send_email_exception(self) -> None:
-        api_key = "test-api-key"
-        provider = SendGridEmailProvider(api_key)
+    def test_send_email_exception(self, mock_sendgrid_client: Mock) -> None:
+        provider = SendGridEmailProvider(SENDGRID_API_KEY)
 
         message = EmailMessage(
             recipient="test@example.com",
@@ -167,17 +181,14 @@ class TestSendGridEmailProvider:
             from_email="sender@example.com",
         )
 
-        with patch("sendgrid.SendGridAPIClient") as mock_sg_class:
-            mock_sg_instance = mock_sg_class.return_value
-            mock_sg_instance.send.side_effect = Exception("Network error")
+        mock_sendgrid_client.return_value.send.side_effect = Exception("Network error")
 
-            result = provider.send_email(message)
+        result = provider.send_email(message)
 
         assert result is False
 
     def test_send_email_import_error(self) -> None:
-        api_key = "test-api-key"
-        provider = SendGridEmailProvider(api_key)
+        provider = SendGridEmailProvider(SENDGRID_API_KEY)
 
         message = EmailMessage(
             recipient="test@example.com",
@@ -186,7 +197,8 @@ class TestSendGridEmailProvider:
             from_email="sender@example.com",
         )
 
-        with patch("builtins.__import__", side_effect=ImportError("No module named 'sendgrid'")):
+        # A None entry in sys.modules makes only `import sendgrid` raise ImportError
+        with patch.dict(sys.modules, {"sendgrid": None}):
             result = provider.send_email(message)
 
         assert result is False
@@ -221,13 +233,8 @@ class TestEmailService:
 
         assert isinstance(service.provider, ConsoleEmailProvider)
 
-    def test_send_learning_report_success(self, monkeypatch) -> None:
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
-
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+    def test_send_learning_report_success(self, recording_service) -> None:
+        service, provider = recording_service
 
         summary = {
             "headline": "Great progress on Linear Equations",
@@ -246,20 +253,18 @@ class TestEmailService:
         )
 
         assert result is True
-        mock_provider.send_email.assert_called_once()
+        assert provider.calls == 1
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        assert call_args.recipient == "parent@example.com"
-        assert call_args.subject == "Your child's learning report – StepWise"
-        assert "Great progress on Linear Equations" in call_args.html_body
-        assert call_args.pdf_attachment == pdf_content
-        assert call_args.pdf_filename == "stepwise_report_test-session-123.pdf"
+        message = provider.last
+        assert message.recipient == "parent@example.com"
+        assert message.subject == "Your child's learning report – StepWise"
+        assert "Great progress on Linear Equations" in message.html_body
+        assert message.pdf_attachment == pdf_content
+        assert message.pdf_filename == "stepwise_report_test-session-123.pdf"
 
-    def test_send_learning_report_failure(self) -> None:
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = False
-
-        service = EmailService(provider=mock_provider)
+    def test_send_learning_report_failure(self, recording_service) -> None:
+        service, provider = recording_service
+        provider.result = False
 
         summary = {
             "headline": "Test",
@@ -279,13 +284,8 @@ class TestEmailService:
 
 
 class TestEmailTemplateComposition:
-    def test_compose_html_with_all_fields(self, monkeypatch) -> None:
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
-
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+    def test_compose_html_with_all_fields(self, recording_service) -> None:
+        service, provider = recording_service
 
         summary = {
             "headline": "Excellent work on Quadratic Equations",
@@ -305,8 +305,7 @@ class TestEmailTemplateComposition:
             pdf_content=b"pdf",
         )
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
         assert "Excellent work on Quadratic Equations" in html
         assert "Excellent" in html
@@ -315,13 +314,8 @@ class TestEmailTemplateComposition:
         assert "StepWise Learning Report" in html
         assert "<!DOCTYPE html>" in html
 
-    def test_compose_html_with_needs_practice(self, monkeypatch) -> None:
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
-
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+    def test_compose_html_with_needs_practice(self, recording_service) -> None:
+        service, provider = recording_service
 
         summary = {
             "headline": "Keep practicing Linear Equations",
@@ -337,8 +331,7 @@ class TestEmailTemplateComposition:
             pdf_content=b"pdf",
         )
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
         assert "Needs Practice" in html
         assert "Keep practicing" in html
@@ -346,25 +339,13 @@ class TestEmailTemplateComposition:
 
 class TestWeeklyDigestEmail:
     @pytest.mark.unit
-    def test_send_weekly_digest_success(self, monkeypatch) -> None:
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
-
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
+    def test_send_weekly_digest_success(self, recording_service) -> None:
+        service, provider = recording_service
 
-        service = EmailService(provider=mock_provider)
-
-        digest_data = {
+        digest_data = BASE_DIGEST | {
             "email": "parent@example.com",
             "period_start": "2024-01-01T00:00:00",
             "period_end": "2024-01-07T23:59:59",
-            "total_sessions": 15,
-            "completed_sessions": 12,
-            "highest_layer_reached": "step",
-            "total_time_minutes": 120,
-            "reveal_usage_count": 2,
-            "most_challenging_topic": "Linear Equations",
-            "performance_level": "Good",
             "recommendations": [
                 "Keep up the consistent practice!",
                 "Try to complete more problems independently.",
@@ -378,118 +359,66 @@ class TestWeeklyDigestEmail:
         )
 
         assert result is True
-        mock_provider.send_email.assert_called_once()
+        assert provider.calls == 1
 
     @pytest.mark.unit
-    def test_weekly_digest_html_contains_key_metrics(self, monkeypatch) -> None:
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
-
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+    def test_weekly_digest_html_contains_key_metrics(self, recording_service) -> None:
+        service, provider = recording_service
 
-        digest_data = {
-            "total_sessions": 15,
-            "completed_sessions": 12,
-            "highest_layer_reached": "step",
-            "total_time_minutes": 120,
-            "reveal_usage_count": 2,
-            "most_challenging_topic": "Linear Equations",
-            "performance_level": "Good",
-            "recommendations": ["Keep practicing!"],
-        }
-
-        service.send_weekly_digest("parent@example.com", digest_data, week_start_date="2024-01-01")
+        service.send_weekly_digest("parent@example.com", BASE_DIGEST, week_start_date="2024-01-01")
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
-        assert "15" in html
-        assert "12" in html
-        assert "step" in html
-        assert "120" in html
-        assert "2" in html
-        assert "Linear Equations" in html
-        assert "Good" in html
-        assert "Keep practicing!" in html
+        expected = ("15", "12", "step", "120", "2", "Linear Equations", "Good", "Keep practicing!")
+        missing = [needle for needle in expected if needle not in html]
+        assert not missing, missing
 
     @pytest.mark.unit
-    def test_weekly_digest_subject_line(self, monkeypatch) -> None:
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
+    def test_weekly_digest_subject_line(self, recording_service) -> None:
+        service, provider = recording_service
 
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
+        service.send_weekly_digest("parent@example.com", BASE_DIGEST, week_start_date="2024-01-01")
 
-        service = EmailService(provider=mock_provider)
+        message = provider.last
 
-        digest_data = {
-            "total_sessions": 5,
-            "completed_sessions": 4,
-            "highest_layer_reached": "strategy",
-            "total_time_minutes": 50,
-            "reveal_usage_count": 1,
-            "most_challenging_topic": "Geometry",
-            "performance_level": "Good",
-            "recommendations": ["Continue practicing"],
-        }
-
-        service.send_weekly_digest("parent@example.com", digest_data, week_start_date="2024-01-01")
-
-        call_args = mock_provider.send_email.call_args[0][0]
-
-        assert call_args.subject == "Your child's weekly learning summary – StepWise"
-        assert call_args.recipient == "parent@example.com"
+        assert message.subject == "Your child's weekly learning summary – StepWise"
+        assert message.recipient == "parent@example.com"
 
     @pytest.mark.unit
-    def test_weekly_digest_performance_colors(self, monkeypatch) -> None:
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
-
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
-
-        for performance, expected_color in [
+    @pytest.mark.parametrize(
+        "performance,expected_color",
+        [
             ("Excellent", "#22c55e"),
             ("Good", "#3b82f6"),
             ("Needs Practice", "#f59e0b"),
-        ]:
-            digest_data = {
-                "total_sessions": 10,
-                "completed_sessions": 8,
-                "highest_layer_reached": "step",
-                "total_time_minutes": 80,
-                "reveal_usage_count": 1,
-                "most_challenging_topic": "Algebra",
-                "performance_level": performance,
-                "recommendations": ["Keep going!"],
-            }
+        ],
+    )
+    def test_weekly_digest_performance_colors(
+        self, recording_service, performance: str, expected_color: str
+    ) -> None:
+        service, provider = recording_service
+
+        digest_data = BASE_DIGEST | {"performance_level": performance}
 
-            service.send_weekly_digest(
-                "parent@example.com", digest_data, week_start_date="2024-01-01"
-            )
+        service.send_weekly_digest("parent@example.com", digest_data, week_start_date="2024-01-01")
 
-            call_args = mock_provider.send_email.call_args[0][0]
-            html = call_args.html_body
+        html = provider.last.html_body
 
-            assert expected_color in html
-            assert performance in html
+        assert expected_color in html
+        assert performance in html
 
 
 class TestEmailFooterCompliance:
     """Tests for CAN-SPAM compliant email footers."""
 
     @pytest.mark.unit
-    def test_session_report_footer_contains_unsubscribe_link(self, monkeypatch) -> None:
+    def test_session_report_footer_contains_unsubscribe_link(
+        self, monkeypatch, recording_service
+    ) -> None:
         """Session report emails must contain unsubscribe link."""
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
         monkeypatch.setenv("API_BASE_URL", "https://app.stepwise.com")
 
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+        service, provider = recording_service
 
         summary = {
             "headline": "Great progress",
@@ -505,8 +434,7 @@ class TestEmailFooterCompliance:
             pdf_content=b"pdf",
         )
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
         # Must contain unsubscribe link
         assert "Unsubscribe from session reports" in html
@@ -514,15 +442,13 @@ class TestEmailFooterCompliance:
         assert "?type=session_reports" in html
 
     @pytest.mark.unit
-    def test_session_report_footer_contains_preferences_link(self, monkeypatch) -> None:
+    def test_session_report_footer_contains_preferences_link(
+        self, monkeypatch, recording_service
+    ) -> None:
         """Session report emails must contain manage preferences link."""
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
         monkeypatch.setenv("API_BASE_URL", "https://app.stepwise.com")
 
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+        service, provider = recording_service
 
         summary = {
             "headline": "Great progress",
@@ -538,22 +464,17 @@ class TestEmailFooterCompliance:
             pdf_content=b"pdf",
         )
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
         # Must contain preferences link
         assert "Manage email preferences" in html
 
     @pytest.mark.unit
-    def test_session_report_footer_clarifies_scope(self, monkeypatch) -> None:
+    def test_session_report_footer_clarifies_scope(self, monkeypatch, recording_service) -> None:
         """Session report footer must clarify what unsubscribe affects."""
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
         monkeypatch.setenv("API_BASE_URL", "https://app.stepwise.com")
 
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+        service, provider = recording_service
 
         summary = {
             "headline": "Great progress",
@@ -569,23 +490,20 @@ class TestEmailFooterCompliance:
             pdf_content=b"pdf",
         )
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
         # Must clarify scope
         assert "session completion emails" in html or "session reports" in html.lower()
         assert "weekly" in html.lower()
 
     @pytest.mark.unit
-    def test_session_report_footer_contains_contact_link(self, monkeypatch) -> None:
+    def test_session_report_footer_contains_contact_link(
+        self, monkeypatch, recording_service
+    ) -> None:
         """Session report emails must contain contact link."""
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
         monkeypatch.setenv("API_BASE_URL", "https://app.stepwise.com")
 
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+        service, provider = recording_service
 
         summary = {
             "headline": "Great progress",
@@ -601,22 +519,19 @@ class TestEmailFooterCompliance:
             pdf_content=b"pdf",
         )
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
         # Must contain contact link
         assert "Contact" in html or "mailto:" in html
 
     @pytest.mark.unit
-    def test_weekly_digest_footer_contains_unsubscribe_link(self, monkeypatch) -> None:
+    def test_weekly_digest_footer_contains_unsubscribe_link(
+        self, monkeypatch, recording_service
+    ) -> None:
         """Weekly digest emails must contain unsubscribe link."""
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
         monkeypatch.setenv("API_BASE_URL", "https://app.stepwise.com")
 
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+        service, provider = recording_service
 
         digest_data = {
             "total_sessions": 10,
@@ -636,8 +551,7 @@ class TestEmailFooterCompliance:
             unsubscribe_token="test-token-12345678901234567890",
         )
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
         # Must contain unsubscribe link
         assert "Unsubscribe from weekly digests" in html
@@ -645,15 +559,13 @@ class TestEmailFooterCompliance:
         assert "test-token-12345678901234567890" in html
 
     @pytest.mark.unit
-    def test_weekly_digest_footer_contains_preferences_link(self, monkeypatch) -> None:
+    def test_weekly_digest_footer_contains_preferences_link(
+        self, monkeypatch, recording_service
+    ) -> None:
         """Weekly digest emails must contain manage preferences link."""
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
         monkeypatch.setenv("API_BASE_URL", "https://app.stepwise.com")
 
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+        service, provider = recording_service
 
         digest_data = {
             "total_sessions": 10,
@@ -673,22 +585,17 @@ class TestEmailFooterCompliance:
             unsubscribe_token="test-token-12345678901234567890",
         )
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
         # Must contain preferences link
         assert "Manage email preferences" in html
 
     @pytest.mark.unit
-    def test_weekly_digest_footer_clarifies_scope(self, monkeypatch) -> None:
+    def test_weekly_digest_footer_clarifies_scope(self, monkeypatch, recording_service) -> None:
         """Weekly digest footer must clarify what unsubscribe affects."""
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
         monkeypatch.setenv("API_BASE_URL", "https://app.stepwise.com")
 
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+        service, provider = recording_service
 
         digest_data = {
             "total_sessions": 10,
@@ -708,23 +615,20 @@ class TestEmailFooterCompliance:
             unsubscribe_token="test-token-12345678901234567890",
         )
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
         # Must clarify scope
         assert "weekly digest" in html.lower()
         assert "session" in html.lower()
 
     @pytest.mark.unit
-    def test_weekly_digest_footer_contains_contact_link(self, monkeypatch) -> None:
+    def test_weekly_digest_footer_contains_contact_link(
+        self, monkeypatch, recording_service
+    ) -> None:
         """Weekly digest emails must contain contact link."""
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
         monkeypatch.setenv("API_BASE_URL", "https://app.stepwise.com")
 
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+        service, provider = recording_service
 
         digest_data = {
             "total_sessions": 10,
@@ -744,22 +648,17 @@ class TestEmailFooterCompliance:
             unsubscribe_token="test-token-12345678901234567890",
         )
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
         # Must contain contact link
         assert "Contact" in html or "mailto:" in html
 
     @pytest.mark.unit
-    def test_weekly_digest_uses_api_base_url(self, monkeypatch) -> None:
+    def test_weekly_digest_uses_api_base_url(self, monkeypatch, recording_service) -> None:
         """Weekly digest unsubscribe links must use API_BASE_URL."""
-        monkeypatch.setenv("EMAIL_FROM", "test@stepwise.com")
         monkeypatch.setenv("API_BASE_URL", "https://custom.stepwise.io")
 
-        mock_provider = Mock(spec=BaseEmailProvider)
-        mock_provider.send_email.return_value = True
-
-        service = EmailService(provider=mock_provider)
+        service, provider = recording_service
 
         digest_data = {
             "total_sessions": 5,
@@ -779,8 +678,7 @@ class TestEmailFooterCompliance:
             unsubscribe_token="abc-token-123456789012345678901",
         )
 
-        call_args = mock_provider.send_email.call_args[0][0]
-        html = call_args.html_body
+        html = provider.last.html_body
 
         # Must use custom API_BASE_URL
         assert "https://custom.stepwise.io/api/v1/email/unsubscribe/" in html
@@ -1,5 +1,6 @@
 import pytest
 from datetime import date, datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from backend.models import SubscriptionTier, SubscriptionStatus, Subscription, UsageRecord
@@ -11,6 +12,32 @@ from backend.services.entitlements import (
     TierLimits,
 )
 
+TODAY = date(2024, 1, 15)
+
+
+class _FrozenDate(date):
+    @classmethod
+    def today(cls) -> date:
+        return TODAY
+
+
+@pytest.fixture(autouse=True)
+def frozen_today(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pin entitlements' notion of "today" so usage dates are deterministic."""
+    monkeypatch.setattr("backend.services.entitlements.date", _FrozenDate)
+
+
+class _DBMock(MagicMock):
+    """MagicMock session with a helper for queuing `.query().filter().first()` results."""
+
+    def queue_first(self, *values: object) -> None:
+        self.query.return_value.filter.return_value.first.side_effect = list(values)
+
+
+@pytest.fixture
+def mock_db() -> _DBMock:
+    return _DBMock()
+
 
 class TestGetTierLimits:
     @pytest.mark.unit
@@ -42,9 +69,9 @@ class TestGetTierLimits:
 class TestGetEffectiveTier:
     @pytest.mark.unit
     def test_active_subscription_returns_tier(self) -> None:
-        sub = MagicMock(spec=Subscription)
-        sub.tier = SubscriptionTier.PRO
-        sub.status = SubscriptionStatus.ACTIVE
+        sub = SimpleNamespace(
+            tier=SubscriptionTier.PRO, status=SubscriptionStatus.ACTIVE, current_period_end=None
+        )
 
         result = get_effective_tier(sub)
         assert result == SubscriptionTier.PRO
@@ -53,29 +80,29 @@ class TestGetEffectiveTier:
     def test_canceled_with_future_period_end_returns_tier(self) -> None:
         from datetime import timedelta
 
-        sub = MagicMock(spec=Subscription)
-        sub.tier = SubscriptionTier.PRO
-        sub.status = SubscriptionStatus.CANCELED
-        sub.current_period_end = datetime.now(timezone.utc) + timedelta(days=10)
+        sub = SimpleNamespace(
+            tier=SubscriptionTier.PRO,
+            status=SubscriptionStatus.CANCELED,
+            current_period_end=datetime.now(timezone.utc) + timedelta(days=10),
+        )
 
         result = get_effective_tier(sub)
         assert result == SubscriptionTier.PRO
 
     @pytest.mark.unit
     def test_past_due_returns_free(self) -> None:
-        sub = MagicMock(spec=Subscription)
-        sub.tier = SubscriptionTier.PRO
-        sub.status = SubscriptionStatus.PAST_DUE
-        sub.current_period_end = None
+        sub = SimpleNamespace(
+            tier=SubscriptionTier.PRO, status=SubscriptionStatus.PAST_DUE, current_period_end=None
+        )
 
         result = get_effective_tier(sub)
         assert result == SubscriptionTier.FREE
 
     @pytest.mark.unit
     def test_trialing_returns_tier(self) -> None:
-        sub = MagicMock(spec=Subscription)
-        sub.tier = SubscriptionTier.PRO
-        sub.status = SubscriptionStatus.TRIALING
+        sub = SimpleNamespace(
+            tier=SubscriptionTier.PRO, status=SubscriptionStatus.TRIALING, current_period_end=None
+        )
 
         result = get_effective_tier(sub)
         assert result == SubscriptionTier.PRO
@@ -83,12 +110,11 @@ class TestGetEffectiveTier:
 
 class TestCheckCanStartSession:
     @pytest.mark.unit
-    def test_free_user_under_limit_can_start(self) -> None:
-        mock_db = MagicMock()
+    def test_free_user_under_limit_can_start(self, mock_db: _DBMock) -> None:
         sub = Subscription(
             user_id="user1", tier=SubscriptionTier.FREE, status=SubscriptionStatus.ACTIVE
         )
-        mock_db.query.return_value.filter.return_value.first.side_effect = [sub, None]
+        mock_db.queue_first(sub, None)
 
         result = check_can_start_session(mock_db, "user1")
 
@@ -97,13 +123,12 @@ class TestCheckCanStartSession:
         assert result.limit == 3
 
     @pytest.mark.unit
-    def test_free_user_at_limit_cannot_start(self) -> None:
-        mock_db = MagicMock()
+    def test_free_user_at_limit_cannot_start(self, mock_db: _DBMock) -> None:
         sub = Subscription(
             user_id="user1", tier=SubscriptionTier.FREE, status=SubscriptionStatus.ACTIVE
         )
-        usage = UsageRecord(user_id="user1", usage_date=date.today(), problems_used=3)
-        mock_db.query.return_value.filter.return_value.first.side_effect = [sub, usage]
+        usage = UsageRecord(user_id="user1", usage_date=TODAY, problems_used=3)
+        mock_db.queue_first(sub, usage)
 
         result = check_can_start_session(mock_db, "user1")
 
@@ -113,13 +138,12 @@ class TestCheckCanStartSession:
         assert result.reason == "LIMIT_REACHED"
 
     @pytest.mark.unit
-    def test_pro_user_always_can_start(self) -> None:
-        mock_db = MagicMock()
+    def test_pro_user_always_can_start(self, mock_db: _DBMock) -> None:
         sub = Subscription(
             user_id="user1", tier=SubscriptionTier.PRO, status=SubscriptionStatus.ACTIVE
         )
-        usage = UsageRecord(user_id="user1", usage_date=date.today(), problems_used=100)
-        mock_db.query.return_value.filter.return_value.first.side_effect = [sub, usage]
+        usage = UsageRecord(user_id="user1", usage_date=TODAY, problems_used=100)
+        mock_db.queue_first(sub, usage)
 
         result = check_can_start_session(mock_db, "user1")
 
@@ -129,22 +153,21 @@ class TestCheckCanStartSession:
 
 class TestIncrementUsage:
     @pytest.mark.unit
-    def test_creates_new_record_if_none_exists(self) -> None:
-        mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+    def test_creates_new_record_if_none_exists(self, mock_db: _DBMock) -> None:
+        mock_db.queue_first(None)
 
         result = increment_usage(mock_db, "user1")
 
         assert result == 1
         mock_db.add.assert_called_once()
+        assert mock_db.add.call_args.args[0].usage_date == TODAY
         mock_db.commit.assert_called_once()
 
     @pytest.mark.unit
-    def test_increments_existing_record(self) -> None:
-        mock_db = MagicMock()
+    def test_increments_existing_record(self, mock_db: _DBMock) -> None:
         existing = MagicMock()
         existing.problems_used = 2
-        mock_db.query.return_value.filter.return_value.first.return_value = existing
+        mock_db.queue_first(existing)
 
         result = increment_usage(mock_db, "user1")
 
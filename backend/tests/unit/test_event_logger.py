@@ -0,0 +1,52 @@
+"""Unit tests for EventLogger and EventLog.bulk_log."""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from backend.models import EventLog
+from backend.services.event_logger import EventLogger
+
+
+@pytest.mark.unit
+class TestEventLogger:
+    def test_log_event_flushes_immediately(self, test_db: Session) -> None:
+        event = EventLogger().log_event(test_db, None, "session_started", {"sequence": 1})
+
+        assert event is not None
+        assert test_db.query(EventLog).count() == 1
+
+    def test_deferred_events_are_inserted_in_one_batch(
+        self, test_db: Session, query_counter: list[str]
+    ) -> None:
+        event_logger = EventLogger()
+
+        with event_logger.defer_events(test_db):
+            assert event_logger.log_event(test_db, None, "session_started", {}) is None
+            event_logger.log_event(test_db, None, "concept_hint_given", {"sequence": 1})
+            assert query_counter == []
+
+        inserts = [stmt for stmt in query_counter if stmt.startswith("INSERT")]
+        assert len(inserts) == 1, query_counter
+        events = test_db.query(EventLog).order_by(EventLog.event_type.desc()).all()
+        assert [e.event_type for e in events] == ["session_started", "concept_hint_given"]
+        assert events[1].details == {"sequence": 1}
+        assert all(e.id and e.event_timestamp for e in events)
+
+    def test_deferred_events_are_dropped_on_error(self, test_db: Session) -> None:
+        event_logger = EventLogger()
+
+        with pytest.raises(RuntimeError):
+            with event_logger.defer_events(test_db):
+                event_logger.log_event(test_db, None, "session_started", {})
+                raise RuntimeError("boom")
+
+        assert test_db.query(EventLog).count() == 0
+        # The logger goes back to writing events straight away
+        assert event_logger.log_event(test_db, None, "session_started", {}) is not None
+
+
+@pytest.mark.unit
+def test_bulk_log_ignores_empty_batch(test_db: Session, query_counter: list[str]) -> None:
+    EventLog.bulk_log(test_db, [])
+
+    assert query_counter == []
@@ -130,50 +130,57 @@ class TestFeedbackEndpoint:
         assert response.status_code == 200
 
     @pytest.mark.unit
-    def test_submit_feedback_all_pmf_values(self, client: TestClient, test_db) -> None:
+    @pytest.mark.parametrize(
+        "pmf_value", ["very_disappointed", "somewhat_disappointed", "not_disappointed"]
+    )
+    def test_submit_feedback_all_pmf_values(
+        self, client: TestClient, test_db, pmf_value: str
+    ) -> None:
         """Test all valid PMF answer values."""
-        for pmf_value in ["very_disappointed", "somewhat_disappointed", "not_disappointed"]:
-            response = client.post(
-                "/api/v1/feedback",
-                json={
-                    "pmf_answer": pmf_value,
-                    "grade_level": "grade_6",
-                },
-            )
-            assert response.status_code == 200, f"Failed for pmf_answer={pmf_value}"
+        response = client.post(
+            "/api/v1/feedback",
+            json={
+                "pmf_answer": pmf_value,
+                "grade_level": "grade_6",
+            },
+        )
+        assert response.status_code == 200
 
     @pytest.mark.unit
-    def test_submit_feedback_all_grade_levels(self, client: TestClient, test_db) -> None:
+    @pytest.mark.parametrize(
+        "grade", ["grade_4", "grade_5", "grade_6", "grade_7", "grade_8", "grade_9"]
+    )
+    def test_submit_feedback_all_grade_levels(
+        self, client: TestClient, test_db, grade: str
+    ) -> None:
         """Test all valid grade level values."""
-        for grade in ["grade_4", "grade_5", "grade_6", "grade_7", "grade_8", "grade_9"]:
-            response = client.post(
-                "/api/v1/feedback",
-                json={
-                    "pmf_answer": "very_disappointed",
-                    "grade_level": grade,
-                },
-            )
-            assert response.status_code == 200, f"Failed for grade_level={grade}"
+        response = client.post(
+            "/api/v1/feedback",
+            json={
+                "pmf_answer": "very_disappointed",
+                "grade_level": grade,
+            },
+        )
+        assert response.status_code == 200
 
     @pytest.mark.unit
-    def test_submit_feedback_all_would_pay_values(self, client: TestClient, test_db) -> None:
+    @pytest.mark.parametrize(
+        "would_pay",
+        ["yes_definitely", "yes_probably", "not_sure", "probably_not", "definitely_not"],
+    )
+    def test_submit_feedback_all_would_pay_values(
+        self, client: TestClient, test_db, would_pay: str
+    ) -> None:
         """Test all valid would_pay values."""
-        for would_pay in [
-            "yes_definitely",
-            "yes_probably",
-            "not_sure",
-            "probably_not",
-            "definitely_not",
-        ]:
-            response = client.post(
-                "/api/v1/feedback",
-                json={
-                    "pmf_answer": "very_disappointed",
-                    "grade_level": "grade_6",
-                    "would_pay": would_pay,
-                },
-            )
-            assert response.status_code == 200, f"Failed for would_pay={would_pay}"
+        response = client.post(
+            "/api/v1/feedback",
+            json={
+                "pmf_answer": "very_disappointed",
+                "grade_level": "grade_6",
+                "would_pay": would_pay,
+            },
+        )
+        assert response.status_code == 200
 
 
 class TestFeedbackModel:
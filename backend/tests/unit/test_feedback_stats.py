@@ -5,6 +5,11 @@ from fastapi.testclient import TestClient
 
 from backend.models.feedback import FeedbackItem
 
+# Column values shared by the bulk-seeded feedback rows below
+_G5_VERY_DISAPPOINTED = {"grade_level": "grade_5", "pmf_answer": "very_disappointed"}
+_G5_SOMEWHAT_DISAPPOINTED = {"grade_level": "grade_5", "pmf_answer": "somewhat_disappointed"}
+_G5_NOT_DISAPPOINTED = {"grade_level": "grade_5", "pmf_answer": "not_disappointed"}
+
 
 class TestFeedbackStatsEndpoint:
     """Tests for GET /api/v1/feedback/stats endpoint."""
@@ -51,8 +56,7 @@ class TestFeedbackStatsEndpoint:
                 pmf_answer="not_disappointed",
             ),
         ]
-        for fb in feedbacks:
-            test_db.add(fb)
+        test_db.bulk_save_objects(feedbacks)
         test_db.commit()
 
         response = client.get("/api/v1/feedback/stats")
@@ -73,16 +77,41 @@ class TestFeedbackStatsEndpoint:
         # Email opt-in: 2 with email / 4 total = 50%
         assert data["email_opt_in_rate"] == 50.0
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("row_count", [4, 50, 500])
+    def test_stats_query_count_does_not_scale(
+        self, client: TestClient, test_db, query_counter: list[str], row_count: int
+    ) -> None:
+        """Stats are computed with a fixed number of aggregate queries (no N+1)."""
+        test_db.bulk_save_objects(
+            [
+                FeedbackItem(
+                    grade_level=f"grade_{5 + i % 4}",
+                    pmf_answer="very_disappointed",
+                    would_pay="yes_probably",
+                    email=f"user{i}@example.com" if i % 2 else None,
+                )
+                for i in range(row_count)
+            ]
+        )
+        test_db.commit()
+        query_counter.clear()
+
+        response = client.get("/api/v1/feedback/stats")
+
+        assert response.status_code == 200
+        assert response.json()["total_count"] == row_count
+        assert len(query_counter) <= 5, query_counter
+
     @pytest.mark.unit
     def test_pmf_score_calculation(self, client: TestClient, test_db) -> None:
         """Test PMF score calculation with various distributions."""
         # Create 10 feedbacks: 4 very_disappointed (40% PMF score)
-        for _ in range(4):
-            test_db.add(FeedbackItem(grade_level="grade_5", pmf_answer="very_disappointed"))
-        for _ in range(3):
-            test_db.add(FeedbackItem(grade_level="grade_5", pmf_answer="somewhat_disappointed"))
-        for _ in range(3):
-            test_db.add(FeedbackItem(grade_level="grade_5", pmf_answer="not_disappointed"))
+        test_db.bulk_save_objects(
+            [FeedbackItem(**_G5_VERY_DISAPPOINTED) for _ in range(4)]
+            + [FeedbackItem(**_G5_SOMEWHAT_DISAPPOINTED) for _ in range(3)]
+            + [FeedbackItem(**_G5_NOT_DISAPPOINTED) for _ in range(3)]
+        )
         test_db.commit()
 
         response = client.get("/api/v1/feedback/stats")
@@ -143,8 +172,7 @@ class TestFeedbackListEndpoint:
     def test_list_pagination(self, client: TestClient, test_db) -> None:
         """Test list endpoint pagination."""
         # Create 25 feedback items
-        for i in range(25):
-            test_db.add(FeedbackItem(grade_level="grade_5", pmf_answer="very_disappointed"))
+        test_db.bulk_save_objects([FeedbackItem(**_G5_VERY_DISAPPOINTED) for _ in range(25)])
         test_db.commit()
 
         # First page
@@ -184,15 +212,14 @@ class TestFeedbackExportEndpoint:
     @pytest.mark.unit
     def test_export_empty_database(self, client: TestClient, test_db) -> None:
         """Test export endpoint with no feedback data."""
-        response = client.get("/api/v1/feedback/export")
-
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "text/csv; charset=utf-8"
-        assert "attachment" in response.headers["content-disposition"]
-        assert "feedback_export.csv" in response.headers["content-disposition"]
+        with client.stream("GET", "/api/v1/feedback/export") as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "text/csv; charset=utf-8"
+            assert "attachment" in response.headers["content-disposition"]
+            assert "feedback_export.csv" in response.headers["content-disposition"]
+            lines = list(response.iter_lines())
 
         # Should have header row only
-        lines = response.text.strip().split("\n")
         assert len(lines) == 1
         assert "ID" in lines[0]
         assert "PMF Answer" in lines[0]
@@ -208,23 +235,29 @@ class TestFeedbackExportEndpoint:
             email="test@example.com",
         )
         test_db.add(feedback)
+        test_db.flush()
+        feedback_id = feedback.id
         test_db.commit()
-        test_db.refresh(feedback)
-
-        response = client.get("/api/v1/feedback/export")
 
-        assert response.status_code == 200
-        lines = response.text.strip().split("\n")
-        assert len(lines) == 2  # Header + 1 data row
-
-        # Check data row contains expected values
-        data_row = lines[1]
-        assert feedback.id in data_row
-        assert "grade_6" in data_row
-        assert "very_disappointed" in data_row
-        assert "yes_definitely" in data_row
-        assert "Great hints" in data_row
-        assert "test@example.com" in data_row
+        with client.stream("GET", "/api/v1/feedback/export") as response:
+            assert response.status_code == 200
+            line_iter = response.iter_lines()
+
+            header = next(line_iter)
+            assert "ID" in header
+            assert "PMF Answer" in header
+
+            # Check data row contains expected values
+            data_row = next(line_iter)
+            assert feedback_id in data_row
+            assert "grade_6" in data_row
+            assert "very_disappointed" in data_row
+            assert "yes_definitely" in data_row
+            assert "Great hints" in data_row
+            assert "test@example.com" in data_row
+
+            # Header + 1 data row
+            assert next(line_iter, None) is None
 
     @pytest.mark.unit
     def test_export_csv_format(self, client: TestClient, test_db) -> None:
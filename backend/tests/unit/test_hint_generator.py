@@ -5,15 +5,32 @@ from backend.models.enums import ProblemType, HintLayer
 from backend.services.hint_generator import HintGenerator
 
 
+@pytest.fixture(scope="module")
+def mock_llm() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def generator(mock_llm: MagicMock) -> HintGenerator:
+    return HintGenerator(llm_client=mock_llm)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_llm(mock_llm: MagicMock) -> None:
+    """The generator is shared per module; only its LLM mock is reset per test."""
+    mock_llm.reset_mock()
+
+
 class TestConceptHintNoAnswer:
     @pytest.mark.unit
-    def test_concept_hint_does_not_contain_numeric_answer(self, mock_llm_client: MagicMock) -> None:
+    def test_concept_hint_does_not_contain_numeric_answer(
+        self, generator: HintGenerator, mock_llm: MagicMock
+    ) -> None:
         """Concept hint for '3x + 5 = 14' must NOT contain 'x = 3' or '= 3'."""
-        mock_llm_client.complete.return_value = (
+        mock_llm.complete.return_value = (
             "这道题是一元一次方程。想一想，什么是方程的解？"
             "我们需要找到一个数，代入x后能使等式成立。"
         )
-        generator = HintGenerator(llm_client=mock_llm_client)
 
         hint = generator.generate(
             problem_text="3x + 5 = 14",
@@ -27,10 +44,11 @@ class TestConceptHintNoAnswer:
         assert "等于3" not in hint.content
 
     @pytest.mark.unit
-    def test_concept_hint_does_not_reveal_steps(self, mock_llm_client: MagicMock) -> None:
+    def test_concept_hint_does_not_reveal_steps(
+        self, generator: HintGenerator, mock_llm: MagicMock
+    ) -> None:
         """Concept hint must NOT reveal solution steps like '移项' with specific values."""
-        mock_llm_client.complete.return_value = "解方程的关键是把未知数和常数分开。你知道怎样做吗？"
-        generator = HintGenerator(llm_client=mock_llm_client)
+        mock_llm.complete.return_value = "解方程的关键是把未知数和常数分开。你知道怎样做吗？"
 
         hint = generator.generate(
             problem_text="3x + 5 = 14",
@@ -43,10 +61,11 @@ class TestConceptHintNoAnswer:
         assert "14 - 5" not in hint.content
 
     @pytest.mark.unit
-    def test_concept_hint_returns_correct_layer(self, mock_llm_client: MagicMock) -> None:
+    def test_concept_hint_returns_correct_layer(
+        self, generator: HintGenerator, mock_llm: MagicMock
+    ) -> None:
         """Generated hint should have CONCEPT layer."""
-        mock_llm_client.complete.return_value = "这是一道关于方程的题目。"
-        generator = HintGenerator(llm_client=mock_llm_client)
+        mock_llm.complete.return_value = "这是一道关于方程的题目。"
 
         hint = generator.generate(
             problem_text="3x + 5 = 14",
@@ -57,10 +76,9 @@ class TestConceptHintNoAnswer:
         assert hint.layer == HintLayer.CONCEPT
 
     @pytest.mark.unit
-    def test_concept_hint_is_not_empty(self, mock_llm_client: MagicMock) -> None:
+    def test_concept_hint_is_not_empty(self, generator: HintGenerator, mock_llm: MagicMock) -> None:
         """Generated hint must have content."""
-        mock_llm_client.complete.return_value = "让我们先回顾一下一元一次方程的概念。"
-        generator = HintGenerator(llm_client=mock_llm_client)
+        mock_llm.complete.return_value = "让我们先回顾一下一元一次方程的概念。"
 
         hint = generator.generate(
             problem_text="3x + 5 = 14",
@@ -71,10 +89,11 @@ class TestConceptHintNoAnswer:
         assert len(hint.content) > 0
 
     @pytest.mark.unit
-    def test_llm_answer_leak_is_filtered(self, mock_llm_client: MagicMock) -> None:
+    def test_llm_answer_leak_is_filtered(
+        self, generator: HintGenerator, mock_llm: MagicMock
+    ) -> None:
         """If LLM accidentally includes answer, post-processor should filter it."""
-        mock_llm_client.complete.return_value = "这道题的答案是x = 3。哦不对，让我引导你思考..."
-        generator = HintGenerator(llm_client=mock_llm_client)
+        mock_llm.complete.return_value = "这道题的答案是x = 3。哦不对，让我引导你思考..."
 
         hint = generator.generate(
             problem_text="3x + 5 = 14",
@@ -88,13 +107,14 @@ class TestConceptHintNoAnswer:
 
 class TestHintGeneratorLayers:
     @pytest.mark.unit
-    def test_strategy_hint_guides_approach(self, mock_llm_client: MagicMock) -> None:
+    def test_strategy_hint_guides_approach(
+        self, generator: HintGenerator, mock_llm: MagicMock
+    ) -> None:
         """Strategy layer should guide solving approach without giving answer."""
-        mock_llm_client.complete.return_value = (
+        mock_llm.complete.return_value = (
             "解一元一次方程的一般步骤是：先移项，再合并同类项，最后求解。"
             "你能试着把含x的项移到等式一边吗？"
         )
-        generator = HintGenerator(llm_client=mock_llm_client)
 
         hint = generator.generate(
             problem_text="3x + 5 = 14",
@@ -106,10 +126,11 @@ class TestHintGeneratorLayers:
         assert "x = 3" not in hint.content
 
     @pytest.mark.unit
-    def test_step_hint_guides_execution(self, mock_llm_client: MagicMock) -> None:
+    def test_step_hint_guides_execution(
+        self, generator: HintGenerator, mock_llm: MagicMock
+    ) -> None:
         """Step layer provides more specific guidance without full solution."""
-        mock_llm_client.complete.return_value = "很好！现在等式两边都减去5，看看会发生什么？"
-        generator = HintGenerator(llm_client=mock_llm_client)
+        mock_llm.complete.return_value = "很好！现在等式两边都减去5，看看会发生什么？"
 
         hint = generator.generate(
             problem_text="3x + 5 = 14",
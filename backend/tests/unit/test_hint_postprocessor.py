@@ -3,73 +3,44 @@ import pytest
 from backend.services.hint_postprocessor import HintPostProcessor
 
 
-class TestNoNegativeWords:
-    """T050: Tests that hints don't contain negative/discouraging words."""
-
-    @pytest.mark.unit
-    def test_detects_错_as_negative(self) -> None:
-        """'错' should be flagged as negative word."""
-        processor = HintPostProcessor()
-
-        result = processor.process("你这样做是错的")
-
-        assert result.was_filtered
-        assert result.filter_reason == "negative_word"
-
-    @pytest.mark.unit
-    def test_detects_不对_as_negative(self) -> None:
-        """'不对' should be flagged as negative word."""
-        processor = HintPostProcessor()
+@pytest.fixture(scope="module")
+def processor() -> HintPostProcessor:
+    """HintPostProcessor is stateless, so one instance serves the whole module."""
+    return HintPostProcessor()
 
-        result = processor.process("这个答案不对，再想想")
 
-        assert result.was_filtered
-        assert result.filter_reason == "negative_word"
-
-    @pytest.mark.unit
-    def test_detects_错误_as_negative(self) -> None:
-        """'错误' should be flagged as negative word."""
-        processor = HintPostProcessor()
-
-        result = processor.process("你犯了一个错误")
-
-        assert result.was_filtered
-        assert result.filter_reason == "negative_word"
-
-    @pytest.mark.unit
-    def test_detects_wrong_as_negative(self) -> None:
-        """'wrong' should be flagged as negative word."""
-        processor = HintPostProcessor()
-
-        result = processor.process("That approach is wrong")
-
-        assert result.was_filtered
-        assert result.filter_reason == "negative_word"
+class TestNoNegativeWords:
+    """T050: Tests that hints don't contain negative/discouraging words."""
 
     @pytest.mark.unit
-    def test_detects_incorrect_as_negative(self) -> None:
-        """'incorrect' should be flagged as negative word."""
-        processor = HintPostProcessor()
-
-        result = processor.process("This is incorrect, try again")
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "你这样做是错的",
+            "这个答案不对，再想想",
+            "你犯了一个错误",
+            "That approach is wrong",
+            "This is incorrect, try again",
+        ],
+        ids=["错", "不对", "错误", "wrong", "incorrect"],
+    )
+    def test_detects_negative_word(self, processor: HintPostProcessor, text: str) -> None:
+        """Hints containing a negative word should be flagged."""
+        result = processor.process(text)
 
         assert result.was_filtered
         assert result.filter_reason == "negative_word"
 
     @pytest.mark.unit
-    def test_encouraging_hint_passes(self) -> None:
+    def test_encouraging_hint_passes(self, processor: HintPostProcessor) -> None:
         """Encouraging hint without negative words should pass."""
-        processor = HintPostProcessor()
-
         result = processor.process("很好！你的思路是对的，继续思考下一步")
 
         assert not result.was_filtered
 
     @pytest.mark.unit
-    def test_neutral_hint_passes(self) -> None:
+    def test_neutral_hint_passes(self, processor: HintPostProcessor) -> None:
         """Neutral educational hint should pass."""
-        processor = HintPostProcessor()
-
         result = processor.process("想一想，等式的基本性质是什么？")
 
         assert not result.was_filtered
@@ -79,48 +50,34 @@ class TestAnswerFiltering:
     """Additional tests for answer leak detection."""
 
     @pytest.mark.unit
-    def test_filters_x_equals_number(self) -> None:
-        """x = N pattern should be filtered."""
-        processor = HintPostProcessor()
-
-        result = processor.process("答案是 x = 5")
-
-        assert result.was_filtered
-        assert result.filter_reason == "answer_leak"
-
-    @pytest.mark.unit
-    def test_filters_chinese_equals(self) -> None:
-        """Chinese '等于' pattern should be filtered."""
-        processor = HintPostProcessor()
-
-        result = processor.process("所以x等于3")
-
-        assert result.was_filtered
-        assert result.filter_reason == "answer_leak"
-
-    @pytest.mark.unit
-    def test_filters_direct_answer_mention(self) -> None:
-        """Direct answer mention should be filtered."""
-        processor = HintPostProcessor()
-
-        result = processor.process("答案是：7", problem_answer="7")
+    @pytest.mark.parametrize(
+        ("text", "problem_answer", "reason"),
+        [
+            ("答案是 x = 5", None, "answer_leak"),
+            ("所以x等于3", None, "answer_leak"),
+            ("答案是：7", "7", "direct_answer_leak"),
+        ],
+        ids=["x_equals_number", "chinese_equals", "direct_answer_mention"],
+    )
+    def test_filters_answer_leak(
+        self, processor: HintPostProcessor, text: str, problem_answer: str | None, reason: str
+    ) -> None:
+        """Hints that reveal the answer should be filtered."""
+        result = processor.process(text, problem_answer=problem_answer)
 
         assert result.was_filtered
+        assert result.filter_reason == reason
 
     @pytest.mark.unit
-    def test_concept_hint_without_answer_passes(self) -> None:
+    def test_concept_hint_without_answer_passes(self, processor: HintPostProcessor) -> None:
         """Concept hint that doesn't reveal answer should pass."""
-        processor = HintPostProcessor()
-
         result = processor.process("这是一道一元一次方程，想想等式的性质")
 
         assert not result.was_filtered
 
     @pytest.mark.unit
-    def test_empty_content_gets_fallback(self) -> None:
+    def test_empty_content_gets_fallback(self, processor: HintPostProcessor) -> None:
         """Empty hint content should get fallback."""
-        processor = HintPostProcessor()
-
         result = processor.process("")
 
         assert result.was_filtered
@@ -132,22 +89,16 @@ class TestIsValid:
     """Tests for the is_valid helper method."""
 
     @pytest.mark.unit
-    def test_valid_hint_returns_true(self) -> None:
+    def test_valid_hint_returns_true(self, processor: HintPostProcessor) -> None:
         """Valid hint should return True."""
-        processor = HintPostProcessor()
-
         assert processor.is_valid("想一想，解方程的第一步是什么？")
 
     @pytest.mark.unit
-    def test_invalid_hint_with_answer_returns_false(self) -> None:
+    def test_invalid_hint_with_answer_returns_false(self, processor: HintPostProcessor) -> None:
         """Hint with answer should return False."""
-        processor = HintPostProcessor()
-
         assert not processor.is_valid("答案是 x = 3")
 
     @pytest.mark.unit
-    def test_invalid_hint_with_negative_returns_false(self) -> None:
+    def test_invalid_hint_with_negative_returns_false(self, processor: HintPostProcessor) -> None:
         """Hint with negative word should return False."""
-        processor = HintPostProcessor()
-
         assert not processor.is_valid("你做错了")
@@ -2,6 +2,7 @@
 
 import pytest
 from datetime import datetime, timezone, timedelta
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from backend.models import (
@@ -14,6 +15,20 @@ from backend.models import (
 )
 from backend.services.learning_summary import LearningSummaryGenerator
 
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz: object = None) -> datetime:  # type: ignore[override]
+        return NOW
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pin the service clock to NOW so in-progress sessions have the intended duration."""
+    monkeypatch.setattr("backend.services.learning_summary.datetime", _FrozenDatetime)
+
 
 @pytest.mark.unit
 class TestLearningSummaryExcellent:
@@ -35,26 +50,20 @@ class TestLearningSummaryExcellent:
             status=SessionStatus.COMPLETED,
             confusion_count=0,
             used_full_solution=False,
-            started_at=datetime.now(timezone.utc) - timedelta(minutes=5),
-            completed_at=datetime.now(timezone.utc),
+            started_at=NOW - timedelta(minutes=5),
+            completed_at=NOW,
         )
         test_db.add(session)
+        test_db.flush()
 
-        event1 = EventLog(
-            session_id="test_excellent",
-            event_type="session_started",
-        )
-        event2 = EventLog(
-            session_id="test_excellent",
-            event_type="reached_strategy_layer",
-        )
-        event3 = EventLog(
-            session_id="test_excellent",
-            event_type="reached_step_layer",
+        test_db.execute(
+            insert(EventLog),
+            [
+                {"session_id": "test_excellent", "event_type": "session_started"},
+                {"session_id": "test_excellent", "event_type": "reached_strategy_layer"},
+                {"session_id": "test_excellent", "event_type": "reached_step_layer"},
+            ],
         )
-        test_db.add(event1)
-        test_db.add(event2)
-        test_db.add(event3)
         test_db.commit()
 
         generator = LearningSummaryGenerator()
@@ -86,8 +95,8 @@ class TestLearningSummaryGood:
             status=SessionStatus.COMPLETED,
             confusion_count=2,
             used_full_solution=False,
-            started_at=datetime.now(timezone.utc) - timedelta(minutes=8),
-            completed_at=datetime.now(timezone.utc),
+            started_at=NOW - timedelta(minutes=8),
+            completed_at=NOW,
         )
         test_db.add(session)
         test_db.commit()
@@ -119,7 +128,7 @@ class TestLearningSummaryNeedsPractice:
             status=SessionStatus.REVEALED,
             confusion_count=3,
             used_full_solution=True,
-            started_at=datetime.now(timezone.utc) - timedelta(minutes=15),
+            started_at=NOW - timedelta(minutes=15),
         )
         test_db.add(session)
         test_db.commit()
@@ -152,13 +161,12 @@ class TestConfusionAnalysis:
             confusion_count=2,
         )
         test_db.add(session)
+        test_db.flush()
 
-        for _ in range(3):
-            event = EventLog(
-                session_id="test_confusion",
-                event_type="strategy_hint_given",
-            )
-            test_db.add(event)
+        test_db.execute(
+            insert(EventLog),
+            [{"session_id": "test_confusion", "event_type": "strategy_hint_given"}] * 3,
+        )
         test_db.commit()
 
         generator = LearningSummaryGenerator()
@@ -185,8 +193,8 @@ class TestTimePacing:
             problem_id=problem.id,
             current_layer=HintLayer.COMPLETED,
             status=SessionStatus.COMPLETED,
-            started_at=datetime.now(timezone.utc) - timedelta(minutes=2),
-            completed_at=datetime.now(timezone.utc),
+            started_at=NOW - timedelta(minutes=2),
+            completed_at=NOW,
         )
         test_db.add(session)
         test_db.commit()
@@ -194,7 +202,8 @@ class TestTimePacing:
         generator = LearningSummaryGenerator()
         summary = generator.generate_session_summary(test_db, "test_fast")
 
-        assert any("quick" in insight.lower() for insight in summary["insights"])
+        insights = " | ".join(summary["insights"]).lower()
+        assert "quick" in insights
 
     def test_slow_pacing(self, test_db: Session) -> None:
         """Test slow pacing detection."""
@@ -210,7 +219,7 @@ class TestTimePacing:
             problem_id=problem.id,
             current_layer=HintLayer.STEP,
             status=SessionStatus.ACTIVE,
-            started_at=datetime.now(timezone.utc) - timedelta(minutes=12),
+            started_at=NOW - timedelta(minutes=12),
         )
         test_db.add(session)
         test_db.commit()
@@ -218,7 +227,8 @@ class TestTimePacing:
         generator = LearningSummaryGenerator()
         summary = generator.generate_session_summary(test_db, "test_slow")
 
-        assert any("time" in insight.lower() for insight in summary["insights"])
+        insights = " | ".join(summary["insights"]).lower()
+        assert "time" in insights
 
 
 @pytest.mark.unit
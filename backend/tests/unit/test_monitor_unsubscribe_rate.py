@@ -0,0 +1,78 @@
+"""Unit tests for the SendGrid unsubscribe rate monitor script."""
+
+import importlib.util
+from collections.abc import Iterator
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parents[3] / "scripts" / "monitor_unsubscribe_rate.py"
+
+
+@pytest.fixture(scope="module")
+def monitor() -> ModuleType:
+    """Load scripts/monitor_unsubscribe_rate.py, which is not part of a package."""
+    spec = importlib.util.spec_from_file_location("monitor_unsubscribe_rate", SCRIPT_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _events(delivered: int, unsubscribed: int) -> list[dict[str, str]]:
+    """Interleave unsubscribes evenly among deliveries."""
+    events = [{"event": "delivered"} for _ in range(delivered)]
+    step = max(1, delivered // max(1, unsubscribed))
+    for i in range(unsubscribed):
+        events.insert(i * (step + 1), {"event": "unsubscribe"})
+    return events
+
+
+class TestCalculateMetricsEarlyExit:
+    @pytest.mark.unit
+    def test_counts_every_event_by_default(self, monitor: ModuleType) -> None:
+        """A critical first chunk does not decide the verdict without the opt-in."""
+        critical_start = _events(delivered=9_000, unsubscribed=1_000)
+        healthy_rest = _events(delivered=100_000, unsubscribed=0)
+
+        metrics = monitor.SendGridEventMonitor("key").calculate_metrics(
+            iter(critical_start + healthy_rest)
+        )
+
+        assert metrics["total_delivered"] == 109_000
+        assert metrics["status"] == "HEALTHY"
+        assert "partial" not in metrics
+
+    @pytest.mark.unit
+    def test_stops_after_first_critical_chunk_when_requested(self, monitor: ModuleType) -> None:
+        """With stop_when_critical the stream is abandoned at the first critical check."""
+        consumed = 0
+
+        def stream() -> Iterator[dict[str, str]]:
+            nonlocal consumed
+            for event in _events(delivered=9_000, unsubscribed=1_000) + _events(50_000, 0):
+                consumed += 1
+                yield event
+
+        metrics = monitor.SendGridEventMonitor("key").calculate_metrics(
+            stream(), stop_when_critical=True
+        )
+
+        assert consumed == monitor.EARLY_EXIT_CHECK_INTERVAL
+        assert metrics["status"] == "CRITICAL"
+        assert metrics["partial"] is True
+        assert metrics["total_delivered"] == 9_000
+
+    @pytest.mark.unit
+    def test_needs_minimum_deliveries_before_stopping(self, monitor: ModuleType) -> None:
+        """A critical rate over too few deliveries keeps counting."""
+        opens = [{"event": "open"}] * (monitor.EARLY_EXIT_CHECK_INTERVAL - 600)
+        events = _events(delivered=500, unsubscribed=100) + opens + _events(20_000, 0)
+
+        metrics = monitor.SendGridEventMonitor("key").calculate_metrics(
+            iter(events), stop_when_critical=True
+        )
+
+        assert metrics["total_delivered"] == 20_500
+        assert "partial" not in metrics
@@ -1,54 +1,68 @@
 """Unit tests for PDF report generation."""
 
+import asyncio
+import io
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from backend.api.reports import PDF_CHUNK_SIZE, _iter_pdf_chunks
 from backend.models import HintSession, Problem, EventLog, HintLayer, SessionStatus, ProblemType
 from backend.utils.validation import generate_session_id
 
 
-@pytest.mark.unit
-class TestPDFReportGeneration:
-    """Test PDF report generation endpoint."""
+@pytest.fixture
+def pdf_session(test_db: Session) -> tuple[str, str]:
+    """Create a completed session with a couple of events; return (session_id, token)."""
+    session_id = generate_session_id()
+    access_token = HintSession.generate_access_token()
 
-    def test_pdf_report_returns_correct_content_type(
-        self, client: TestClient, test_db: Session
-    ) -> None:
-        """Test that PDF endpoint returns application/pdf content type."""
-        # Create a test session
-        session_id = generate_session_id()
-        problem = Problem(
-            raw_text="Solve 2x + 5 = 11",
-            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
-        )
-        test_db.add(problem)
-        test_db.flush()
+    problem = Problem(
+        raw_text="Solve 2x + 5 = 11",
+        problem_type=ProblemType.LINEAR_EQUATION_1VAR,
+    )
+    test_db.add(problem)
+    test_db.flush()
 
-        access_token = HintSession.generate_access_token()
-        session = HintSession(
+    test_db.add(
+        HintSession(
             id=session_id,
             problem_id=problem.id,
             current_layer=HintLayer.COMPLETED,
             status=SessionStatus.COMPLETED,
             session_access_token=access_token,
         )
-        test_db.add(session)
+    )
+    test_db.flush()
+    EventLog.bulk_log(
+        test_db,
+        [
+            {
+                "session_id": session_id,
+                "event_type": "session_started",
+                "details": {"problem_type": "linear_equation_1var"},
+            },
+            {
+                "session_id": session_id,
+                "event_type": "concept_hint_given",
+                "details": {"sequence": 1},
+            },
+        ],
+    )
+    test_db.commit()
+    return session_id, access_token
 
-        # Add some events
-        event1 = EventLog(
-            session_id=session_id,
-            event_type="session_started",
-            details={"problem_type": "linear_equation_1var"},
-        )
-        event2 = EventLog(
-            session_id=session_id,
-            event_type="concept_hint_given",
-            details={"sequence": 1},
-        )
-        test_db.add(event1)
-        test_db.add(event2)
-        test_db.commit()
+
+@pytest.mark.unit
+class TestPDFReportGeneration:
+    """Test PDF report generation endpoint."""
+
+    def test_pdf_report_returns_correct_content_type(
+        self, client: TestClient, pdf_session: tuple[str, str]
+    ) -> None:
+        """Test that PDF endpoint returns application/pdf content type."""
+        session_id, access_token = pdf_session
 
         # Request PDF with session access token
         response = client.get(
@@ -61,39 +75,31 @@ class TestPDFReportGeneration:
         assert "attachment" in response.headers["content-disposition"]
         assert f"stepwise_session_{session_id}.pdf" in response.headers["content-disposition"]
 
-    def test_pdf_report_contains_content(self, client: TestClient, test_db: Session) -> None:
+    def test_pdf_report_contains_content(
+        self, client: TestClient, pdf_session: tuple[str, str]
+    ) -> None:
         """Test that PDF contains actual content (not empty)."""
-        # Create a test session
-        session_id = generate_session_id()
-        problem = Problem(
-            raw_text="Calculate 15 + 27",
-            problem_type=ProblemType.ARITHMETIC,
-        )
-        test_db.add(problem)
-        test_db.flush()
-
-        access_token = HintSession.generate_access_token()
-        session = HintSession(
-            id=session_id,
-            problem_id=problem.id,
-            current_layer=HintLayer.STEP,
-            status=SessionStatus.ACTIVE,
-            session_access_token=access_token,
-        )
-        test_db.add(session)
-        test_db.commit()
+        session_id, access_token = pdf_session
 
         # Request PDF with session access token
-        response = client.get(
+        with client.stream(
+            "GET",
             f"/api/v1/reports/session/{session_id}/pdf",
             headers={"X-Session-Access-Token": access_token},
-        )
+        ) as response:
+            assert response.status_code == 200
+            # PDF should have content (at least 1KB for a minimal PDF)
+            assert int(response.headers["content-length"]) > 1000
+
+            # Only read enough of the stream to check the header
+            head = b""
+            for chunk in response.iter_bytes():
+                head += chunk
+                if len(head) >= 4096:
+                    break
 
-        assert response.status_code == 200
-        # PDF should have content (at least 1KB for a minimal PDF)
-        assert len(response.content) > 1000
         # PDF files start with %PDF
-        assert response.content[:4] == b"%PDF"
+        assert head[:4] == b"%PDF"
 
     def test_pdf_report_not_found_for_invalid_session(self, client: TestClient) -> None:
         """Test that requesting PDF for non-existent session returns 404."""
@@ -107,3 +113,20 @@ class TestPDFReportGeneration:
         assert response.status_code == 404
         data = response.json()
         assert data["error"] == "SESSION_NOT_FOUND"
+
+
+@pytest.mark.unit
+def test_pdf_chunks_cover_buffer_and_close_it() -> None:
+    """Chunks are at most PDF_CHUNK_SIZE, reassemble the buffer, and close it."""
+    payload = b"%PDF" + bytes(range(256)) * (PDF_CHUNK_SIZE // 100)
+    buffer = io.BytesIO(payload)
+
+    async def collect() -> list[bytes]:
+        return [chunk async for chunk in _iter_pdf_chunks(buffer)]
+
+    chunks = asyncio.run(collect())
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= PDF_CHUNK_SIZE for chunk in chunks)
+    assert b"".join(chunks) == payload
+    assert buffer.closed
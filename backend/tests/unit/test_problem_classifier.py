@@ -5,84 +5,155 @@ from backend.models.enums import ProblemType
 from backend.services.problem_classifier import ProblemClassifier
 
 
+@pytest.fixture(scope="module")
+def llm() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def classifier(llm: MagicMock) -> ProblemClassifier:
+    return ProblemClassifier(llm_client=llm)
+
+
+@pytest.fixture(autouse=True)
+def _reset_classifier(llm: MagicMock, classifier: ProblemClassifier) -> None:
+    """Shared classifier: forget calls and memoized results from earlier tests."""
+    llm.reset_mock()
+    classifier.clear_cache()
+
+
 class TestClassifyLinearEquation:
     @pytest.mark.unit
-    def test_classify_simple_linear_equation(self, mock_llm_client: MagicMock) -> None:
-        """3x + 5 = 14 should be classified as LINEAR_EQUATION_1VAR."""
-        mock_llm_client.classify.return_value = "linear_equation_1var"
-        classifier = ProblemClassifier(llm_client=mock_llm_client)
+    @pytest.mark.parametrize(
+        ("text", "llm_out", "expected"),
+        [
+            ("3x + 5 = 14", "linear_equation_1var", ProblemType.LINEAR_EQUATION_1VAR),
+            ("2x - 7 = 15", "linear_equation_1var", ProblemType.LINEAR_EQUATION_1VAR),
+            ("解方程：3x加5等于14", "linear_equation_1var", ProblemType.LINEAR_EQUATION_1VAR),
+            # Invalid LLM output falls back to the rules
+            ("3x + 5 = 14", "invalid_type", ProblemType.LINEAR_EQUATION_1VAR),
+        ],
+        ids=["simple", "subtraction", "natural_language", "fallback_when_llm_fails"],
+    )
+    def test_classify_linear_equation(
+        self,
+        classifier: ProblemClassifier,
+        llm: MagicMock,
+        text: str,
+        llm_out: str,
+        expected: ProblemType,
+    ) -> None:
+        """Linear equations should be classified as LINEAR_EQUATION_1VAR."""
+        llm.classify.return_value = llm_out
+
+        assert classifier.classify(text) == expected
+        llm.classify.assert_called_once_with(text)
+
+    @pytest.mark.unit
+    def test_fallback_without_llm(self) -> None:
+        """Rule-based classification should work without LLM."""
+        classifier = ProblemClassifier(llm_client=None)
 
         result = classifier.classify("3x + 5 = 14")
 
         assert result == ProblemType.LINEAR_EQUATION_1VAR
 
+
+class TestClassifyOtherTypes:
     @pytest.mark.unit
-    def test_classify_linear_equation_with_subtraction(self, mock_llm_client: MagicMock) -> None:
-        """2x - 7 = 15 should be classified as LINEAR_EQUATION_1VAR."""
-        mock_llm_client.classify.return_value = "linear_equation_1var"
-        classifier = ProblemClassifier(llm_client=mock_llm_client)
+    @pytest.mark.parametrize(
+        ("text", "llm_out", "expected"),
+        [
+            ("x² + 2x - 3 = 0", "quadratic_equation", ProblemType.QUADRATIC_EQUATION),
+            ("x + y = 5, 2x - y = 1", "linear_equation_2var", ProblemType.LINEAR_EQUATION_2VAR),
+        ],
+        ids=["quadratic_equation", "two_variable_linear"],
+    )
+    def test_classify_other_types(
+        self,
+        classifier: ProblemClassifier,
+        llm: MagicMock,
+        text: str,
+        llm_out: str,
+        expected: ProblemType,
+    ) -> None:
+        """LLM classifications for other problem types should be returned as-is."""
+        llm.classify.return_value = llm_out
+
+        assert classifier.classify(text) == expected
 
-        result = classifier.classify("2x - 7 = 15")
+    @pytest.mark.unit
+    def test_classify_unknown_problem(self, mock_llm_client: MagicMock) -> None:
+        """Unrecognizable input should return UNKNOWN."""
+        mock_llm_client.classify.return_value = "unknown"
+        classifier = ProblemClassifier(llm_client=None)
+
+        result = classifier.classify("今天天气真好")
+
+        assert result == ProblemType.UNKNOWN
 
-        assert result == ProblemType.LINEAR_EQUATION_1VAR
 
+class TestClassifierCache:
     @pytest.mark.unit
-    def test_classify_linear_equation_natural_language(self, mock_llm_client: MagicMock) -> None:
-        """Natural language description should also be classified correctly."""
+    def test_repeated_text_calls_llm_once(self, mock_llm_client: MagicMock) -> None:
+        """Identical problem texts should reuse the first LLM classification."""
         mock_llm_client.classify.return_value = "linear_equation_1var"
         classifier = ProblemClassifier(llm_client=mock_llm_client)
 
-        result = classifier.classify("解方程：3x加5等于14")
+        first = classifier.classify("3x + 5 = 14")
+        second = classifier.classify("3x + 5 = 14")
 
-        assert result == ProblemType.LINEAR_EQUATION_1VAR
+        assert first == second == ProblemType.LINEAR_EQUATION_1VAR
+        mock_llm_client.classify.assert_called_once_with("3x + 5 = 14")
 
     @pytest.mark.unit
-    def test_fallback_when_llm_fails(self, mock_llm_client: MagicMock) -> None:
-        """Rule-based fallback should work when LLM returns invalid result."""
-        mock_llm_client.classify.return_value = "invalid_type"
+    def test_surrounding_whitespace_shares_cache_entry(self, mock_llm_client: MagicMock) -> None:
+        """Texts differing only in leading/trailing whitespace share one entry."""
+        mock_llm_client.classify.return_value = "linear_equation_1var"
         classifier = ProblemClassifier(llm_client=mock_llm_client)
 
-        result = classifier.classify("3x + 5 = 14")
+        classifier.classify("3x + 5 = 14")
+        classifier.classify("  3x + 5 = 14\n")
 
-        assert result == ProblemType.LINEAR_EQUATION_1VAR
+        mock_llm_client.classify.assert_called_once_with("3x + 5 = 14")
 
     @pytest.mark.unit
-    def test_fallback_without_llm(self) -> None:
-        """Rule-based classification should work without LLM."""
-        classifier = ProblemClassifier(llm_client=None)
-
-        result = classifier.classify("3x + 5 = 14")
+    def test_unparseable_llm_result_is_not_cached(self, mock_llm_client: MagicMock) -> None:
+        """Fallback results should not pin a bad LLM answer in the cache."""
+        mock_llm_client.classify.return_value = "invalid_type"
+        classifier = ProblemClassifier(llm_client=mock_llm_client)
 
-        assert result == ProblemType.LINEAR_EQUATION_1VAR
+        classifier.classify("3x + 5 = 14")
+        mock_llm_client.classify.return_value = "quadratic_equation"
 
+        assert classifier.classify("3x + 5 = 14") == ProblemType.QUADRATIC_EQUATION
 
-class TestClassifyOtherTypes:
     @pytest.mark.unit
-    def test_classify_quadratic_equation(self, mock_llm_client: MagicMock) -> None:
-        """x² + 2x - 3 = 0 should be classified as QUADRATIC_EQUATION."""
-        mock_llm_client.classify.return_value = "quadratic_equation"
+    def test_clear_cache_forces_new_llm_call(self, mock_llm_client: MagicMock) -> None:
+        """clear_cache() should drop memoized classifications."""
+        mock_llm_client.classify.return_value = "linear_equation_1var"
         classifier = ProblemClassifier(llm_client=mock_llm_client)
 
-        result = classifier.classify("x² + 2x - 3 = 0")
+        classifier.classify("3x + 5 = 14")
+        classifier.clear_cache()
+        classifier.classify("3x + 5 = 14")
 
-        assert result == ProblemType.QUADRATIC_EQUATION
+        assert mock_llm_client.classify.call_count == 2
 
     @pytest.mark.unit
-    def test_classify_two_variable_linear(self, mock_llm_client: MagicMock) -> None:
-        """System of equations should be classified as LINEAR_EQUATION_2VAR."""
-        mock_llm_client.classify.return_value = "linear_equation_2var"
+    def test_cache_evicts_least_recently_used(self, mock_llm_client: MagicMock) -> None:
+        """The cache should stay bounded at CACHE_MAXSIZE entries."""
+        mock_llm_client.classify.return_value = "linear_equation_1var"
         classifier = ProblemClassifier(llm_client=mock_llm_client)
+        classifier.CACHE_MAXSIZE = 2
 
-        result = classifier.classify("x + y = 5, 2x - y = 1")
+        classifier.classify("x = 1")
+        classifier.classify("x = 2")
+        classifier.classify("x = 1")  # refresh
+        classifier.classify("x = 3")  # evicts "x = 2"
+        mock_llm_client.classify.reset_mock()
 
-        assert result == ProblemType.LINEAR_EQUATION_2VAR
+        classifier.classify("x = 1")
+        classifier.classify("x = 2")
 
-    @pytest.mark.unit
-    def test_classify_unknown_problem(self, mock_llm_client: MagicMock) -> None:
-        """Unrecognizable input should return UNKNOWN."""
-        mock_llm_client.classify.return_value = "unknown"
-        classifier = ProblemClassifier(llm_client=None)
-
-        result = classifier.classify("今天天气真好")
-
-        assert result == ProblemType.UNKNOWN
+        mock_llm_client.classify.assert_called_once_with("x = 2")
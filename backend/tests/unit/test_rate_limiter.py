@@ -1,24 +1,73 @@
 """Unit tests for rate limiter service."""
 
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from backend.services.rate_limiter import RateLimiter, RateLimitConfig
+from backend.services.rate_limiter import (
+    BaseRateLimiter,
+    RateLimiter,
+    RateLimitConfig,
+    RedisRateLimiter,
+    create_rate_limiter,
+)
+
+LimiterFactory = Callable[[RateLimitConfig], BaseRateLimiter]
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def redis_client():
+    """In-process Redis with Lua support (fakeredis[lua])."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture(params=["memory", "redis-sliding", "redis-fixed"])
+def make_limiter(request: pytest.FixtureRequest) -> LimiterFactory:
+    """Build limiters for each backend so behavior tests run against all of them."""
+    if request.param == "memory":
+        return RateLimiter
+
+    client = request.getfixturevalue("redis_client")
+    strategy = request.param.split("-", 1)[1]
+    return lambda config: RedisRateLimiter(config, client, strategy=strategy)
 
 
 class TestRateLimiterBasic:
     """Test basic rate limiter functionality."""
 
-    def test_allows_requests_under_limit(self) -> None:
+    def test_allows_requests_under_limit(self, make_limiter: LimiterFactory) -> None:
         """Requests under the limit should be allowed."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=5, window_seconds=60))
+        limiter = make_limiter(RateLimitConfig(max_requests=5, window_seconds=60))
 
         for i in range(5):
             assert limiter.is_allowed("client1") is True
 
-    def test_blocks_requests_over_limit(self) -> None:
+    def test_blocks_requests_over_limit(self, make_limiter: LimiterFactory) -> None:
         """Requests over the limit should be blocked."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=3, window_seconds=60))
+        limiter = make_limiter(RateLimitConfig(max_requests=3, window_seconds=60))
 
         # First 3 requests should be allowed
         for i in range(3):
@@ -27,9 +76,9 @@ class TestRateLimiterBasic:
         # 4th request should be blocked
         assert limiter.is_allowed("client1") is False
 
-    def test_different_clients_have_separate_limits(self) -> None:
+    def test_different_clients_have_separate_limits(self, make_limiter: LimiterFactory) -> None:
         """Different clients should have independent rate limits."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=60))
+        limiter = make_limiter(RateLimitConfig(max_requests=2, window_seconds=60))
 
         # Client 1 uses their quota
         assert limiter.is_allowed("client1") is True
@@ -42,59 +91,67 @@ class TestRateLimiterBasic:
         assert limiter.is_allowed("client2") is False
 
 
-class TestRateLimiterSlidingWindow:
-    """Test sliding window behavior."""
+class TestRateLimiterRefill:
+    """Test token-bucket refill behavior."""
 
-    def test_old_requests_are_removed_from_window(self) -> None:
-        """Requests outside the window should not count toward limit."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=1))
+    def test_bucket_refills_after_window(self, clock: FakeClock) -> None:
+        """A drained bucket should be full again after one window."""
+        limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=1), clock=clock)
 
         # Make 2 requests (hit limit)
         assert limiter.is_allowed("client1") is True
         assert limiter.is_allowed("client1") is True
         assert limiter.is_allowed("client1") is False
 
-        # Wait for window to pass
-        time.sleep(1.1)
+        # Let the window pass
+        clock.advance(1.1)
 
         # Should be able to make requests again
         assert limiter.is_allowed("client1") is True
+        assert limiter.is_allowed("client1") is True
+        assert limiter.is_allowed("client1") is False
 
-    def test_partial_window_reset(self) -> None:
-        """Only requests outside window should be removed."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=3, window_seconds=2))
+    def test_tokens_refill_gradually(self, clock: FakeClock) -> None:
+        """Tokens come back at max_requests / window_seconds per second."""
+        limiter = RateLimiter(RateLimitConfig(max_requests=3, window_seconds=3), clock=clock)
 
-        # Make 2 requests
-        assert limiter.is_allowed("client1") is True
-        assert limiter.is_allowed("client1") is True
+        # Drain the bucket
+        for _ in range(3):
+            assert limiter.is_allowed("client1") is True
+        assert limiter.is_allowed("client1") is False
 
-        # Wait 1 second
-        time.sleep(1.1)
+        # One second refills exactly one token
+        clock.advance(1.0)
 
-        # Make 1 more request (total 3, at limit)
         assert limiter.is_allowed("client1") is True
         assert limiter.is_allowed("client1") is False  # Should be blocked
 
-        # Wait another second (first 2 requests should expire)
-        time.sleep(1.1)
+    @pytest.mark.slow
+    def test_bucket_refills_with_real_clock(self) -> None:
+        """End-to-end refill against the default monotonic clock."""
+        limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=1))
 
-        # Should be able to make 2 more requests
         assert limiter.is_allowed("client1") is True
         assert limiter.is_allowed("client1") is True
+        assert limiter.is_allowed("client1") is False
+
+        time.sleep(1.1)
+
+        assert limiter.is_allowed("client1") is True
 
 
 class TestRateLimiterGetRemaining:
     """Test get_remaining method."""
 
-    def test_get_remaining_starts_at_max(self) -> None:
+    def test_get_remaining_starts_at_max(self, make_limiter: LimiterFactory) -> None:
         """Remaining should start at max_requests."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=5, window_seconds=60))
+        limiter = make_limiter(RateLimitConfig(max_requests=5, window_seconds=60))
 
         assert limiter.get_remaining("client1") == 5
 
-    def test_get_remaining_decreases_with_requests(self) -> None:
+    def test_get_remaining_decreases_with_requests(self, make_limiter: LimiterFactory) -> None:
         """Remaining should decrease as requests are made."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=5, window_seconds=60))
+        limiter = make_limiter(RateLimitConfig(max_requests=5, window_seconds=60))
 
         limiter.is_allowed("client1")
         assert limiter.get_remaining("client1") == 4
@@ -102,9 +159,9 @@ class TestRateLimiterGetRemaining:
         limiter.is_allowed("client1")
         assert limiter.get_remaining("client1") == 3
 
-    def test_get_remaining_never_negative(self) -> None:
+    def test_get_remaining_never_negative(self, make_limiter: LimiterFactory) -> None:
         """Remaining should not go below zero."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=60))
+        limiter = make_limiter(RateLimitConfig(max_requests=2, window_seconds=60))
 
         limiter.is_allowed("client1")
         limiter.is_allowed("client1")
@@ -124,20 +181,19 @@ class TestRateLimiterGetRetryAfter:
         assert limiter.get_retry_after("client1") == 0
 
     def test_get_retry_after_when_rate_limited(self) -> None:
-        """Retry after should return seconds until window resets."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=5))
+        """Retry after should return seconds until the next token is available."""
+        limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=5), clock=FakeClock())
 
         # Hit the limit
         limiter.is_allowed("client1")
         limiter.is_allowed("client1")
 
-        # Should need to wait ~5 seconds
-        retry_after = limiter.get_retry_after("client1")
-        assert 4 <= retry_after <= 6  # Allow some timing variance
+        # One token refills every 2.5 seconds, rounded up
+        assert limiter.get_retry_after("client1") == 3
 
-    def test_get_retry_after_decreases_over_time(self) -> None:
+    def test_get_retry_after_decreases_over_time(self, clock: FakeClock) -> None:
         """Retry after should decrease as time passes."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=3))
+        limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=3), clock=clock)
 
         # Hit the limit
         limiter.is_allowed("client1")
@@ -145,8 +201,8 @@ class TestRateLimiterGetRetryAfter:
 
         retry_after_1 = limiter.get_retry_after("client1")
 
-        # Wait a bit
-        time.sleep(1)
+        # Let a second pass
+        clock.advance(1)
 
         retry_after_2 = limiter.get_retry_after("client1")
 
@@ -157,9 +213,9 @@ class TestRateLimiterGetRetryAfter:
 class TestRateLimiterReset:
     """Test reset functionality."""
 
-    def test_reset_single_client(self) -> None:
+    def test_reset_single_client(self, make_limiter: LimiterFactory) -> None:
         """Reset should clear rate limit for specific client."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=60))
+        limiter = make_limiter(RateLimitConfig(max_requests=2, window_seconds=60))
 
         # Hit limit for client1
         limiter.is_allowed("client1")
@@ -172,9 +228,9 @@ class TestRateLimiterReset:
         # Should be able to make requests again
         assert limiter.is_allowed("client1") is True
 
-    def test_reset_all_clients(self) -> None:
+    def test_reset_all_clients(self, make_limiter: LimiterFactory) -> None:
         """Reset with no client_id should clear all limits."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=60))
+        limiter = make_limiter(RateLimitConfig(max_requests=2, window_seconds=60))
 
         # Hit limits for multiple clients
         limiter.is_allowed("client1")
@@ -192,9 +248,9 @@ class TestRateLimiterReset:
         assert limiter.is_allowed("client1") is True
         assert limiter.is_allowed("client2") is True
 
-    def test_reset_nonexistent_client_does_not_error(self) -> None:
+    def test_reset_nonexistent_client_does_not_error(self, make_limiter: LimiterFactory) -> None:
         """Resetting non-existent client should not raise error."""
-        limiter = RateLimiter(RateLimitConfig(max_requests=5, window_seconds=60))
+        limiter = make_limiter(RateLimitConfig(max_requests=5, window_seconds=60))
 
         # Should not raise
         limiter.reset("nonexistent_client")
@@ -203,22 +259,100 @@ class TestRateLimiterReset:
 class TestRateLimiterConcurrency:
     """Test thread safety (basic smoke test)."""
 
-    def test_concurrent_requests_do_not_exceed_limit(self) -> None:
+    def test_concurrent_requests_do_not_exceed_limit(self, make_limiter: LimiterFactory) -> None:
         """Concurrent requests should still respect the limit."""
-        import threading
-
-        limiter = RateLimiter(RateLimitConfig(max_requests=10, window_seconds=60))
-        results = []
+        limiter = make_limiter(RateLimitConfig(max_requests=10, window_seconds=60))
+        barrier = threading.Barrier(15)
 
-        def make_request():
-            results.append(limiter.is_allowed("client1"))
+        def make_request() -> bool:
+            # Release all workers at once to maximize contention
+            barrier.wait()
+            return limiter.is_allowed("client1")
 
         # Make 15 concurrent requests
-        threads = [threading.Thread(target=make_request) for _ in range(15)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        with ThreadPoolExecutor(max_workers=15) as executor:
+            futures = [executor.submit(make_request) for _ in range(15)]
+            results = [future.result() for future in futures]
 
         # Exactly 10 should be allowed
         assert sum(results) == 10
+
+
+class TestRedisRateLimiter:
+    """Redis-specific behavior."""
+
+    @pytest.mark.parametrize("strategy", ["sliding", "fixed"])
+    def test_limit_is_shared_across_instances(self, redis_client, strategy: str) -> None:
+        """Limiters in different workers share one counter through Redis."""
+        config = RateLimitConfig(max_requests=2, window_seconds=60)
+        worker_a = RedisRateLimiter(config, redis_client, strategy=strategy)
+        worker_b = RedisRateLimiter(config, redis_client, strategy=strategy)
+
+        assert worker_a.is_allowed("client1") is True
+        assert worker_b.is_allowed("client1") is True
+        assert worker_a.is_allowed("client1") is False
+        assert worker_b.is_allowed("client1") is False
+
+    @pytest.mark.parametrize("strategy", ["sliding", "fixed"])
+    def test_get_retry_after_when_rate_limited(self, redis_client, strategy: str) -> None:
+        """Retry after should be within the window once the limit is hit."""
+        limiter = RedisRateLimiter(
+            RateLimitConfig(max_requests=1, window_seconds=5), redis_client, strategy=strategy
+        )
+
+        assert limiter.get_retry_after("client1") == 0
+        limiter.is_allowed("client1")
+
+        assert 1 <= limiter.get_retry_after("client1") <= 6
+
+    def test_unknown_strategy_raises(self, redis_client) -> None:
+        """Only the sliding and fixed strategies are supported."""
+        with pytest.raises(ValueError):
+            RedisRateLimiter(RateLimitConfig(), redis_client, strategy="leaky")
+
+    def test_fails_open_when_redis_is_unreachable(self, redis_client) -> None:
+        """A Redis outage lets requests through instead of raising."""
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+        server.connected = False
+        limiter = RedisRateLimiter(
+            RateLimitConfig(max_requests=1, window_seconds=60), fakeredis.FakeRedis(server=server)
+        )
+
+        assert limiter.is_allowed("client1") is True
+        assert limiter.is_allowed("client1") is True
+        assert limiter.get_remaining("client1") == 1
+        assert limiter.get_retry_after("client1") == 0
+
+
+class TestCreateRateLimiter:
+    """Test limiter backend selection."""
+
+    def test_in_memory_without_redis_url(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without RATE_LIMIT_REDIS_URL the in-memory limiter is used."""
+        monkeypatch.delenv("RATE_LIMIT_REDIS_URL", raising=False)
+
+        limiter = create_rate_limiter(RateLimitConfig(), "stats")
+
+        assert type(limiter) is RateLimiter
+
+    def test_redis_with_redis_url(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """RATE_LIMIT_REDIS_URL selects the Redis-backed limiter."""
+        pytest.importorskip("redis")
+        monkeypatch.setenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+
+        limiter = create_rate_limiter(RateLimitConfig(), "stats")
+
+        assert isinstance(limiter, RedisRateLimiter)
+
+    def test_unknown_strategy_falls_back_to_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An unknown RATE_LIMIT_STRATEGY logs and uses the default instead of raising."""
+        pytest.importorskip("redis")
+        monkeypatch.setenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+        monkeypatch.setenv("RATE_LIMIT_STRATEGY", "leaky")
+
+        limiter = create_rate_limiter(RateLimitConfig(), "stats")
+
+        assert isinstance(limiter, RedisRateLimiter)
+        assert limiter._strategy == RedisRateLimiter.DEFAULT_STRATEGY
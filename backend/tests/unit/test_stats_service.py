@@ -2,19 +2,41 @@
 
 import pytest
 from datetime import datetime, timezone, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import create_autospec
 
-from backend.models.enums import HintLayer, SessionStatus
+from sqlalchemy.orm import Session
+
+from backend.models.enums import HintLayer, ProblemType, SessionStatus
+from backend.models.problem import Problem
+from backend.models.session import HintSession
 from backend.services.stats_service import StatsService
 
 
+@pytest.fixture
+def seeded_sessions(test_db) -> None:
+    """10 sessions: 4 completed, 2 revealed, 4 active."""
+    problem = Problem(raw_text="2x = 8", problem_type=ProblemType.LINEAR_EQUATION_1VAR)
+    test_db.add(problem)
+    test_db.flush()
+
+    rows = (
+        [(SessionStatus.COMPLETED, HintLayer.STRATEGY)] * 4
+        + [(SessionStatus.REVEALED, HintLayer.REVEALED)] * 2
+        + [(SessionStatus.ACTIVE, HintLayer.CONCEPT)] * 4
+    )
+    test_db.add_all(
+        [
+            HintSession(problem_id=problem.id, status=status, current_layer=layer)
+            for status, layer in rows
+        ]
+    )
+    test_db.commit()
+
+
 class TestStatsSummaryEmpty:
     @pytest.mark.unit
-    def test_returns_zeros_when_no_sessions(self) -> None:
-        mock_db = MagicMock()
-        mock_db.query.return_value.count.return_value = 0
-
-        service = StatsService(mock_db)
+    def test_returns_zeros_when_no_sessions(self, test_db) -> None:
+        service = StatsService(test_db)
         summary = service.get_summary()
 
         assert summary.total_sessions == 0
@@ -23,135 +45,81 @@ class TestStatsSummaryEmpty:
         assert summary.completion_rate == 0.0
 
     @pytest.mark.unit
-    def test_returns_none_for_avg_layer_when_no_sessions(self) -> None:
-        mock_db = MagicMock()
-        mock_db.query.return_value.count.return_value = 0
-
-        service = StatsService(mock_db)
+    def test_returns_none_for_avg_layer_when_no_sessions(self, test_db) -> None:
+        service = StatsService(test_db)
         summary = service.get_summary()
 
         assert summary.avg_layers_to_complete is None
 
 
+@pytest.mark.usefixtures("seeded_sessions")
 class TestStatsSummaryWithData:
     @pytest.mark.unit
-    def test_counts_total_sessions(self) -> None:
-        mock_db = MagicMock()
-        mock_query = mock_db.query.return_value
-        mock_query.count.return_value = 10
-
-        call_count = [0]
-
-        def filter_side_effect(*args, **kwargs):
-            result = MagicMock()
-            result.count.return_value = 3
-            result.all.return_value = []
-            call_count[0] += 1
-            return result
-
-        mock_query.filter.side_effect = filter_side_effect
-
-        service = StatsService(mock_db)
-        summary = service.get_summary()
+    def test_counts_total_sessions(self, test_db) -> None:
+        summary = StatsService(test_db).get_summary()
 
         assert summary.total_sessions == 10
+        assert summary.active_sessions == 4
 
     @pytest.mark.unit
-    def test_calculates_completion_rate(self) -> None:
-        mock_db = MagicMock()
-        mock_query = mock_db.query.return_value
-        mock_query.count.return_value = 10
-
-        call_count = [0]
-
-        def filter_side_effect(*args, **kwargs):
-            result = MagicMock()
-            if call_count[0] == 0:
-                result.count.return_value = 4
-            elif call_count[0] == 1:
-                result.count.return_value = 2
-            elif call_count[0] == 2:
-                result.count.return_value = 2
-            else:
-                result.all.return_value = []
-            result.all.return_value = []
-            call_count[0] += 1
-            return result
-
-        mock_query.filter.side_effect = filter_side_effect
-
-        service = StatsService(mock_db)
-        summary = service.get_summary()
+    def test_calculates_completion_rate(self, test_db) -> None:
+        summary = StatsService(test_db).get_summary()
 
         assert summary.completion_rate == 60.0
 
     @pytest.mark.unit
-    def test_separates_completed_and_revealed(self) -> None:
-        mock_db = MagicMock()
-        mock_query = mock_db.query.return_value
-        mock_query.count.return_value = 10
-
-        call_count = [0]
-
-        def filter_side_effect(*args, **kwargs):
-            result = MagicMock()
-            if call_count[0] == 0:
-                result.count.return_value = 4
-            elif call_count[0] == 1:
-                result.count.return_value = 2
-            elif call_count[0] == 2:
-                result.count.return_value = 2
-            else:
-                result.count.return_value = 0
-            result.all.return_value = []
-            call_count[0] += 1
-            return result
-
-        mock_query.filter.side_effect = filter_side_effect
-
-        service = StatsService(mock_db)
-        summary = service.get_summary()
+    def test_separates_completed_and_revealed(self, test_db) -> None:
+        summary = StatsService(test_db).get_summary()
 
         assert summary.completed_sessions == 4
         assert summary.revealed_sessions == 2
 
+    @pytest.mark.unit
+    def test_averages_layers_of_finished_sessions_only(self, test_db) -> None:
+        summary = StatsService(test_db).get_summary()
+
+        # (4 * 2 + 2 * 4) / 6; active sessions are ignored
+        assert summary.avg_layers_to_complete == 2.7
 
-class TestSessionsList:
     @pytest.mark.unit
-    def test_returns_empty_list_when_no_sessions(self) -> None:
-        mock_db = MagicMock()
-        mock_db.query.return_value.order_by.return_value.limit.return_value.offset.return_value.all.return_value = []
+    def test_summary_is_a_single_query(self, test_db, query_counter) -> None:
+        StatsService(test_db).get_summary()
+
+        assert len(query_counter) == 1, query_counter
 
-        service = StatsService(mock_db)
+
+class TestSessionsList:
+    @pytest.mark.unit
+    def test_returns_empty_list_when_no_sessions(self, test_db) -> None:
+        service = StatsService(test_db)
         sessions = service.list_sessions(limit=10, offset=0)
 
         assert sessions == []
 
     @pytest.mark.unit
-    def test_returns_sessions_ordered_by_recent_first(self) -> None:
-        mock_db = MagicMock()
-        mock_session1 = MagicMock()
-        mock_session1.id = "ses_001"
-        mock_session1.session_access_token = "token_001"
-        mock_session1.started_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
-        mock_session1.status = SessionStatus.COMPLETED
-        mock_session1.current_layer = HintLayer.COMPLETED
-        mock_session1.problem.raw_text = "3x + 5 = 14"
-
-        mock_session2 = MagicMock()
-        mock_session2.id = "ses_002"
-        mock_session2.session_access_token = "token_002"
-        mock_session2.started_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        mock_session2.status = SessionStatus.ACTIVE
-        mock_session2.current_layer = HintLayer.STRATEGY
-        mock_session2.problem.raw_text = "x + y = 10"
-
-        mock_db.query.return_value.order_by.return_value.limit.return_value.offset.return_value.all.return_value = [
-            mock_session1,
-            mock_session2,
-        ]
-
-        service = StatsService(mock_db)
+    def test_returns_sessions_ordered_by_recent_first(self, test_db) -> None:
+        problem = Problem(raw_text="3x + 5 = 14", problem_type=ProblemType.LINEAR_EQUATION_1VAR)
+        test_db.add(problem)
+        test_db.flush()
+        test_db.add_all(
+            [
+                HintSession(
+                    id="ses_002",
+                    problem_id=problem.id,
+                    started_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                ),
+                HintSession(
+                    id="ses_001",
+                    problem_id=problem.id,
+                    status=SessionStatus.COMPLETED,
+                    current_layer=HintLayer.COMPLETED,
+                    started_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                ),
+            ]
+        )
+        test_db.commit()
+
+        service = StatsService(test_db)
         sessions = service.list_sessions(limit=10, offset=0)
 
         assert len(sessions) == 2
@@ -159,28 +127,31 @@ class TestSessionsList:
         assert sessions[1].session_id == "ses_002"
 
     @pytest.mark.unit
-    def test_session_item_contains_required_fields(self) -> None:
-        mock_db = MagicMock()
-        mock_session = MagicMock()
-        mock_session.id = "ses_test"
-        mock_session.session_access_token = "token_test"
-        mock_session.started_at = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_session.completed_at = datetime(2024, 1, 1, 12, 30, 0, tzinfo=timezone.utc)
-        mock_session.status = SessionStatus.COMPLETED
-        mock_session.current_layer = HintLayer.COMPLETED
-        mock_session.confusion_count = 2
-        mock_session.used_full_solution = False
-        mock_session.problem.raw_text = "2x = 8"
-
-        mock_db.query.return_value.order_by.return_value.limit.return_value.offset.return_value.all.return_value = [
-            mock_session
-        ]
-
-        service = StatsService(mock_db)
+    def test_session_item_contains_required_fields(self, test_db) -> None:
+        problem = Problem(raw_text="2x = 8", problem_type=ProblemType.LINEAR_EQUATION_1VAR)
+        test_db.add(problem)
+        test_db.flush()
+        test_db.add(
+            HintSession(
+                id="ses_test",
+                problem_id=problem.id,
+                session_access_token="token_test",
+                status=SessionStatus.COMPLETED,
+                current_layer=HintLayer.COMPLETED,
+                confusion_count=2,
+                used_full_solution=False,
+                started_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+                completed_at=datetime(2024, 1, 1, 12, 30, 0, tzinfo=timezone.utc),
+            )
+        )
+        test_db.commit()
+
+        service = StatsService(test_db)
         sessions = service.list_sessions(limit=10, offset=0)
 
         item = sessions[0]
         assert item.session_id == "ses_test"
+        assert item.session_access_token == "token_test"
         assert item.problem_text == "2x = 8"
         assert item.status == SessionStatus.COMPLETED
         assert item.final_layer == HintLayer.COMPLETED
@@ -188,12 +159,55 @@ class TestSessionsList:
         assert item.used_full_solution is False
         assert item.started_at is not None
         assert item.completed_at is not None
+        assert item.duration_seconds == 1800.0
+
+    @pytest.mark.unit
+    def test_computes_duration_in_sql(self, test_db) -> None:
+        problem = Problem(raw_text="2x = 8", problem_type=ProblemType.LINEAR_EQUATION_1VAR)
+        test_db.add(problem)
+        test_db.flush()
+        started_at = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        test_db.add_all(
+            [
+                HintSession(
+                    problem_id=problem.id,
+                    status=SessionStatus.COMPLETED,
+                    started_at=started_at,
+                    completed_at=started_at + timedelta(minutes=30),
+                ),
+                HintSession(problem_id=problem.id, started_at=started_at - timedelta(days=1)),
+            ]
+        )
+        test_db.commit()
+
+        completed, active = StatsService(test_db).list_sessions(limit=10, offset=0)
+
+        assert completed.duration_seconds == 1800.0
+        assert active.duration_seconds is None
+
+    @pytest.mark.unit
+    def test_loads_problems_without_n_plus_one(self, test_db, query_counter) -> None:
+        for i in range(10):
+            problem = Problem(raw_text=f"{i}x = 8", problem_type=ProblemType.LINEAR_EQUATION_1VAR)
+            test_db.add(problem)
+            test_db.flush()
+            test_db.add(HintSession(problem_id=problem.id))
+        test_db.commit()
+        test_db.expunge_all()
+        query_counter.clear()
+
+        sessions = StatsService(test_db).list_sessions(limit=10, offset=0)
+
+        assert len(sessions) == 10
+        assert {item.problem_text for item in sessions} == {f"{i}x = 8" for i in range(10)}
+        # One query for the sessions, one IN query for their problems
+        assert len(query_counter) <= 2, query_counter
 
 
 class TestLayerProgression:
     @pytest.mark.unit
     def test_layer_to_number_mapping(self) -> None:
-        service = StatsService(MagicMock())
+        service = StatsService(create_autospec(Session, instance=True))
 
         assert service._layer_to_number(HintLayer.CONCEPT) == 1
         assert service._layer_to_number(HintLayer.STRATEGY) == 2
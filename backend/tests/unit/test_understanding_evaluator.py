@@ -1,15 +1,25 @@
+import sys
+
 import pytest
 
 from backend.models.enums import ProblemType, HintLayer, UnderstandingLevel
 from backend.services.understanding_evaluator import UnderstandingEvaluator
 
 
+@pytest.fixture(scope="module")
+def evaluator() -> UnderstandingEvaluator:
+    return UnderstandingEvaluator()
+
+
+@pytest.fixture(autouse=True)
+def _clear_evaluation_cache() -> None:
+    UnderstandingEvaluator.clear_cache()
+
+
 class TestResponseTooShort:
     @pytest.mark.unit
-    def test_response_under_10_chars_is_confused(self) -> None:
+    def test_response_under_10_chars_is_confused(self, evaluator: UnderstandingEvaluator) -> None:
         """Response with fewer than 10 characters should be CONFUSED."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="嗯好的",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -20,10 +30,10 @@ class TestResponseTooShort:
         assert result.char_count < 10
 
     @pytest.mark.unit
-    def test_response_exactly_10_chars_with_keyword_is_understood(self) -> None:
+    def test_response_exactly_10_chars_with_keyword_is_understood(
+        self, evaluator: UnderstandingEvaluator
+    ) -> None:
         """Response with exactly 10 chars and keyword should be UNDERSTOOD."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="我觉得移项可以帮助我们",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -35,10 +45,10 @@ class TestResponseTooShort:
             assert result.understanding_level == UnderstandingLevel.UNDERSTOOD
 
     @pytest.mark.unit
-    def test_response_10_chars_no_keyword_is_confused(self) -> None:
+    def test_response_10_chars_no_keyword_is_confused(
+        self, evaluator: UnderstandingEvaluator
+    ) -> None:
         """Response with 10+ chars but no keyword should be CONFUSED."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="我觉得这道题很有趣啊",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -49,10 +59,8 @@ class TestResponseTooShort:
         assert result.understanding_level == UnderstandingLevel.CONFUSED
 
     @pytest.mark.unit
-    def test_empty_response_is_confused(self) -> None:
+    def test_empty_response_is_confused(self, evaluator: UnderstandingEvaluator) -> None:
         """Empty response should be CONFUSED."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -63,10 +71,8 @@ class TestResponseTooShort:
         assert result.char_count == 0
 
     @pytest.mark.unit
-    def test_whitespace_only_response_is_confused(self) -> None:
+    def test_whitespace_only_response_is_confused(self, evaluator: UnderstandingEvaluator) -> None:
         """Whitespace-only response should be CONFUSED."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="     ",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -75,13 +81,29 @@ class TestResponseTooShort:
 
         assert result.understanding_level == UnderstandingLevel.CONFUSED
 
+    @pytest.mark.unit
+    def test_surrounding_whitespace_is_not_counted(self, evaluator: UnderstandingEvaluator) -> None:
+        """Padding around a response should not change its evaluation."""
+        plain = evaluator.evaluate(
+            response_text="我想用移项的方法来解这道方程",
+            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
+            layer=HintLayer.CONCEPT,
+        )
+        padded = evaluator.evaluate(
+            response_text="  \n我想用移项的方法来解这道方程\t ",
+            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
+            layer=HintLayer.CONCEPT,
+        )
+
+        assert padded == plain
+
 
 class TestExplicitConfusion:
     @pytest.mark.unit
-    def test_explicit_dont_know_is_explicit_confused(self) -> None:
+    def test_explicit_dont_know_is_explicit_confused(
+        self, evaluator: UnderstandingEvaluator
+    ) -> None:
         """Response containing '不懂' should be EXPLICIT_CONFUSED."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="我不懂这道题要怎么做",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -91,10 +113,10 @@ class TestExplicitConfusion:
         assert result.understanding_level == UnderstandingLevel.EXPLICIT_CONFUSED
 
     @pytest.mark.unit
-    def test_explicit_dont_understand_is_explicit_confused(self) -> None:
+    def test_explicit_dont_understand_is_explicit_confused(
+        self, evaluator: UnderstandingEvaluator
+    ) -> None:
         """Response containing '不知道' should be EXPLICIT_CONFUSED."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="我不知道应该怎么解决",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -104,10 +126,8 @@ class TestExplicitConfusion:
         assert result.understanding_level == UnderstandingLevel.EXPLICIT_CONFUSED
 
     @pytest.mark.unit
-    def test_explicit_confused_phrase_is_detected(self) -> None:
+    def test_explicit_confused_phrase_is_detected(self, evaluator: UnderstandingEvaluator) -> None:
         """Response with confusion phrases like '看不明白' should be EXPLICIT_CONFUSED."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="这个题目我看不明白是什么意思",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -119,10 +139,8 @@ class TestExplicitConfusion:
 
 class TestKeywordMatching:
     @pytest.mark.unit
-    def test_linear_equation_keyword_移项_matches(self) -> None:
+    def test_linear_equation_keyword_移项_matches(self, evaluator: UnderstandingEvaluator) -> None:
         """'移项' keyword should match for linear equation."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="我觉得应该用移项的方法来解这道题",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -133,10 +151,10 @@ class TestKeywordMatching:
         assert result.understanding_level == UnderstandingLevel.UNDERSTOOD
 
     @pytest.mark.unit
-    def test_linear_equation_keyword_等式性质_matches(self) -> None:
+    def test_linear_equation_keyword_等式性质_matches(
+        self, evaluator: UnderstandingEvaluator
+    ) -> None:
         """'等式' keyword should match for linear equation."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="根据等式性质，两边同时减去相同的数",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -147,10 +165,8 @@ class TestKeywordMatching:
         assert result.understanding_level == UnderstandingLevel.UNDERSTOOD
 
     @pytest.mark.unit
-    def test_quadratic_keyword_分解因式_matches(self) -> None:
+    def test_quadratic_keyword_分解因式_matches(self, evaluator: UnderstandingEvaluator) -> None:
         """'因式分解' keyword should match for quadratic equation."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="这道二次方程可以用因式分解来解决",
             problem_type=ProblemType.QUADRATIC_EQUATION,
@@ -160,15 +176,48 @@ class TestKeywordMatching:
         assert any("因式" in kw for kw in result.keywords_matched)
         assert result.understanding_level == UnderstandingLevel.UNDERSTOOD
 
+    @pytest.mark.unit
+    def test_overlapping_keywords_all_match(self, evaluator: UnderstandingEvaluator) -> None:
+        """Keywords nested inside other keywords are each reported once."""
+        result = evaluator.evaluate(
+            response_text="我要解决这个方程组问题，解出来",
+            problem_type=ProblemType.LINEAR_EQUATION_2VAR,
+            layer=HintLayer.STRATEGY,
+        )
+
+        assert sorted(result.keywords_matched) == sorted(["解", "解决", "方程组"])
+
+    @pytest.mark.unit
+    def test_english_keywords_match_case_insensitively(
+        self, evaluator: UnderstandingEvaluator
+    ) -> None:
+        result = evaluator.evaluate(
+            response_text="Move the Constant to Both Sides",
+            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
+            layer=HintLayer.CONCEPT,
+        )
+
+        assert {"move", "constant", "both sides"} <= set(result.keywords_matched)
+        assert result.understanding_level == UnderstandingLevel.UNDERSTOOD
+
+    @pytest.mark.unit
+    def test_matched_keywords_are_interned(self, evaluator: UnderstandingEvaluator) -> None:
+        result = evaluator.evaluate(
+            response_text="我想用移项的方法来解这道方程",
+            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
+            layer=HintLayer.CONCEPT,
+        )
+
+        assert result.keywords_matched
+        assert all(kw is sys.intern(kw) for kw in result.keywords_matched)
+
 
 class TestUnderstandingWithKeywords:
     """T047: Tests for understanding evaluation with keyword matching."""
 
     @pytest.mark.unit
-    def test_understood_when_10_chars_and_keyword(self) -> None:
+    def test_understood_when_10_chars_and_keyword(self, evaluator: UnderstandingEvaluator) -> None:
         """≥10 chars + ≥1 keyword = UNDERSTOOD."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="我想用移项的方法来解这道方程",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -180,10 +229,8 @@ class TestUnderstandingWithKeywords:
         assert len(result.keywords_matched) >= 1
 
     @pytest.mark.unit
-    def test_understood_with_multiple_keywords(self) -> None:
+    def test_understood_with_multiple_keywords(self, evaluator: UnderstandingEvaluator) -> None:
         """Multiple keywords should all be captured."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="移项后合并同类项，然后求解方程",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -194,10 +241,8 @@ class TestUnderstandingWithKeywords:
         assert len(result.keywords_matched) >= 2
 
     @pytest.mark.unit
-    def test_understood_progresses_layer(self) -> None:
+    def test_understood_progresses_layer(self, evaluator: UnderstandingEvaluator) -> None:
         """UNDERSTOOD result on CONCEPT should allow STRATEGY progression."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="等式性质是指两边同时加减乘除相同的数",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -211,10 +256,8 @@ class TestConfusionStaysOnLayer:
     """T048: Tests that CONFUSED keeps student on same layer."""
 
     @pytest.mark.unit
-    def test_confused_no_keyword_stays_on_layer(self) -> None:
+    def test_confused_no_keyword_stays_on_layer(self, evaluator: UnderstandingEvaluator) -> None:
         """Response without keywords should be CONFUSED, staying on layer."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="我觉得这道题目挺有意思的呢",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -226,10 +269,10 @@ class TestConfusionStaysOnLayer:
         assert len(result.keywords_matched) == 0
 
     @pytest.mark.unit
-    def test_confused_short_response_stays_on_layer(self) -> None:
+    def test_confused_short_response_stays_on_layer(
+        self, evaluator: UnderstandingEvaluator
+    ) -> None:
         """Short response should be CONFUSED, staying on layer."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="嗯嗯好的",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -240,10 +283,8 @@ class TestConfusionStaysOnLayer:
         assert result.char_count < 10
 
     @pytest.mark.unit
-    def test_explicit_confused_stays_on_layer(self) -> None:
+    def test_explicit_confused_stays_on_layer(self, evaluator: UnderstandingEvaluator) -> None:
         """Explicit confusion phrase should stay on layer."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="我完全不理解这道题应该怎么处理",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -257,10 +298,10 @@ class TestConfusionDowngrade:
     """T049: Tests for confusion count and downgrade triggering."""
 
     @pytest.mark.unit
-    def test_confusion_count_tracked_per_evaluation(self) -> None:
+    def test_confusion_count_tracked_per_evaluation(
+        self, evaluator: UnderstandingEvaluator
+    ) -> None:
         """Each confused response should be trackable for counting."""
-        evaluator = UnderstandingEvaluator()
-
         responses = ["不太确定", "还是不懂", "我不明白"]
         confusion_count = 0
 
@@ -279,10 +320,10 @@ class TestConfusionDowngrade:
         assert confusion_count == 3
 
     @pytest.mark.unit
-    def test_three_confusions_should_trigger_downgrade(self) -> None:
+    def test_three_confusions_should_trigger_downgrade(
+        self, evaluator: UnderstandingEvaluator
+    ) -> None:
         """After 3 confused responses, system should track downgrade eligibility."""
-        evaluator = UnderstandingEvaluator()
-
         confused_responses = [
             "我不太明白",
             "还是搞不懂",
@@ -302,10 +343,10 @@ class TestConfusionDowngrade:
         assert all_confused
 
     @pytest.mark.unit
-    def test_understood_resets_confusion_eligibility(self) -> None:
+    def test_understood_resets_confusion_eligibility(
+        self, evaluator: UnderstandingEvaluator
+    ) -> None:
         """UNDERSTOOD response should break confusion streak."""
-        evaluator = UnderstandingEvaluator()
-
         result1 = evaluator.evaluate(
             response_text="不太确定",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -323,10 +364,8 @@ class TestConfusionDowngrade:
 
 class TestEvaluationResult:
     @pytest.mark.unit
-    def test_result_contains_char_count(self) -> None:
+    def test_result_contains_char_count(self, evaluator: UnderstandingEvaluator) -> None:
         """Evaluation result should contain character count."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="这是一个测试回复",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
@@ -336,14 +375,59 @@ class TestEvaluationResult:
         assert result.char_count == 8
 
     @pytest.mark.unit
-    def test_result_contains_keywords_list(self) -> None:
+    def test_result_contains_keywords_list(self, evaluator: UnderstandingEvaluator) -> None:
         """Evaluation result should contain matched keywords list."""
-        evaluator = UnderstandingEvaluator()
-
         result = evaluator.evaluate(
             response_text="移项和合并同类项是解方程的基本步骤",
             problem_type=ProblemType.LINEAR_EQUATION_1VAR,
             layer=HintLayer.CONCEPT,
         )
 
-        assert isinstance(result.keywords_matched, list)
+        assert isinstance(result.keywords_matched, tuple)
+        assert "移项" in result.keywords_matched
+
+    @pytest.mark.unit
+    def test_keyword_tables_are_immutable(self) -> None:
+        """The tables are shared by every evaluator, so they must not be extendable."""
+        tables = [
+            UnderstandingEvaluator.EXPLICIT_CONFUSION_PHRASES,
+            *UnderstandingEvaluator.KEYWORDS_BY_TYPE.values(),
+        ]
+
+        assert all(isinstance(table, tuple) for table in tables)
+
+
+class TestEvaluationCache:
+    @pytest.mark.unit
+    def test_repeated_response_is_served_from_cache(self) -> None:
+        """Identical responses share one result, even across evaluator instances."""
+        first = UnderstandingEvaluator().evaluate(
+            response_text="我想用移项的方法来解这道方程",
+            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
+            layer=HintLayer.CONCEPT,
+        )
+        second = UnderstandingEvaluator().evaluate(
+            response_text="我想用移项的方法来解这道方程",
+            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
+            layer=HintLayer.STRATEGY,
+        )
+
+        assert second is first
+        assert UnderstandingEvaluator._evaluate_cached.cache_info().hits == 1
+
+    @pytest.mark.unit
+    def test_problem_type_is_part_of_the_cache_key(self, evaluator: UnderstandingEvaluator) -> None:
+        text = "我觉得应该把常数移项过去"
+
+        linear = evaluator.evaluate(text, ProblemType.LINEAR_EQUATION_1VAR, HintLayer.CONCEPT)
+        geometry = evaluator.evaluate(text, ProblemType.GEOMETRY_BASIC, HintLayer.CONCEPT)
+
+        assert linear.understanding_level == UnderstandingLevel.UNDERSTOOD
+        assert geometry.understanding_level == UnderstandingLevel.CONFUSED
+
+    @pytest.mark.unit
+    def test_result_is_immutable(self, evaluator: UnderstandingEvaluator) -> None:
+        result = evaluator.evaluate("嗯好的", ProblemType.LINEAR_EQUATION_1VAR, HintLayer.CONCEPT)
+
+        with pytest.raises(AttributeError):
+            result.char_count = 0  # type: ignore[misc]
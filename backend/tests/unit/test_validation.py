@@ -8,6 +8,8 @@ from backend.utils.validation import (
     is_valid_uuid_v4,
     validate_session_id,
     generate_session_id,
+    validate_email_format,
+    validate_email_with_error,
 )
 
 
@@ -63,6 +65,20 @@ class TestIsValidUUIDv4:
         """Malformed UUID should be rejected."""
         assert is_valid_uuid_v4("not-a-uuid-at-all") is False
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "550e8400-e29b-41d4-a716-446655440000\n",
+            "{550e8400-e29b-41d4-a716-44665544000}",
+            "550e8400-e29b-41d4-c716-446655440000",
+            "550e8400-e29b-41d4-a716-44665544000\u0663",
+        ],
+        ids=["trailing_newline", "braces", "wrong_variant", "non_ascii_digit"],
+    )
+    def test_non_canonical_forms_return_false(self, value: str) -> None:
+        """Only the canonical 36-character RFC 4122 v4 form is accepted."""
+        assert is_valid_uuid_v4(value) is False
+
 
 class TestValidateSessionID:
     """Tests for session_id validation with HTTPException."""
@@ -123,3 +139,36 @@ class TestGenerateSessionID:
         session_id = generate_session_id()
         result = validate_session_id(session_id)
         assert result == session_id
+
+
+class TestEmailValidation:
+    """Tests for email format validation."""
+
+    @pytest.mark.parametrize(
+        "email",
+        ["student@example.com", "first.last+tag@mail.example.co", f"{'a' * 64}@example.com"],
+    )
+    def test_valid_emails(self, email: str) -> None:
+        """Well-formed addresses should pass both validators."""
+        assert validate_email_format(email) is True
+        assert validate_email_with_error(email) == (True, None)
+
+    @pytest.mark.parametrize(
+        "email, error",
+        [
+            ("", "Email address is required"),
+            (None, "Email address is required"),
+            (f"a@{'b' * 250}.com", "Email address too long (max 255 characters)"),
+            ("a@b@example.com", "Email must contain exactly one @ symbol"),
+            ("no-at-sign.example.com", "Email must contain exactly one @ symbol"),
+            (f"{'a' * 65}@example.com", "Local part of email too long (max 64 characters)"),
+            ("student@localhost", "Invalid email format"),
+            ("stu dent@example.com", "Invalid email format"),
+            ("学生@example.com", "Invalid email format"),
+            ("student@example.com\n", "Invalid email format"),
+        ],
+    )
+    def test_invalid_emails(self, email: str | None, error: str) -> None:
+        """Each rejected address should report the rule it broke."""
+        assert validate_email_format(email) is False  # type: ignore[arg-type]
+        assert validate_email_with_error(email) == (False, error)
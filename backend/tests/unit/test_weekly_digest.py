@@ -1,280 +1,248 @@
 import pytest
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import text
+
 from backend.services.weekly_digest import WeeklyDigestGenerator
+from backend.models.base import generate_uuid
 from backend.models.session import HintSession
 from backend.models.problem import Problem
 from backend.models.enums import HintLayer, SessionStatus, ProblemType
 
-
-@pytest.mark.unit
-class TestWeeklyDigestGenerator:
-    def test_generate_digest_returns_none_for_no_sessions(self, test_db):
-        generator = WeeklyDigestGenerator()
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=7)
-
-        result = generator.generate_weekly_digest(
-            test_db, "nonexistent@example.com", start_date, end_date
+EMAIL = "parent@example.com"
+
+
+@pytest.fixture
+def generator():
+    return WeeklyDigestGenerator()
+
+
+@pytest.fixture
+def window():
+    """(start_date, end_date) covering the past week."""
+    end_date = datetime.now(timezone.utc)
+    return end_date - timedelta(days=7), end_date
+
+
+@pytest.fixture
+def sample_problem(test_db):
+    problem = Problem(
+        raw_text="Test problem",
+        problem_type=ProblemType.LINEAR_EQUATION_1VAR,
+        difficulty="EASY",
+    )
+    test_db.add(problem)
+    test_db.flush()
+    return problem
+
+
+@pytest.fixture
+def seed_sessions(test_db, sample_problem, window):
+    """Insert `count` sessions an hour apart in one batch; completed ones last `minutes`.
+
+    `vary(i)` may return extra per-session fields.
+    """
+
+    def seed(count, minutes=None, problem_ids=None, vary=None, **fields):
+        start_date, _ = window
+        test_db.bulk_save_objects(
+            [
+                HintSession(
+                    problem_id=problem_ids[i] if problem_ids else sample_problem.id,
+                    parent_email=EMAIL,
+                    started_at=start_date + timedelta(hours=i),
+                    completed_at=(
+                        start_date + timedelta(hours=i, minutes=minutes)
+                        if minutes is not None
+                        else None
+                    ),
+                    **fields,
+                    **(vary(i) if vary else {}),
+                )
+                for i in range(count)
+            ]
         )
+        test_db.commit()
 
-        assert result is None
+    return seed
+
+
+@pytest.fixture
+def ten_sessions(request, seed_sessions):
+    """Ten sessions sharing the fields given via indirect parametrization."""
+    seed_sessions(10, **request.param)
+
+
+_EXCELLENT = dict(
+    minutes=10,
+    current_layer=HintLayer.COMPLETED,
+    status=SessionStatus.COMPLETED,
+    confusion_count=0,
+    used_full_solution=False,
+)
+_NEEDS_PRACTICE = dict(
+    current_layer=HintLayer.CONCEPT,
+    status=SessionStatus.ACTIVE,
+    confusion_count=3,
+    used_full_solution=True,
+)
+_LOW_COMPLETION = dict(
+    current_layer=HintLayer.STRATEGY,
+    status=SessionStatus.ACTIVE,
+    confusion_count=1,
+    used_full_solution=False,
+)
+_HIGH_REVEAL = dict(_EXCELLENT, used_full_solution=True)
 
-    def test_generate_digest_with_single_completed_session(self, test_db):
-        generator = WeeklyDigestGenerator()
-        email = "parent@example.com"
 
-        problem = Problem(
-            raw_text="Test problem",
-            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
-            difficulty="EASY",
-        )
-        test_db.add(problem)
-        test_db.flush()
+@pytest.mark.unit
+class TestWeeklyDigestGenerator:
+    def test_generate_digest_returns_none_for_no_sessions(self, test_db, generator, window):
+        result = generator.generate_weekly_digest(test_db, "nonexistent@example.com", *window)
 
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=7)
-        session_time = start_date + timedelta(days=1)
+        assert result is None
 
-        session = HintSession(
-            problem_id=problem.id,
+    def test_generate_digest_with_single_completed_session(
+        self, test_db, generator, window, seed_sessions
+    ):
+        seed_sessions(
+            1,
+            minutes=15,
             current_layer=HintLayer.COMPLETED,
             status=SessionStatus.COMPLETED,
-            parent_email=email,
-            started_at=session_time,
-            completed_at=session_time + timedelta(minutes=15),
             confusion_count=1,
             used_full_solution=False,
         )
-        test_db.add(session)
-        test_db.commit()
 
-        result = generator.generate_weekly_digest(test_db, email, start_date, end_date)
+        result = generator.generate_weekly_digest(test_db, EMAIL, *window)
 
         assert result is not None
-        assert result["email"] == email
+        assert result["email"] == EMAIL
         assert result["total_sessions"] == 1
         assert result["completed_sessions"] == 1
         assert result["total_time_minutes"] == 15
         assert result["reveal_usage_count"] == 0
         assert result["highest_layer_reached"] == "step"
 
-    def test_calculate_performance_level_excellent(self, test_db):
-        generator = WeeklyDigestGenerator()
-        email = "parent@example.com"
-
-        problem = Problem(
-            raw_text="Test problem",
-            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
-            difficulty="EASY",
-        )
-        test_db.add(problem)
-        test_db.flush()
-
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=7)
-
-        for i in range(10):
-            session = HintSession(
-                problem_id=problem.id,
-                current_layer=HintLayer.COMPLETED,
-                status=SessionStatus.COMPLETED,
-                parent_email=email,
-                started_at=start_date + timedelta(hours=i),
-                completed_at=start_date + timedelta(hours=i, minutes=10),
-                confusion_count=0,
-                used_full_solution=False,
-            )
-            test_db.add(session)
-
-        test_db.commit()
-
-        result = generator.generate_weekly_digest(test_db, email, start_date, end_date)
-
-        assert result["performance_level"] == "Excellent"
-
-    def test_calculate_performance_level_needs_practice(self, test_db):
-        generator = WeeklyDigestGenerator()
-        email = "parent@example.com"
-
-        problem = Problem(
-            raw_text="Test problem",
-            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
-            difficulty="EASY",
-        )
-        test_db.add(problem)
-        test_db.flush()
-
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=7)
-
-        for i in range(10):
-            session = HintSession(
-                problem_id=problem.id,
-                current_layer=HintLayer.CONCEPT,
-                status=SessionStatus.ACTIVE,
-                parent_email=email,
-                started_at=start_date + timedelta(hours=i),
-                completed_at=None,
-                confusion_count=3,
-                used_full_solution=True,
-            )
-            test_db.add(session)
-
-        test_db.commit()
-
-        result = generator.generate_weekly_digest(test_db, email, start_date, end_date)
-
-        assert result["performance_level"] == "Needs Practice"
-
-    def test_generate_recommendations_for_low_completion(self, test_db):
-        generator = WeeklyDigestGenerator()
-        email = "parent@example.com"
-
-        problem = Problem(
-            raw_text="Test problem",
-            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
-            difficulty="EASY",
-        )
-        test_db.add(problem)
-        test_db.flush()
-
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=7)
-
-        for i in range(10):
-            session = HintSession(
-                problem_id=problem.id,
-                current_layer=HintLayer.STRATEGY,
-                status=SessionStatus.ACTIVE,
-                parent_email=email,
-                started_at=start_date + timedelta(hours=i),
-                completed_at=None,
-                confusion_count=1,
-                used_full_solution=False,
-            )
-            test_db.add(session)
-
-        test_db.commit()
-
-        result = generator.generate_weekly_digest(test_db, email, start_date, end_date)
+    @pytest.mark.parametrize(
+        "ten_sessions, expected",
+        [(_EXCELLENT, "Excellent"), (_NEEDS_PRACTICE, "Needs Practice")],
+        indirect=["ten_sessions"],
+        ids=["excellent", "needs_practice"],
+    )
+    @pytest.mark.usefixtures("ten_sessions")
+    def test_calculate_performance_level(self, test_db, generator, window, expected):
+        result = generator.generate_weekly_digest(test_db, EMAIL, *window)
+
+        assert result["performance_level"] == expected
+
+    @pytest.mark.parametrize(
+        "ten_sessions, phrases",
+        [(_LOW_COMPLETION, ("independently",)), (_HIGH_REVEAL, ("hint layer", "revealing"))],
+        indirect=["ten_sessions"],
+        ids=["low_completion", "high_reveal_usage"],
+    )
+    @pytest.mark.usefixtures("ten_sessions")
+    def test_generate_recommendations(self, test_db, generator, window, phrases):
+        result = generator.generate_weekly_digest(test_db, EMAIL, *window)
 
         recommendations = result["recommendations"]
         assert len(recommendations) > 0
-        assert any("independently" in rec.lower() for rec in recommendations)
-
-    def test_generate_recommendations_for_high_reveal_usage(self, test_db):
-        generator = WeeklyDigestGenerator()
-        email = "parent@example.com"
-
-        problem = Problem(
-            raw_text="Test problem",
-            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
-            difficulty="EASY",
-        )
-        test_db.add(problem)
-        test_db.flush()
-
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=7)
-
-        for i in range(10):
-            session = HintSession(
-                problem_id=problem.id,
-                current_layer=HintLayer.COMPLETED,
-                status=SessionStatus.COMPLETED,
-                parent_email=email,
-                started_at=start_date + timedelta(hours=i),
-                completed_at=start_date + timedelta(hours=i, minutes=10),
-                confusion_count=0,
-                used_full_solution=True,
+        assert any(phrase in rec.lower() for rec in recommendations for phrase in phrases)
+
+    def test_identify_most_challenging_topic(self, test_db, generator, window, seed_sessions):
+        problems = [
+            Problem(
+                id=generate_uuid(),
+                raw_text="Test problem",
+                problem_type=problem_type,
+                difficulty="EASY",
             )
-            test_db.add(session)
-
-        test_db.commit()
-
-        result = generator.generate_weekly_digest(test_db, email, start_date, end_date)
-
-        recommendations = result["recommendations"]
-        assert len(recommendations) > 0
-        assert any(
-            "hint layer" in rec.lower() or "revealing" in rec.lower() for rec in recommendations
+            for problem_type in [ProblemType.QUADRATIC_EQUATION] * 5
+            + [ProblemType.LINEAR_EQUATION_1VAR]
+        ]
+        test_db.bulk_save_objects(problems)
+        seed_sessions(
+            len(problems),
+            problem_ids=[problem.id for problem in problems],
+            current_layer=HintLayer.CONCEPT,
+            status=SessionStatus.ACTIVE,
+            confusion_count=3,
+            used_full_solution=False,
         )
 
-    def test_identify_most_challenging_topic(self, test_db):
-        generator = WeeklyDigestGenerator()
-        email = "parent@example.com"
-
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=7)
-
-        for problem_type in [ProblemType.QUADRATIC_EQUATION] * 5 + [
-            ProblemType.LINEAR_EQUATION_1VAR
-        ]:
-            problem = Problem(raw_text="Test problem", problem_type=problem_type, difficulty="EASY")
-            test_db.add(problem)
-            test_db.flush()
-
-            session = HintSession(
-                problem_id=problem.id,
-                current_layer=HintLayer.CONCEPT,
-                status=SessionStatus.ACTIVE,
-                parent_email=email,
-                started_at=start_date + timedelta(hours=1),
-                completed_at=None,
-                confusion_count=3,
-                used_full_solution=False,
-            )
-            test_db.add(session)
-
-        test_db.commit()
-
-        result = generator.generate_weekly_digest(test_db, email, start_date, end_date)
+        result = generator.generate_weekly_digest(test_db, EMAIL, *window)
 
         assert "Quadratic" in result["most_challenging_topic"]
 
-    def test_date_range_filtering(self, test_db):
-        generator = WeeklyDigestGenerator()
-        email = "parent@example.com"
-
-        problem = Problem(
-            raw_text="Test problem",
-            problem_type=ProblemType.LINEAR_EQUATION_1VAR,
-            difficulty="EASY",
-        )
-        test_db.add(problem)
-        test_db.flush()
-
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=7)
+    def test_date_range_filtering(self, test_db, generator, window, sample_problem):
+        start_date, end_date = window
         old_date = start_date - timedelta(days=10)
 
-        session_in_range = HintSession(
-            problem_id=problem.id,
-            current_layer=HintLayer.COMPLETED,
-            status=SessionStatus.COMPLETED,
-            parent_email=email,
-            started_at=start_date + timedelta(days=1),
-            completed_at=start_date + timedelta(days=1, minutes=10),
-            confusion_count=0,
-            used_full_solution=False,
-        )
-        test_db.add(session_in_range)
-
-        session_out_of_range = HintSession(
-            problem_id=problem.id,
-            current_layer=HintLayer.COMPLETED,
-            status=SessionStatus.COMPLETED,
-            parent_email=email,
-            started_at=old_date,
-            completed_at=old_date + timedelta(minutes=10),
-            confusion_count=0,
-            used_full_solution=False,
+        test_db.bulk_save_objects(
+            [
+                HintSession(
+                    problem_id=sample_problem.id,
+                    current_layer=HintLayer.COMPLETED,
+                    status=SessionStatus.COMPLETED,
+                    parent_email=EMAIL,
+                    started_at=started_at,
+                    completed_at=started_at + timedelta(minutes=10),
+                    confusion_count=0,
+                    used_full_solution=False,
+                )
+                for started_at in (start_date + timedelta(days=1), old_date)
+            ]
         )
-        test_db.add(session_out_of_range)
-
         test_db.commit()
 
-        result = generator.generate_weekly_digest(test_db, email, start_date, end_date)
+        result = generator.generate_weekly_digest(test_db, EMAIL, start_date, end_date)
 
         assert result["total_sessions"] == 1
+
+    def test_aggregates_in_constant_number_of_queries(
+        self, test_db, generator, window, seed_sessions, query_counter
+    ):
+        problems = [
+            Problem(
+                id=generate_uuid(),
+                raw_text=f"Problem {i}",
+                problem_type=ProblemType.LINEAR_EQUATION_1VAR,
+                difficulty="EASY",
+            )
+            for i in range(30)
+        ]
+        test_db.bulk_save_objects(problems)
+        seed_sessions(
+            30,
+            minutes=10,
+            problem_ids=[problem.id for problem in problems],
+            current_layer=HintLayer.STRATEGY,
+            status=SessionStatus.COMPLETED,
+            vary=lambda i: dict(confusion_count=i % 3, used_full_solution=i % 2 == 0),
+        )
+        test_db.expunge_all()
+        query_counter.clear()
+
+        result = generator.generate_weekly_digest(test_db, EMAIL, *window)
+
+        assert result["total_sessions"] == 30
+        assert result["total_time_minutes"] == 300
+        assert result["reveal_usage_count"] == 15
+        assert result["highest_layer_reached"] == "strategy"
+        assert result["most_challenging_topic"] == "Linear Equations"
+        assert len(result["sessions"]) == 10
+        # Totals, challenging topic, recent sessions and their problems
+        assert len(query_counter) <= 4, query_counter
+
+    def test_digest_window_uses_parent_email_index(self, test_db):
+        plan = test_db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT count(*) FROM hint_sessions "
+                "WHERE parent_email = :email AND started_at >= :start AND started_at <= :end"
+            ),
+            {"email": EMAIL, "start": "2024-01-01", "end": "2024-01-08"},
+        ).all()
+
+        details = " ".join(row[-1] for row in plan)
+        assert "ix_hint_sessions_parent_email_started_at" in details
@@ -7,12 +7,19 @@ from typing import Optional, Tuple
 from fastapi import HTTPException, status
 
 
+# Use with fullmatch(); canonical UUIDs are exactly UUID_LENGTH characters
+UUID_LENGTH = 36
 UUID_PATTERN = re.compile(
-    r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$", re.IGNORECASE
+    r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}",
+    re.IGNORECASE | re.ASCII,
 )
 
-# RFC 5322 compliant email regex (simplified)
-EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+# RFC 5322 compliant email regex (simplified); use with fullmatch().
+# Caps the whole address at 255 chars and the local part at 64.
+EMAIL_REGEX = re.compile(
+    r"(?=.{1,255}\Z)(?P<local>[a-zA-Z0-9._%+-]{1,64})@(?P<domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
+    re.ASCII,
+)
 
 
 def is_valid_uuid_v4(value: str) -> bool:
@@ -25,9 +32,10 @@ def is_valid_uuid_v4(value: str) -> bool:
     Returns:
         True if valid UUID v4, False otherwise
     """
-    if not value or not isinstance(value, str):
+    # Length check first rejects most malformed ids without touching the regex
+    if not isinstance(value, str) or len(value) != UUID_LENGTH:
         return False
-    return bool(UUID_PATTERN.match(value))
+    return UUID_PATTERN.fullmatch(value) is not None
 
 
 def validate_session_id(session_id: str) -> str:
@@ -74,26 +82,7 @@ def validate_email_format(email: str) -> bool:
     Returns:
         True if valid format, False otherwise
     """
-    if not email:
-        return False
-
-    if len(email) > 255:
-        return False
-
-    if email.count("@") != 1:
-        return False
-
-    if not EMAIL_REGEX.match(email):
-        return False
-
-    local, domain = email.split("@")
-    if len(local) > 64 or len(domain) > 255:
-        return False
-
-    if "." not in domain:
-        return False
-
-    return True
+    return bool(email) and EMAIL_REGEX.fullmatch(email) is not None
 
 
 def validate_email_with_error(email: Optional[str]) -> Tuple[bool, Optional[str]]:
@@ -106,6 +95,10 @@ def validate_email_with_error(email: Optional[str]) -> Tuple[bool, Optional[str]
     Returns:
         Tuple of (is_valid: bool, error_message: Optional[str])
     """
+    if email and EMAIL_REGEX.fullmatch(email):
+        return True, None
+
+    # Invalid: work out which rule failed
     if not email:
         return False, "Email address is required"
 
@@ -115,18 +108,8 @@ def validate_email_with_error(email: Optional[str]) -> Tuple[bool, Optional[str]
     if email.count("@") != 1:
         return False, "Email must contain exactly one @ symbol"
 
-    if not EMAIL_REGEX.match(email):
-        return False, "Invalid email format"
-
     local, domain = email.split("@")
-
-    if len(local) > 64:
+    if len(local) > 64 and EMAIL_REGEX.fullmatch(f"{local[:64]}@{domain}"):
         return False, "Local part of email too long (max 64 characters)"
 
-    if len(domain) > 255:
-        return False, "Domain part of email too long (max 255 characters)"
-
-    if "." not in domain:
-        return False, "Domain must contain at least one dot"
-
-    return True, None
+    return False, "Invalid email format"
@@ -92,6 +92,7 @@ export interface SessionListItem {
   used_full_solution: boolean
   started_at: string
   completed_at: string | null
+  duration_seconds: number | null
 }
 
 export interface SessionListResponse {
@@ -11,53 +11,70 @@ Usage:
 import argparse
 import csv
 from collections import Counter
+from collections.abc import Iterable, Sequence
 from datetime import datetime, timezone
 from pathlib import Path
 
+# analyze_codes 需要的列（顺序由 CSV 表头决定）
+REQUIRED_COLUMNS = ('status', 'used_by', 'expires_at')
 
-def load_codes_from_csv(csv_path: Path) -> list[dict]:
-    """从 CSV 文件加载邀请码"""
-    codes = []
 
-    if not csv_path.exists():
-        return codes
+def _parse_ts(value: str, _utc=timezone.utc) -> datetime:
+    """解析固定格式 '%Y-%m-%d %H:%M:%S' 的时间戳（按位置切片，比 strptime 快得多）"""
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        tzinfo=_utc,
+    )
+
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            codes.append(row)
+def analyze_codes_from_path(csv_path: Path) -> dict:
+    """从 CSV 文件流式统计邀请码（单次遍历，不把所有行读入内存）"""
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:  # 空文件
+            return analyze_codes((), REQUIRED_COLUMNS)
+        return analyze_codes(reader, header)
 
-    return codes
 
+def analyze_codes(rows: Iterable[Sequence[str]], header: Sequence[str]) -> dict:
+    """分析邀请码统计信息
 
-def analyze_codes(codes: list[dict]) -> dict:
-    """分析邀请码统计信息"""
+    rows 为 csv.reader 产出的行（列表），按 header 中的列位置取值，避免每行构造 dict。
+    """
     now = datetime.now(timezone.utc)
+    i_status, i_used_by, i_expires_at = (header.index(column) for column in REQUIRED_COLUMNS)
 
     stats = {
-        'total': len(codes),
+        'total': 0,
         'active': 0,
         'used': 0,
         'expired': 0,
         'valid': 0,
         'invalid': 0,
-        'users': []
+        'users': Counter(),  # used_by -> 使用次数
     }
 
-    for code in codes:
-        status = code['status']
+    for row in rows:
+        stats['total'] += 1
+        status = row[i_status]
 
         # 统计状态
         if status == 'active':
             stats['active'] += 1
         elif status == 'used':
             stats['used'] += 1
-            if code['used_by']:
-                stats['users'].append(code['used_by'])
+            used_by = row[i_used_by]
+            if used_by:
+                stats['users'][used_by] += 1
 
         # 检查过期
-        expires_at = datetime.strptime(code['expires_at'], '%Y-%m-%d %H:%M:%S')
-        expires_at = expires_at.replace(tzinfo=timezone.utc)
+        expires_at = _parse_ts(row[i_expires_at])
 
         if now > expires_at:
             stats['expired'] += 1
@@ -96,9 +113,8 @@ def main():
         print(f"❌ 文件不存在: {args.file}")
         return
 
-    # 加载数据
-    codes = load_codes_from_csv(args.file)
-    stats = analyze_codes(codes)
+    # 加载并统计数据
+    stats = analyze_codes_from_path(args.file)
 
     # 显示统计
     print("=" * 60)
@@ -106,9 +122,13 @@ def main():
     print("=" * 60)
     print()
 
-    print(f"📝 总数: {stats['total']}")
-    print(f"✅ 有效: {stats['valid']} ({stats['valid']/stats['total']*100:.1f}%)")
-    print(f"❌ 无效: {stats['invalid']} ({stats['invalid']/stats['total']*100:.1f}%)")
+    total = stats['total']
+    # 百分比换算系数；空文件时所有比例都按 0 显示
+    pct = 100 / total if total else 0.0
+
+    print(f"📝 总数: {total}")
+    print(f"✅ 有效: {stats['valid']} ({stats['valid'] * pct:.1f}%)")
+    print(f"❌ 无效: {stats['invalid']} ({stats['invalid'] * pct:.1f}%)")
     print()
 
     print("详细状态:")
@@ -118,7 +138,7 @@ def main():
     print()
 
     # 使用率
-    usage_rate = stats['used'] / stats['total'] * 100 if stats['total'] > 0 else 0
+    usage_rate = stats['used'] * pct
     print(f"📈 使用率: {usage_rate:.1f}%")
     print(f"📉 剩余可用: {stats['valid']}")
     print()
@@ -126,21 +146,21 @@ def main():
     # 用户列表
     if args.show_users and stats['users']:
         print("👥 使用者列表:")
-        user_counts = Counter(stats['users'])
-        for i, (user, count) in enumerate(user_counts.most_common(), 1):
+        for i, (user, count) in enumerate(stats['users'].most_common(), 1):
             print(f"  {i}. {user} ({count} 次)")
         print()
 
-    # 进度条
-    bar_length = 40
-    used_bar = int(bar_length * stats['used'] / stats['total'])
-    valid_bar = int(bar_length * stats['valid'] / stats['total'])
-    expired_bar = bar_length - used_bar - valid_bar
+    # 进度条（整数运算，结果与 int(bar_length * x / total) 相同）
+    if total:
+        bar_length = 40
+        used_bar = bar_length * stats['used'] // total
+        valid_bar = bar_length * stats['valid'] // total
+        expired_bar = bar_length - used_bar - valid_bar
 
-    print("进度:")
-    print(f"  [{'█' * used_bar}{'░' * valid_bar}{' ' * expired_bar}]")
-    print(f"  █ 已使用 {stats['used']}  ░ 可用 {stats['valid']}  ␣ 过期 {stats['expired']}")
-    print()
+        print("进度:")
+        print(f"  [{'█' * used_bar}{'░' * valid_bar}{' ' * expired_bar}]")
+        print(f"  █ 已使用 {stats['used']}  ░ 可用 {stats['valid']}  ␣ 过期 {stats['expired']}")
+        print()
     print("=" * 60)
 
 
@@ -9,11 +9,44 @@ Usage:
 
 import argparse
 import csv
+import itertools
 import secrets
 import string
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# 使用大写字母和数字，排除易混淆的字符（0,O,1,I,L），共 31 个字符
+ALPHABET = string.ascii_uppercase.replace('O', '').replace('I', '').replace('L', '') + '23456789'
+
+# 随机字节 -> 字符的映射表；末尾 256 % 31 个字节值会导致取模偏差，直接丢弃
+_BYTE_TO_CHAR = bytes(ord(ALPHABET[b % len(ALPHABET)]) for b in range(256))
+_BIASED_BYTES = bytes(range(256 - 256 % len(ALPHABET), 256))
+
+# CSV 列顺序，generate_batch 产出的每行元组与之一一对应
+FIELDNAMES = ('code', 'created_at', 'expires_at', 'status', 'used_by', 'used_at', 'notes')
+
+
+def _random_chars(total: int) -> str:
+    """生成 total 个随机字符，随机字节整批取出后在 C 层一次映射"""
+    random_bytes = b''
+    while len(random_bytes) < total:
+        # 约 3% 的字节会被丢弃，多取 1/8 作为余量
+        random_bytes += secrets.token_bytes(total + total // 8 + 8).translate(
+            _BYTE_TO_CHAR, _BIASED_BYTES
+        )
+    return random_bytes[:total].decode('ascii')
+
+
+def _format_code(random_part: str, prefix: str) -> str:
+    """每 4 个字符插入一个连字符，并加上前缀"""
+    # 默认长度 8 直接拼接，省去切片列表和 join
+    if len(random_part) == 8:
+        return f"{prefix}-{random_part[:4]}-{random_part[4:]}"
+
+    formatted = '-'.join([random_part[i:i+4] for i in range(0, len(random_part), 4)])
+    return f"{prefix}-{formatted}"
+
 
 def generate_code(length: int = 8, prefix: str = "MATH") -> str:
     """
@@ -26,17 +59,10 @@ def generate_code(length: int = 8, prefix: str = "MATH") -> str:
     Returns:
         格式化的邀请码，如 "MATH-AB12CD34"
     """
-    # 使用大写字母和数字，排除易混淆的字符（0,O,1,I,L）
-    alphabet = string.ascii_uppercase.replace('O', '').replace('I', '').replace('L', '') + '23456789'
-    random_part = ''.join(secrets.choice(alphabet) for _ in range(length))
+    return _format_code(_random_chars(length), prefix)
 
-    # 每 4 个字符插入一个连字符
-    formatted = '-'.join([random_part[i:i+4] for i in range(0, len(random_part), 4)])
-
-    return f"{prefix}-{formatted}"
 
-
-def generate_batch(count: int, prefix: str = "MATH", length: int = 8) -> list[dict]:
+def generate_batch(count: int, prefix: str = "MATH", length: int = 8) -> Iterator[tuple[str, ...]]:
     """
     批量生成邀请码
 
@@ -45,49 +71,44 @@ def generate_batch(count: int, prefix: str = "MATH", length: int = 8) -> list[di
         prefix: 邀请码前缀
         length: 随机部分长度
 
-    Returns:
-        邀请码列表，每个包含 code, created_at, expires_at, status, used_by, used_at
+    Yields:
+        逐个生成邀请码记录，按 FIELDNAMES 顺序排列的元组
     """
-    codes = set()
-    result = []
-
-    # 生成唯一邀请码
+    # 整批随机字符一次生成后按 length 切分，dict 按生成顺序去重；仅在出现碰撞时补足
+    chars = _random_chars(count * length)
+    codes = dict.fromkeys(
+        _format_code(chars[i:i + length], prefix) for i in range(0, len(chars), length)
+    )
     while len(codes) < count:
-        code = generate_code(length=length, prefix=prefix)
-        if code not in codes:
-            codes.add(code)
+        codes[generate_code(length=length, prefix=prefix)] = None
 
     # 添加元数据
     from datetime import timezone
     now = datetime.now(timezone.utc)
     expires_at = now + timedelta(days=90)  # 90 天有效期
+    created_at_str = now.strftime('%Y-%m-%d %H:%M:%S')
+    expires_at_str = expires_at.strftime('%Y-%m-%d %H:%M:%S')
 
     for code in codes:
-        result.append({
-            'code': code,
-            'created_at': now.strftime('%Y-%m-%d %H:%M:%S'),
-            'expires_at': expires_at.strftime('%Y-%m-%d %H:%M:%S'),
-            'status': 'active',
-            'used_by': '',
-            'used_at': '',
-            'notes': ''
-        })
-
-    return result
+        yield (code, created_at_str, expires_at_str, 'active', '', '', '')
 
 
-def save_to_csv(codes: list[dict], output_path: Path):
-    """保存到 CSV 文件"""
-    fieldnames = ['code', 'created_at', 'expires_at', 'status', 'used_by', 'used_at', 'notes']
+def save_to_csv(codes: Iterable[tuple[str, ...]], output_path: Path) -> int:
+    """边生成边写入 CSV 文件，返回写入的邀请码数量"""
+    total = 0
+    # 1 MiB 写缓冲，减少大批量写入时的系统调用
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        for code in codes:
+            writer.writerow(code)
+            total += 1
 
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(codes)
-
-    print(f"✅ 成功生成 {len(codes)} 个邀请码")
+    print(f"✅ 成功生成 {total} 个邀请码")
     print(f"📁 保存到: {output_path.absolute()}")
 
+    return total
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -148,24 +169,25 @@ def main():
     print(f"📏 随机长度: {args.length}")
     print()
 
-    # 生成邀请码
+    # 生成邀请码（惰性生成，写入 CSV 时逐行产出）
     codes = generate_batch(
         count=args.count,
         prefix=args.prefix,
         length=args.length
     )
+    samples = list(itertools.islice(codes, 5))
 
     # 保存
-    save_to_csv(codes, args.output)
+    total = save_to_csv(itertools.chain(samples, codes), args.output)
 
     # 显示示例
     print()
     print("📋 示例邀请码（前 5 个）:")
-    for i, code in enumerate(codes[:5], 1):
-        print(f"  {i}. {code['code']}")
+    for i, code in enumerate(samples, 1):
+        print(f"  {i}. {code[0]}")
 
-    if len(codes) > 5:
-        print(f"  ... 还有 {len(codes) - 5} 个")
+    if total > 5:
+        print(f"  ... 还有 {total - 5} 个")
 
     print()
     print("💡 提示:")
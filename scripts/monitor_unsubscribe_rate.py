@@ -13,6 +13,7 @@ Options:
     --days N             Number of days to analyze (default: 7)
     --threshold PERCENT  Alert threshold percentage (default: 2.0)
     --output FORMAT      Output format: text|json|github (default: text)
+    --stop-when-critical Stop fetching once the running unsubscribe rate is critical
 
 Environment Variables:
     SENDGRID_API_KEY        SendGrid API key for fetching events
@@ -25,13 +26,24 @@ References:
 """
 
 import argparse
+import itertools
 import json
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional: parse event pages straight off the socket instead of buffering the body
+    import ijson
+except ImportError:
+    ijson = None
 
 
 # Industry standard thresholds (per Mailchimp/Litmus)
@@ -39,10 +51,73 @@ UNSUBSCRIBE_RATE_WARNING = 2.0  # 2% - Warning threshold
 UNSUBSCRIBE_RATE_CRITICAL = 5.0  # 5% - Critical threshold
 SPAM_COMPLAINT_RATE_WARNING = 0.1  # 0.1% - Warning threshold
 
+# Opt-in early exit (--stop-when-critical): re-check the running unsubscribe rate every
+# N events, and stop once it is critical over a statistically meaningful number of deliveries
+EARLY_EXIT_CHECK_INTERVAL = 10_000
+EARLY_EXIT_MIN_DELIVERED = 1000
+
+SECONDS_PER_DAY = 86400
+
+STATUS_EMOJI = {
+    "HEALTHY": "✅",
+    "WARNING": "⚠️",
+    "CRITICAL": "❌",
+    "NO_DATA": "ℹ️",
+}
+
+# Report headers, filled in with format_map(_template_fields(...))
+_TEXT_TEMPLATE = """
+{emoji} SendGrid Email Metrics ({days} days)
+
+Status: {status}
+
+📊 Delivery Metrics:
+  Total Delivered: {total_delivered:,}
+  Bounced: {bounce_count:,} ({bounce_rate}%)
+  Dropped: {dropped_count:,}
+  Deferred: {deferred_count:,}
+
+📧 Engagement Metrics:
+  Unsubscribes: {unsubscribe_count:,} ({unsubscribe_rate}%)
+  Spam Complaints: {spam_complaint_count:,} ({spam_complaint_rate}%)
+
+🎯 Thresholds:
+  Unsubscribe Rate Warning: {unsubscribe_rate_warning}%
+  Unsubscribe Rate Critical: {unsubscribe_rate_critical}%
+  Spam Complaint Warning: {spam_complaint_rate_warning}%
+
+"""
+
+_GITHUB_TEMPLATE = """
+## {emoji} SendGrid Email Metrics ({days} days)
+
+**Status**: {status}
+
+### 📊 Delivery Metrics
+
+| Metric | Count | Rate |
+|--------|-------|------|
+| Total Delivered | {total_delivered:,} | - |
+| Bounced | {bounce_count:,} | {bounce_rate}% |
+| Dropped | {dropped_count:,} | - |
+| Deferred | {deferred_count:,} | - |
+
+### 📧 Engagement Metrics
+
+| Metric | Count | Rate | Threshold |
+|--------|-------|------|-----------|
+| Unsubscribes | {unsubscribe_count:,} | {unsubscribe_rate}% | {unsubscribe_rate_warning}% (warning) |
+| Spam Complaints | {spam_complaint_count:,} | {spam_complaint_rate}% | {spam_complaint_rate_warning}% (warning) |
+
+"""
+
 
 class SendGridEventMonitor:
     """Monitor SendGrid events and calculate unsubscribe rates."""
 
+    PAGE_SIZE = 1000  # Max per request
+    MAX_CONCURRENT_PAGES = 8  # Also the max number of time windows fetched in parallel
+
     def __init__(self, api_key: str):
         """
         Initialize SendGrid event monitor.
@@ -53,96 +128,172 @@ class SendGridEventMonitor:
         self.api_key = api_key
         self.base_url = "https://api.sendgrid.com/v3"
 
-    def fetch_events(self, days: int = 7, event_types: Optional[List[str]] = None) -> List[Dict]:
+        # Shared keep-alive session for all page fetchers; back off on rate limits
+        # and transient server errors (GETs are safe to repeat)
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(max_retries=retry, pool_maxsize=self.MAX_CONCURRENT_PAGES),
+        )
+        self.session.headers.update(
+            {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+        )
+
+    def iter_events(self, days: int = 7, event_types: Optional[List[str]] = None) -> Iterator[Dict]:
         """
-        Fetch events from SendGrid Event API.
+        Stream events from SendGrid Event API, one page at a time.
 
         Args:
             days: Number of days to fetch events for
             event_types: List of event types to fetch (default: all)
 
-        Returns:
-            List of event dictionaries
+        Yields:
+            Event dictionaries, interleaved page by page across time windows
         """
-        # Calculate date range
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=days)
-
-        # Build query parameters
+        # Build query parameters (Unix seconds)
+        now = int(time.time())
         params = {
-            "start_time": int(start_date.timestamp()),
-            "end_time": int(end_date.timestamp()),
-            "limit": 1000,  # Max per request
+            "start_time": now - days * SECONDS_PER_DAY,
+            "end_time": now,
+            "limit": self.PAGE_SIZE,
         }
 
         if event_types:
             params["event"] = ",".join(event_types)  # type: ignore
 
-        # Fetch events
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        fetched = 0
+        for events in self._iter_pages(params):
+            fetched += len(events)
+            yield from events
 
-        all_events = []
-        offset = 0
+        print(f"Fetched {fetched} events", file=sys.stderr)
 
-        while True:
-            params["offset"] = offset
-
-            response = requests.get(
-                f"{self.base_url}/messages",
-                headers=headers,
-                params=params,
-                timeout=30,
-            )
+    def _iter_pages(self, params: Dict) -> Iterator[List[Dict]]:
+        """
+        Yield pages of events until every time window is exhausted or a request fails.
 
-            if response.status_code != 200:
-                print(
-                    f"Error fetching events: {response.status_code} {response.text}",
-                    file=sys.stderr,
-                )
-                break
+        The [start_time, end_time] range is split into up to MAX_CONCURRENT_PAGES
+        sub-windows of at least a day each. Each round fetches the next page of
+        every unfinished window in parallel, so offsets stay small.
 
-            data = response.json()
-            events = data.get("messages", [])
+        Args:
+            params: Shared query parameters (not modified)
+        """
+        days = (params["end_time"] - params["start_time"]) // SECONDS_PER_DAY
+        windows = self._split_window(
+            params["start_time"],
+            params["end_time"],
+            max(1, min(days, self.MAX_CONCURRENT_PAGES)),
+        )
+        # Next offset to fetch in each window that still has events
+        offsets = {window: 0 for window in windows}
+
+        def fetch(window: Tuple[int, int], offset: int) -> Optional[List[Dict]]:
+            window_params = {**params, "start_time": window[0], "end_time": window[1]}
+            return self._fetch_page(window_params, offset)
+
+        with ThreadPoolExecutor(max_workers=len(windows)) as executor:
+            while offsets:
+                pending = list(offsets.items())
+                pages = executor.map(fetch, *zip(*pending))
+
+                for (window, offset), events in zip(pending, pages):
+                    if events is None:
+                        return
+
+                    yield events
+
+                    # Check if we've fetched all events in this window
+                    if len(events) < self.PAGE_SIZE:
+                        del offsets[window]
+                    else:
+                        offsets[window] = offset + len(events)
+
+    @staticmethod
+    def _split_window(start: int, end: int, count: int) -> List[Tuple[int, int]]:
+        """Split [start, end] into `count` adjacent, non-overlapping inclusive ranges."""
+        bounds = [start + (end - start) * i // count for i in range(count + 1)]
+        return [
+            (lower if i == 0 else lower + 1, upper)
+            for i, (lower, upper) in enumerate(zip(bounds, bounds[1:]))
+        ]
+
+    def _fetch_page(self, params: Dict, offset: int) -> Optional[List[Dict]]:
+        """
+        Fetch one page of events.
 
-            if not events:
-                break
+        Args:
+            params: Shared query parameters (not modified)
+            offset: Offset of the first event on the page
 
-            all_events.extend(events)
-            offset += len(events)
+        Returns:
+            Events on the page, or None if the request failed
+        """
+        response = self.session.get(
+            f"{self.base_url}/messages",
+            params={**params, "offset": offset},
+            timeout=30,
+            stream=ijson is not None,
+        )
+
+        if response.status_code != 200:
+            print(
+                f"Error fetching events: {response.status_code} {response.text}",
+                file=sys.stderr,
+            )
+            return None
 
-            # Check if we've fetched all events
-            if len(events) < 1000:
-                break
+        if ijson is None:
+            return response.json().get("messages", [])
 
-        return all_events
+        with response:
+            response.raw.decode_content = True  # Undo gzip/deflate transfer encoding
+            return list(ijson.items(response.raw, "messages.item", use_float=True))
 
-    def calculate_metrics(self, events: List[Dict]) -> Dict:
+    def calculate_metrics(self, events: Iterable[Dict], stop_when_critical: bool = False) -> Dict:
         """
-        Calculate email metrics from events.
+        Calculate email metrics from events in a single pass.
 
         Args:
-            events: List of SendGrid event dictionaries
+            events: SendGrid event dictionaries; may be a stream from iter_events
+            stop_when_critical: Stop consuming events as soon as the running
+                unsubscribe rate is critical (see EARLY_EXIT_CHECK_INTERVAL).
+                The metrics then cover only the events seen and carry
+                "partial": True. A running rate can still fall once later
+                events arrive, so the verdict is provisional.
 
         Returns:
             Dictionary with calculated metrics
         """
-        # Count events by type
-        event_counts = {
-            "delivered": 0,
-            "unsubscribe": 0,
-            "spamreport": 0,
-            "bounce": 0,
-            "dropped": 0,
-            "deferred": 0,
-        }
-
-        for event in events:
-            event_type = event.get("event", "").lower()
-            if event_type in event_counts:
-                event_counts[event_type] += 1
+        # Count events by type; Counter returns 0 for types that never occurred
+        event_types = (event.get("event", "").lower() for event in events)
+        partial = False
+
+        if stop_when_critical:
+            event_counts: Counter = Counter()
+            for chunk in iter(
+                lambda: list(itertools.islice(event_types, EARLY_EXIT_CHECK_INTERVAL)), []
+            ):
+                event_counts.update(chunk)
+                delivered = event_counts["delivered"]
+                if (
+                    delivered >= EARLY_EXIT_MIN_DELIVERED
+                    and event_counts["unsubscribe"] / delivered * 100 >= UNSUBSCRIBE_RATE_CRITICAL
+                ):
+                    partial = True
+                    break
+        else:
+            event_counts = Counter(event_types)
 
         # Calculate rates
         total_delivered = event_counts["delivered"]
@@ -172,7 +323,7 @@ class SendGridEventMonitor:
         elif spam_complaint_rate >= SPAM_COMPLAINT_RATE_WARNING:
             status = "WARNING"
 
-        return {
+        metrics = {
             "total_delivered": total_delivered,
             "unsubscribe_count": event_counts["unsubscribe"],
             "unsubscribe_rate": round(unsubscribe_rate, 2),
@@ -185,6 +336,23 @@ class SendGridEventMonitor:
             "status": status,
         }
 
+        if partial:
+            metrics["partial"] = True
+
+        return metrics
+
+
+def _template_fields(metrics: Dict, days: int) -> Dict:
+    """Collect the values referenced by the report templates."""
+    return {
+        **metrics,
+        "emoji": STATUS_EMOJI.get(metrics["status"], "❓"),
+        "days": days,
+        "unsubscribe_rate_warning": UNSUBSCRIBE_RATE_WARNING,
+        "unsubscribe_rate_critical": UNSUBSCRIBE_RATE_CRITICAL,
+        "spam_complaint_rate_warning": SPAM_COMPLAINT_RATE_WARNING,
+    }
+
 
 def format_text_output(metrics: Dict, days: int) -> str:
     """
@@ -197,36 +365,7 @@ def format_text_output(metrics: Dict, days: int) -> str:
     Returns:
         Formatted text output
     """
-    status_emoji = {
-        "HEALTHY": "✅",
-        "WARNING": "⚠️",
-        "CRITICAL": "❌",
-        "NO_DATA": "ℹ️",
-    }
-
-    emoji = status_emoji.get(metrics["status"], "❓")
-
-    output = f"""
-{emoji} SendGrid Email Metrics ({days} days)
-
-Status: {metrics["status"]}
-
-📊 Delivery Metrics:
-  Total Delivered: {metrics["total_delivered"]:,}
-  Bounced: {metrics["bounce_count"]:,} ({metrics["bounce_rate"]}%)
-  Dropped: {metrics["dropped_count"]:,}
-  Deferred: {metrics["deferred_count"]:,}
-
-📧 Engagement Metrics:
-  Unsubscribes: {metrics["unsubscribe_count"]:,} ({metrics["unsubscribe_rate"]}%)
-  Spam Complaints: {metrics["spam_complaint_count"]:,} ({metrics["spam_complaint_rate"]}%)
-
-🎯 Thresholds:
-  Unsubscribe Rate Warning: {UNSUBSCRIBE_RATE_WARNING}%
-  Unsubscribe Rate Critical: {UNSUBSCRIBE_RATE_CRITICAL}%
-  Spam Complaint Warning: {SPAM_COMPLAINT_RATE_WARNING}%
-
-"""
+    output = _TEXT_TEMPLATE.format_map(_template_fields(metrics, days))
 
     # Add warnings/recommendations
     if metrics["status"] == "CRITICAL":
@@ -293,36 +432,11 @@ def format_github_output(metrics: Dict, days: int) -> str:
     Returns:
         Markdown formatted output for GitHub
     """
-    status_emoji = {
-        "HEALTHY": "✅",
-        "WARNING": "⚠️",
-        "CRITICAL": "❌",
-        "NO_DATA": "ℹ️",
-    }
-
-    emoji = status_emoji.get(metrics["status"], "❓")
-
-    output = f"""
-## {emoji} SendGrid Email Metrics ({days} days)
-
-**Status**: {metrics["status"]}
-
-### 📊 Delivery Metrics
-
-| Metric | Count | Rate |
-|--------|-------|------|
-| Total Delivered | {metrics["total_delivered"]:,} | - |
-| Bounced | {metrics["bounce_count"]:,} | {metrics["bounce_rate"]}% |
-| Dropped | {metrics["dropped_count"]:,} | - |
-| Deferred | {metrics["deferred_count"]:,} | - |
-
-### 📧 Engagement Metrics
-
-| Metric | Count | Rate | Threshold |
-|--------|-------|------|-----------|
-| Unsubscribes | {metrics["unsubscribe_count"]:,} | {metrics["unsubscribe_rate"]}% | {UNSUBSCRIBE_RATE_WARNING}% (warning) |
-| Spam Complaints | {metrics["spam_complaint_count"]:,} | {metrics["spam_complaint_rate"]}% | {SPAM_COMPLAINT_RATE_WARNING}% (warning) |
+    output = _GITHUB_TEMPLATE.format_map(_template_fields(metrics, days))
 
+    if metrics.get("partial"):
+        output += """
+> Counting stopped early once the unsubscribe rate was critical; counts cover only the events fetched so far.
 """
 
     # Add status-specific recommendations
@@ -383,6 +497,12 @@ def main():
         default="text",
         help="Output format (default: text)",
     )
+    parser.add_argument(
+        "--stop-when-critical",
+        action="store_true",
+        help="Stop fetching once the running unsubscribe rate is critical "
+        "(faster, but the verdict covers only the events fetched so far)",
+    )
 
     args = parser.parse_args()
 
@@ -395,13 +515,12 @@ def main():
     # Initialize monitor
     monitor = SendGridEventMonitor(api_key)
 
-    # Fetch events
+    # Fetch events and calculate metrics as pages arrive
     print(f"Fetching SendGrid events for last {args.days} days...", file=sys.stderr)
-    events = monitor.fetch_events(days=args.days)
-    print(f"Fetched {len(events)} events", file=sys.stderr)
-
-    # Calculate metrics
-    metrics = monitor.calculate_metrics(events)
+    metrics = monitor.calculate_metrics(
+        monitor.iter_events(days=args.days),
+        stop_when_critical=args.stop_when_critical,
+    )
 
     # Format output
     if args.output == "json":
@@ -16,6 +16,7 @@ from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 
 from backend.database.engine import SessionLocal
+from backend.models.base import generate_uuid
 from backend.models.problem import Problem
 from backend.models.session import HintSession
 from backend.models.response import StudentResponse
@@ -29,6 +30,9 @@ def seed_demo_data(db: Session) -> None:
 
     print("🌱 Seeding demo data...")
 
+    # IDs are assigned up front so child rows can reference their parents
+    # without a flush, and every table is written with one bulk INSERT.
+
     # Create demo problems
     problems = [
         Problem(
@@ -57,15 +61,17 @@ def seed_demo_data(db: Session) -> None:
             grade_level=6,
         ),
     ]
-
     for problem in problems:
-        db.add(problem)
+        problem.id = generate_uuid()
 
+    db.bulk_save_objects(problems)
     db.commit()
     print(f"✅ Created {len(problems)} demo problems")
 
     # Create demo hint sessions
     sessions = []
+    hint_contents = []
+    responses = []
     parent_emails = [
         "parent1@example.com",
         "parent2@example.com",
@@ -75,13 +81,13 @@ def seed_demo_data(db: Session) -> None:
     for i, problem in enumerate(problems[:3]):
         # Create completed session
         session = HintSession(
+            id=generate_uuid(),
             problem_id=problem.id,
             current_layer=HintLayer.COMPLETED,
             confusion_count=0,
             parent_email=parent_emails[i % len(parent_emails)],
         )
-        db.add(session)
-        db.flush()  # Get the ID
+        sessions.append(session)
 
         # Add hint contents
         hint_concept = HintContent(
@@ -90,15 +96,13 @@ def seed_demo_data(db: Session) -> None:
             content=f"This is a {problem.problem_type.value} problem. Think about what mathematical concept applies here.",
             is_downgrade=False,
         )
-        db.add(hint_concept)
-
         hint_strategy = HintContent(
             session_id=session.id,
             layer=HintLayer.STRATEGY,
             content="Let's break this down step by step. What should we do first?",
             is_downgrade=False,
         )
-        db.add(hint_strategy)
+        hint_contents.extend([hint_concept, hint_strategy])
 
         # Add student responses
         response1 = StudentResponse(
@@ -108,8 +112,6 @@ def seed_demo_data(db: Session) -> None:
             understanding_level=UnderstandingLevel.UNDERSTOOD,
             keywords_matched=["equation", "solving"],
         )
-        db.add(response1)
-
         response2 = StudentResponse(
             session_id=session.id,
             layer=HintLayer.STRATEGY,
@@ -117,10 +119,11 @@ def seed_demo_data(db: Session) -> None:
             understanding_level=UnderstandingLevel.UNDERSTOOD,
             keywords_matched=["isolate", "variable"],
         )
-        db.add(response2)
-
-        sessions.append(session)
+        responses.extend([response1, response2])
 
+    db.bulk_save_objects(sessions)
+    db.bulk_save_objects(hint_contents)
+    db.bulk_save_objects(responses)
     db.commit()
     print(f"✅ Created {len(sessions)} demo hint sessions with responses")
 
@@ -155,9 +158,7 @@ def seed_demo_data(db: Session) -> None:
         ),
     ]
 
-    for feedback in feedback_items:
-        db.add(feedback)
-
+    db.bulk_save_objects(feedback_items)
     db.commit()
     print(f"✅ Created {len(feedback_items)} demo feedback items")
 
@@ -10,26 +10,64 @@ Usage:
 
 import argparse
 import csv
+import operator
 import sys
+from collections import namedtuple
 from datetime import datetime, timezone
 from pathlib import Path
 
+# 所有时间均为 UTC，统一使用内置的 tzinfo 单例
+UTC = timezone.utc
+
+FIELDNAMES = ('code', 'created_at', 'expires_at', 'status', 'used_by', 'used_at', 'notes')
+
+# 每行一个轻量元组，按属性访问，避免 DictReader 每行一个 dict
+BetaCode = namedtuple('BetaCode', FIELDNAMES)
+
 
 def load_codes_from_csv(csv_path: Path) -> dict:
-    """从 CSV 文件加载邀请码"""
+    """从 CSV 文件加载邀请码，返回 {code: BetaCode}"""
     codes = {}
 
     if not csv_path.exists():
         return codes
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    # 1 MiB 读缓冲，减少大文件的 read 系统调用
+    with open(csv_path, 'r', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return codes
+
+        # 按表头定位各列，兼容列顺序不同的文件
+        columns = operator.itemgetter(*(header.index(name) for name in FIELDNAMES))
         for row in reader:
-            codes[row['code']] = row
+            entry = BetaCode._make(columns(row))
+            codes[entry.code] = entry
 
     return codes
 
 
+def find_code_in_csv(csv_path: Path, target_code: str) -> BetaCode | None:
+    """逐行扫描 CSV，找到目标邀请码即停止，不构建整个邀请码库"""
+    if not csv_path.exists():
+        return None
+
+    with open(csv_path, 'r', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return None
+
+        code_col = header.index('code')
+        for row in reader:
+            if row[code_col] == target_code:
+                columns = operator.itemgetter(*(header.index(name) for name in FIELDNAMES))
+                return BetaCode._make(columns(row))
+
+    return None
+
+
 def verify_code(code: str, codes: dict) -> dict:
     """
     验证邀请码
@@ -38,7 +76,7 @@ def verify_code(code: str, codes: dict) -> dict:
         {
             'valid': bool,
             'reason': str,
-            'details': dict
+            'details': BetaCode | None
         }
     """
     # 检查是否存在
@@ -52,30 +90,30 @@ def verify_code(code: str, codes: dict) -> dict:
     code_data = codes[code]
 
     # 检查状态
-    if code_data['status'] != 'active':
+    if code_data.status != 'active':
         return {
             'valid': False,
-            'reason': f"Code status is '{code_data['status']}'",
+            'reason': f"Code status is '{code_data.status}'",
             'details': code_data
         }
 
     # 检查是否已使用
-    if code_data['used_by']:
+    if code_data.used_by:
         return {
             'valid': False,
-            'reason': f"Code already used by '{code_data['used_by']}' at {code_data['used_at']}",
+            'reason': f"Code already used by '{code_data.used_by}' at {code_data.used_at}",
             'details': code_data
         }
 
     # 检查有效期
-    expires_at = datetime.strptime(code_data['expires_at'], '%Y-%m-%d %H:%M:%S')
-    expires_at = expires_at.replace(tzinfo=timezone.utc)
-    now = datetime.now(timezone.utc)
+    # fromisoformat 是 C 实现的快速路径，可直接解析 'YYYY-MM-DD HH:MM:SS'
+    expires_at = datetime.fromisoformat(code_data.expires_at).replace(tzinfo=UTC)
+    now = datetime.now(UTC)
 
     if now > expires_at:
         return {
             'valid': False,
-            'reason': f"Code expired at {code_data['expires_at']}",
+            'reason': f"Code expired at {code_data.expires_at}",
             'details': code_data
         }
 
@@ -88,24 +126,26 @@ def verify_code(code: str, codes: dict) -> dict:
     }
 
 
-def mark_as_used(csv_path: Path, code: str, used_by: str):
-    """标记邀请码为已使用"""
-    codes = load_codes_from_csv(csv_path)
+def mark_as_used(csv_path: Path, code: str, used_by: str, codes: dict | None = None):
+    """标记邀请码为已使用；传入已加载的 codes 可避免再次解析 CSV"""
+    if codes is None:
+        codes = load_codes_from_csv(csv_path)
 
     if code not in codes:
         print(f"❌ 邀请码不存在: {code}")
         return False
 
     # 更新状态
-    codes[code]['status'] = 'used'
-    codes[code]['used_by'] = used_by
-    codes[code]['used_at'] = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-
-    # 写回文件
-    fieldnames = ['code', 'created_at', 'expires_at', 'status', 'used_by', 'used_at', 'notes']
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    codes[code] = codes[code]._replace(
+        status='used',
+        used_by=used_by,
+        used_at=datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S'),
+    )
+
+    # 写回文件（1 MiB 写缓冲）
+    with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
         writer.writerows(codes.values())
 
     print(f"✅ 邀请码已标记为使用: {code}")
@@ -173,9 +213,15 @@ def main():
         sys.exit(1)
 
     # 加载邀请码
-    print(f"📁 加载邀请码库: {args.file}")
-    codes = load_codes_from_csv(args.file)
-    print(f"📊 总数: {len(codes)} 个邀请码")
+    print(f"📁 邀请码库: {args.file}")
+    if args.mark_used:
+        # 标记使用需要写回整个文件，加载完整邀请码库
+        codes = load_codes_from_csv(args.file)
+        print(f"📊 总数: {len(codes)} 个邀请码")
+    else:
+        # 只验证一个邀请码：扫描到即停止
+        entry = find_code_in_csv(args.file, code)
+        codes = {code: entry} if entry else {}
     print()
 
     # 验证
@@ -186,18 +232,18 @@ def main():
     if result['valid']:
         print(f"✅ 有效: {result['reason']}")
         if result['details']:
-            print(f"   创建时间: {result['details']['created_at']}")
-            print(f"   过期时间: {result['details']['expires_at']}")
-            print(f"   状态: {result['details']['status']}")
+            print(f"   创建时间: {result['details'].created_at}")
+            print(f"   过期时间: {result['details'].expires_at}")
+            print(f"   状态: {result['details'].status}")
     else:
         print(f"❌ 无效: {result['reason']}")
         if result['details']:
-            print(f"   创建时间: {result['details']['created_at']}")
-            print(f"   过期时间: {result['details']['expires_at']}")
-            print(f"   状态: {result['details']['status']}")
-            if result['details']['used_by']:
-                print(f"   使用者: {result['details']['used_by']}")
-                print(f"   使用时间: {result['details']['used_at']}")
+            print(f"   创建时间: {result['details'].created_at}")
+            print(f"   过期时间: {result['details'].expires_at}")
+            print(f"   状态: {result['details'].status}")
+            if result['details'].used_by:
+                print(f"   使用者: {result['details'].used_by}")
+                print(f"   使用时间: {result['details'].used_at}")
 
     # 标记为已使用
     if args.mark_used:
@@ -209,7 +255,7 @@ def main():
         if not args.user:
             parser.error("--mark-used 需要提供 --user 参数")
 
-        mark_as_used(args.file, code, args.user)
+        mark_as_used(args.file, code, args.user, codes)
 
     sys.exit(0 if result['valid'] else 1)
 